@@ -50,6 +50,7 @@ from .tools.smart_insert import (
     insert_after_heading as insert_after_heading_fs,
     insert_after_block as insert_after_block_fs,
     update_frontmatter_field as update_frontmatter_field_fs,
+    update_frontmatter_fields as update_frontmatter_fields_fs,
     append_to_note as append_to_note_fs,
 )
 
@@ -1390,6 +1391,71 @@ async def update_frontmatter_field_fs_tool(
         raise create_error(f"Failed to update frontmatter: {str(e)}")
 
 
+@mcp.tool()
+async def update_frontmatter_fields_fs_tool(
+    filepath: Annotated[str, Field(
+        description="Path to note (relative to vault or absolute)",
+        min_length=1,
+        examples=["Projects/Active.md"]
+    )],
+    updates: Annotated[Optional[Dict[str, str | int | float | bool | List[str]]], Field(
+        description="Fields to update/add in frontmatter (field name -> value)",
+        default=None,
+        examples=[{"status": "published", "priority": 2}]
+    )] = None,
+    tags_add: Annotated[Optional[List[str]], Field(
+        description="Tags to add to frontmatter (without # symbol)",
+        default=None,
+        examples=[["project", "status/active"]]
+    )] = None,
+    tags_remove: Annotated[Optional[List[str]], Field(
+        description="Tags to remove from frontmatter (without # symbol)",
+        default=None,
+        examples=[["draft"]]
+    )] = None,
+    vault_path: Annotated[Optional[str], Field(
+        description="Path to vault root (optional, uses OBSIDIAN_VAULT_PATH env if not provided)",
+        default=None
+    )] = None,
+    ctx=None
+):
+    """
+    Apply several frontmatter changes (fields and tags) in one operation.
+
+    Field updates are applied first, then tag removals, then tag additions.
+    The note is read and written only once, so this is cheaper than chaining
+    update_frontmatter_field_fs_tool, add_tag_fs_tool and remove_tag_fs_tool.
+
+    When to use:
+    - Changing status and tags together (e.g. mark done + add "archived")
+    - Bulk metadata updates from automation
+
+    Performance:
+    - Any note size: < 200ms
+
+    Returns:
+        Updated field names, tags actually added/removed and the resulting tags
+    """
+    try:
+        # Resolve filepath
+        vault = vault_path or os.getenv("OBSIDIAN_VAULT_PATH")
+        if not vault:
+            raise create_error("OBSIDIAN_VAULT_PATH environment variable not set and vault_path not provided")
+
+        # Resolve absolute path
+        if not os.path.isabs(filepath):
+            filepath = os.path.join(vault, filepath)
+
+        return update_frontmatter_fields_fs(filepath, updates, tags_add, tags_remove)
+
+    except FileNotFoundError as e:
+        raise create_error(str(e))
+    except (httpx.HTTPStatusError, httpx.ConnectError, httpx.TimeoutException, ConnectionError) as e:
+        raise handle_api_error(e)
+    except Exception as e:
+        raise create_error(f"Failed to update frontmatter: {str(e)}")
+
+
 @mcp.tool()
 async def append_to_note_fs_tool(
     filepath: Annotated[str, Field(
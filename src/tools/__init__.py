@@ -1,55 +1,47 @@
-"""Tool modules for Obsidian MCP server."""
+"""Tool modules for Obsidian MCP server.
 
-from .note_management import (
-    read_note,
-    create_note,
-    update_note,
-    delete_note,
-)
-from .search_discovery import (
-    search_notes,
-    search_by_date,
-    list_notes,
-    list_folders,
-)
-from .organization import (
-    move_note,
-    create_folder,
-    move_folder,
-    add_tags,
-    update_tags,
-    remove_tags,
-    get_note_info,
-    list_tags,
-)
-from .link_management import (
-    get_backlinks,
-    get_outgoing_links,
-    find_broken_links,
-)
+The API-backed tools re-exported here are imported on first access, so
+importing one filesystem tool module (e.g. src.tools.links) doesn't pull in
+fastmcp and the HTTP client.
+"""
 
-__all__ = [
+import importlib
+
+# Re-exported name -> defining submodule
+_EXPORTS = {
     # Note management
-    "read_note",
-    "create_note", 
-    "update_note",
-    "delete_note",
+    "read_note": "note_management",
+    "create_note": "note_management",
+    "update_note": "note_management",
+    "delete_note": "note_management",
     # Search and discovery
-    "search_notes",
-    "search_by_date",
-    "list_notes",
-    "list_folders",
+    "search_notes": "search_discovery",
+    "search_by_date": "search_discovery",
+    "list_notes": "search_discovery",
+    "list_folders": "search_discovery",
     # Organization
-    "move_note",
-    "create_folder",
-    "move_folder",
-    "add_tags",
-    "update_tags",
-    "remove_tags",
-    "get_note_info",
-    "list_tags",
+    "move_note": "organization",
+    "create_folder": "organization",
+    "move_folder": "organization",
+    "add_tags": "organization",
+    "update_tags": "organization",
+    "remove_tags": "organization",
+    "get_note_info": "organization",
+    "list_tags": "organization",
     # Link management
-    "get_backlinks",
-    "get_outgoing_links",
-    "find_broken_links",
-]
\ No newline at end of file
+    "get_backlinks": "link_management",
+    "get_outgoing_links": "link_management",
+    "find_broken_links": "link_management",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    """Import a re-exported tool from its submodule on first access."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
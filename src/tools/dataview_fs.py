@@ -9,23 +9,61 @@ Obsidian to be running. Supports all three Dataview syntax variants:
 All operations work directly on markdown files.
 """
 
+import asyncio
+import atexit
+import mmap
+import multiprocessing
 import os
 import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from datetime import date, datetime
-from typing import Dict, Any, List, Optional, Literal, Union
+from typing import Dict, Any, List, Optional, Literal, Tuple, Union
 from pydantic import Field
 
 from ..models.obsidian import DataviewField
+from ..utils.file_utils import get_vault_root, read_vault_text
 from ..utils.patterns import (
-    DATAVIEW_FULL_LINE,
-    DATAVIEW_BRACKET,
-    DATAVIEW_PAREN,
+    DATAVIEW_FIELD,
+    DATAVIEW_FIELD_OR_FENCE,
+    DATAVIEW_KEY_INVALID,
     DATE_ISO8601,
+    NUMBER_PATTERN,
+    CODE_FENCE_BLOCK,
+    FRONTMATTER_BLOCK,
     LIST_QUOTED,
     WIKILINK_PATTERN,
 )
 
+# Vault scans fan out to worker processes only when there are enough files to
+# amortize process scheduling and result pickling
+_PARALLEL_SCAN_MIN_FILES = 64
+_SCAN_CHUNK_SIZE = 32
+_scan_pool: Optional[ProcessPoolExecutor] = None
+
+# Notes at least this large are parsed in newline-aligned windows, so peak
+# memory per file stays bounded
+_STREAM_MIN_BYTES = 128 * 1024
+_STREAM_WINDOW_BYTES = 64 * 1024
+
+# Tail read per step when trimming trailing whitespace before appending a field
+_APPEND_TAIL_BYTES = 4096
+
+# LRU cache of parsed field rows: (vault, relative path) -> ((mtime_ns, size), rows)
+_FIELD_ROWS_CACHE: "OrderedDict[Tuple[str, str], tuple]" = OrderedDict()
+_FIELD_ROWS_CACHE_SIZE = 4096
+_FIELD_ROWS_CACHE_LOCK = threading.Lock()
+
+# Spaces become hyphens; every other ASCII character outside [a-z0-9-] is dropped
+_KEY_TRANSLATION = str.maketrans({
+    ch: ("-" if ch == " " else None)
+    for ch in map(chr, range(128))
+    if not (ch.isalnum() or ch == "-")
+})
+
 
 def canonicalize_key(key: str) -> str:
     """Convert field key to canonical form.
@@ -42,15 +80,23 @@ def canonicalize_key(key: str) -> str:
     Returns:
         Canonicalized key string
     """
-    # Remove markdown formatting
-    cleaned = key.strip("_*~")
-    # Convert to lowercase and replace spaces with hyphens
-    canonical = cleaned.lower().replace(" ", "-")
-    # Remove any non-alphanumeric chars except hyphens
-    canonical = re.sub(r"[^a-z0-9-]", "", canonical)
+    # Lowercase, map spaces to hyphens and drop formatting/special chars in one pass
+    canonical = key.strip().lower().translate(_KEY_TRANSLATION)
+    if not canonical.isascii():
+        # The table only covers ASCII; strip anything else the slow way
+        canonical = DATAVIEW_KEY_INVALID.sub("", canonical)
     return canonical
 
 
+def _field_canonical_key(key: str) -> str:
+    """Canonical key used to match fields, never empty for a non-empty key.
+
+    Keys with no ASCII word characters canonicalize to nothing; fall back to
+    the same form as DataviewField.set_canonical_key so they stay distinct.
+    """
+    return canonicalize_key(key) or key.lower().replace(" ", "-").strip("_*~")
+
+
 def detect_value_type(value: str) -> Literal["string", "number", "boolean", "date", "link", "list"]:
     """Detect the type of a Dataview field value.
 
@@ -66,19 +112,20 @@ def detect_value_type(value: str) -> Literal["string", "number", "boolean", "dat
     if value_stripped.lower() in ("true", "false"):
         return "boolean"
 
-    # Number check (int or float)
-    try:
-        float(value_stripped)
-        return "number"
-    except ValueError:
-        pass
+    # Dispatch on the first character so plain strings skip the numeric probes
+    first = value_stripped[:1]
+
+    if first and first in "-+.0123456789":
+        # Date check (ISO8601, and a real calendar date)
+        if DATE_ISO8601.match(value_stripped):
+            return "date" if _parse_iso_date(value_stripped) is not None else "string"
 
-    # Date check (ISO8601)
-    if DATE_ISO8601.match(value_stripped):
-        return "date"
+        # Number check (int or float)
+        if NUMBER_PATTERN.match(value_stripped):
+            return "number"
 
     # Wikilink check
-    if WIKILINK_PATTERN.match(value_stripped):
+    if first == "[" and WIKILINK_PATTERN.match(value_stripped):
         return "link"
 
     # List check (comma-separated, may have quoted items)
@@ -89,6 +136,20 @@ def detect_value_type(value: str) -> Literal["string", "number", "boolean", "dat
     return "string"
 
 
+def _parse_iso_date(value: str) -> Optional[Union[date, datetime]]:
+    """Parse an ISO8601 date or datetime string, returning None if invalid.
+
+    The C-level fromisoformat parsers beat hand-rolled slicing and int()
+    calls, and since Python 3.11 they accept a trailing "Z" directly.
+    """
+    try:
+        if "T" in value:
+            return datetime.fromisoformat(value)
+        return date.fromisoformat(value)
+    except ValueError:
+        return None
+
+
 def parse_value(value: str, value_type: str) -> Any:
     """Parse value string based on detected type.
 
@@ -107,20 +168,15 @@ def parse_value(value: str, value_type: str) -> Any:
     elif value_type == "number":
         try:
             # Try int first
-            if "." not in value_stripped:
+            if value_stripped.lstrip("+-").isdigit():
                 return int(value_stripped)
             return float(value_stripped)
         except ValueError:
             return value_stripped
 
     elif value_type == "date":
-        try:
-            # Parse ISO8601 date
-            if "T" in value_stripped:
-                return datetime.fromisoformat(value_stripped.replace("Z", "+00:00"))
-            return datetime.strptime(value_stripped, "%Y-%m-%d").date()
-        except ValueError:
-            return value_stripped
+        parsed = _parse_iso_date(value_stripped)
+        return parsed if parsed is not None else value_stripped
 
     elif value_type == "link":
         # Extract link target
@@ -146,6 +202,90 @@ def parse_value(value: str, value_type: str) -> Any:
     return value_stripped
 
 
+class _LineCounter:
+    """Map non-decreasing offsets in a string to 1-based line numbers.
+
+    Each call only counts the newlines since the previous offset, so walking
+    all matches of a finditer() scans the content once in total.
+    """
+
+    __slots__ = ("_content", "_pos", "_line")
+
+    def __init__(self, content: str):
+        self._content = content
+        self._pos = 0
+        self._line = 1
+
+    def line_of(self, pos: int) -> int:
+        """Return the line number containing pos."""
+        self._line += self._content.count("\n", self._pos, pos)
+        self._pos = pos
+        return self._line
+
+
+def _keep_newlines(match: re.Match) -> str:
+    """Replacement for a masked region that preserves its line count."""
+    return "\n" * match.group(0).count("\n")
+
+
+def extract_dataview_field_rows(content: str, source_file: str) -> List[Dict[str, Any]]:
+    """Extract all Dataview inline fields from content as plain dictionaries.
+
+    Same parsing as extract_dataview_fields, without building a pydantic model
+    per field. Each row has the DataviewField attributes as keys.
+
+    Args:
+        content: Markdown content
+        source_file: Path to source file
+
+    Returns:
+        List of field dictionaries in document order
+    """
+    rows = []
+
+    # Blank out code blocks, keeping their newlines so line numbers still line up
+    if "```" in content:
+        content = CODE_FENCE_BLOCK.sub(_keep_newlines, content)
+
+    lines = _LineCounter(content)
+
+    # One pass over the content; the named group that matched tells us the syntax
+    for line_match in DATAVIEW_FIELD.finditer(content):
+        matches = [line_match]
+        if line_match.group("fkey") is not None:
+            # A full-line value can hold bracket/paren fields of its own; ^
+            # never matches mid-line, so only those alternatives apply here
+            matches.extend(DATAVIEW_FIELD.finditer(
+                content, line_match.start("fval"), line_match.end("fval")
+            ))
+
+        for match in matches:
+            if match.group("fkey") is not None:
+                key, value_str, syntax_type = match.group("fkey", "fval") + ("full-line",)
+            elif match.group("bkey") is not None:
+                key, value_str, syntax_type = match.group("bkey", "bval") + ("bracket",)
+            else:
+                key, value_str, syntax_type = match.group("pkey", "pval") + ("paren",)
+
+            key = key.strip()
+            if not key:
+                continue
+            value_str = value_str.strip()
+            value_type = detect_value_type(value_str)
+
+            rows.append({
+                "key": key,
+                "canonical_key": _field_canonical_key(key),
+                "value": parse_value(value_str, value_type),
+                "value_type": value_type,
+                "syntax_type": syntax_type,
+                "line_number": lines.line_of(match.start()),
+                "source_file": source_file,
+            })
+
+    return rows
+
+
 def extract_dataview_fields(content: str, source_file: str) -> List[DataviewField]:
     """Extract all Dataview inline fields from content.
 
@@ -159,95 +299,40 @@ def extract_dataview_fields(content: str, source_file: str) -> List[DataviewFiel
         source_file: Path to source file
 
     Returns:
-        List of DataviewField objects
+        List of DataviewField objects in document order
     """
-    fields = []
+    # Rows come from our own parser, so pydantic validation is skipped
+    return [
+        DataviewField.model_construct(**row)
+        for row in extract_dataview_field_rows(content, source_file)
+    ]
 
-    # Skip code blocks
-    code_block_pattern = re.compile(r"```.*?```", re.DOTALL)
-    code_blocks = [(m.start(), m.end()) for m in code_block_pattern.finditer(content)]
 
-    def in_code_block(pos: int) -> bool:
-        """Check if position is inside a code block."""
-        return any(start <= pos < end for start, end in code_blocks)
+def _field_row_output(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Tool output for a field row (the source file is reported separately)."""
+    return {k: v for k, v in row.items() if k != "source_file"}
 
-    # Extract full-line fields (field:: value)
-    for match in DATAVIEW_FULL_LINE.finditer(content):
-        if in_code_block(match.start()):
-            continue
-
-        key = match.group(1).strip()
-        value_str = match.group(2).strip()
-        canonical_key = canonicalize_key(key)
-        value_type = detect_value_type(value_str)
-        value = parse_value(value_str, value_type)
-
-        # Calculate line number
-        line_number = content[:match.start()].count("\n") + 1
-
-        fields.append(
-            DataviewField(
-                key=key,
-                value=value,
-                canonical_key=canonical_key,
-                line_number=line_number,
-                syntax_type="full-line",
-                source_file=source_file,
-                value_type=value_type,
-            )
-        )
 
-    # Extract bracket fields ([field:: value])
-    for match in DATAVIEW_BRACKET.finditer(content):
-        if in_code_block(match.start()):
-            continue
+def _format_list_value(value: List[Any]) -> str:
+    """Format a list value as comma-separated quoted items."""
+    return ", ".join(f'"{item}"' for item in value)
 
-        key = match.group(1).strip()
-        value_str = match.group(2).strip()
-        canonical_key = canonicalize_key(key)
-        value_type = detect_value_type(value_str)
-        value = parse_value(value_str, value_type)
-
-        line_number = content[:match.start()].count("\n") + 1
-
-        fields.append(
-            DataviewField(
-                key=key,
-                value=value,
-                canonical_key=canonical_key,
-                line_number=line_number,
-                syntax_type="bracket",
-                source_file=source_file,
-                value_type=value_type,
-            )
-        )
 
-    # Extract paren fields ((field:: value))
-    for match in DATAVIEW_PAREN.finditer(content):
-        if in_code_block(match.start()):
-            continue
-
-        key = match.group(1).strip()
-        value_str = match.group(2).strip()
-        canonical_key = canonicalize_key(key)
-        value_type = detect_value_type(value_str)
-        value = parse_value(value_str, value_type)
-
-        line_number = content[:match.start()].count("\n") + 1
-
-        fields.append(
-            DataviewField(
-                key=key,
-                value=value,
-                canonical_key=canonical_key,
-                line_number=line_number,
-                syntax_type="paren",
-                source_file=source_file,
-                value_type=value_type,
-            )
-        )
-
-    return fields
+# Value formatting and field wrapping, looked up instead of branched on
+_VALUE_FORMATTERS = {
+    bool: lambda v: "true" if v else "false",
+    date: date.isoformat,
+    datetime: datetime.isoformat,
+    list: _format_list_value,
+    str: str,
+    int: str,
+    float: str,
+}
+_FIELD_TEMPLATES = {
+    "full-line": "{}:: {}",
+    "bracket": "[{}:: {}]",
+    "paren": "({}:: {})",
+}
 
 
 def format_dataview_field(
@@ -265,59 +350,250 @@ def format_dataview_field(
     Returns:
         Formatted field string
     """
-    # Format value
+    # Format value by exact type; subclasses (and anything else) take the
+    # isinstance fallback
+    formatter = _VALUE_FORMATTERS.get(type(value))
+    value_str = formatter(value) if formatter else _format_other_value(value)
+
+    # Format based on syntax type (unknown types fall back to full-line)
+    return _FIELD_TEMPLATES.get(syntax_type, "{}:: {}").format(key, value_str)
+
+
+def _format_other_value(value: Any) -> str:
+    """Format a value whose exact type has no entry in _VALUE_FORMATTERS."""
     if isinstance(value, bool):
-        value_str = "true" if value else "false"
-    elif isinstance(value, (date, datetime)):
-        value_str = value.isoformat()
-    elif isinstance(value, list):
-        # Format as quoted list
-        value_str = ", ".join(f'"{item}"' for item in value)
-    else:
-        value_str = str(value)
-
-    # Format based on syntax type
-    if syntax_type == "bracket":
-        return f"[{key}:: {value_str}]"
-    elif syntax_type == "paren":
-        return f"({key}:: {value_str})"
-    else:  # full-line
-        return f"{key}:: {value_str}"
-
-
-def scan_vault_for_fields(vault_path: str, key_filter: Optional[str] = None) -> List[DataviewField]:
+        return "true" if value else "false"
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, list):
+        return _format_list_value(value)
+    return str(value)
+
+
+def _scan_field_files(
+    vault_path: str, relative_paths: List[str]
+) -> List[Optional[Tuple[Dict[str, Any], ...]]]:
+    """Extract field rows from a batch of vault files (runs in worker processes).
+
+    Args:
+        vault_path: Path to Obsidian vault
+        relative_paths: Vault-relative paths of the files to scan
+
+    Returns:
+        Per-file row tuples aligned with relative_paths; None for files that
+        could not be read
+    """
+    results = []
+    for relative_path in relative_paths:
+        try:
+            with open(os.path.join(vault_path, relative_path), "rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    results.append(())
+                    continue
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    # Every field syntax contains "::"; skip notes without one
+                    # before paying for a copy and a decode
+                    if mm.find(b"::") == -1:
+                        results.append(())
+                        continue
+                    if len(mm) >= _STREAM_MIN_BYTES:
+                        results.append(tuple(_extract_rows_windowed(mm, relative_path)))
+                        continue
+                    content = mm[:].decode("utf-8")
+        except (OSError, ValueError):
+            # Skip files that can't be read or aren't valid UTF-8
+            results.append(None)
+            continue
+
+        results.append(tuple(extract_dataview_field_rows(content, relative_path)))
+
+    return results
+
+
+def _extract_rows_windowed(buf: mmap.mmap, source_file: str) -> List[Dict[str, Any]]:
+    """Extract field rows from a large note one window of lines at a time.
+
+    Windows end on a newline, so no full-line field or UTF-8 sequence is
+    split. A code fence left open by one window is closed with a synthetic
+    ``` marker at its end and reopened at the start of the next, which keeps
+    the masking in extract_dataview_field_rows correct. Fences pair left to
+    right, so with an odd count the file's last fence never closes and masks
+    nothing; it is left out of the tracking. The markers contain no newlines,
+    so line numbers only need the window's starting line added.
+
+    Args:
+        buf: Mapped file content
+        source_file: Path to source file
+
+    Returns:
+        Field rows in document order
+
+    Raises:
+        ValueError: If the file is not valid UTF-8
+    """
+    rows = []
+    size = len(buf)
+    start = 0
+    line_offset = 0
+    fence_open = False
+    fence_count = 0
+    pos = buf.find(b"```")
+    while pos != -1:
+        fence_count += 1
+        pos = buf.find(b"```", pos + 3)
+    unpaired_at = buf.rfind(b"```") if fence_count % 2 else -1
+
+    while start < size:
+        end = buf.find(b"\n", min(start + _STREAM_WINDOW_BYTES, size) - 1)
+        end = size if end == -1 else end + 1
+        window = buf[start:end]
+
+        fences = window.count(b"```") - (start <= unpaired_at < end)
+        open_at_end = (fence_open + fences) % 2 == 1
+        if b"::" in window:
+            text = window.decode("utf-8")
+            if fence_open:
+                text = "```" + text
+            if open_at_end:
+                text += "```"
+            for row in extract_dataview_field_rows(text, source_file):
+                row["line_number"] += line_offset
+                rows.append(row)
+        else:
+            # Still validate the encoding, as the whole-file path would
+            window.decode("utf-8")
+
+        fence_open = open_at_end
+        line_offset += window.count(b"\n")
+        start = end
+
+    return rows
+
+
+def _get_scan_pool() -> ProcessPoolExecutor:
+    """Return the shared worker pool for large vault scans, creating it lazily."""
+    global _scan_pool
+    if _scan_pool is None:
+        # fork() from a threaded server can copy held locks into the workers;
+        # start them from a clean forkserver (spawn where that is unavailable)
+        if "forkserver" in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context("forkserver")
+        else:
+            context = multiprocessing.get_context("spawn")
+        _scan_pool = ProcessPoolExecutor(
+            max_workers=os.cpu_count() or 1, mp_context=context
+        )
+    return _scan_pool
+
+
+@atexit.register
+def _shutdown_scan_pool() -> None:
+    """Stop the worker pool's processes when the interpreter exits."""
+    if _scan_pool is not None:
+        _scan_pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _parse_field_files(
+    vault_path: str, relative_paths: List[str]
+) -> List[Optional[Tuple[Dict[str, Any], ...]]]:
+    """Parse files inline or across the worker pool, depending on how many there are."""
+    global _scan_pool
+    if len(relative_paths) < _PARALLEL_SCAN_MIN_FILES:
+        return _scan_field_files(vault_path, relative_paths)
+
+    chunks = [
+        relative_paths[i:i + _SCAN_CHUNK_SIZE]
+        for i in range(0, len(relative_paths), _SCAN_CHUNK_SIZE)
+    ]
+    try:
+        pool = _get_scan_pool()
+        results = pool.map(_scan_field_files, [vault_path] * len(chunks), chunks)
+        return [file_rows for chunk_results in results for file_rows in chunk_results]
+    except (BrokenProcessPool, OSError):
+        # Worker processes unavailable; drop the pool and scan inline
+        _scan_pool = None
+        return _scan_field_files(vault_path, relative_paths)
+
+
+def _get_cached_rows(
+    vault_path: str, relative_path: str, stamp: Tuple[int, int]
+) -> Optional[Tuple[Dict[str, Any], ...]]:
+    """Return cached rows for a file if its (mtime_ns, size) stamp still matches."""
+    key = (vault_path, relative_path)
+    with _FIELD_ROWS_CACHE_LOCK:
+        cached = _FIELD_ROWS_CACHE.get(key)
+        if cached is None or cached[0] != stamp:
+            return None
+        _FIELD_ROWS_CACHE.move_to_end(key)
+        return cached[1]
+
+
+def _put_cached_rows(
+    vault_path: str, relative_path: str, stamp: Tuple[int, int],
+    rows: Tuple[Dict[str, Any], ...],
+) -> None:
+    """Store parsed rows for a file, evicting the least recently used entry."""
+    key = (vault_path, relative_path)
+    with _FIELD_ROWS_CACHE_LOCK:
+        _FIELD_ROWS_CACHE[key] = (stamp, rows)
+        _FIELD_ROWS_CACHE.move_to_end(key)
+        if len(_FIELD_ROWS_CACHE) > _FIELD_ROWS_CACHE_SIZE:
+            _FIELD_ROWS_CACHE.popitem(last=False)
+
+
+def scan_vault_for_fields(vault_path: str, key_filter: Optional[str] = None) -> List[Dict[str, Any]]:
     """Scan entire vault for Dataview fields.
 
+    Parsed rows are cached per file and reused while the file's mtime and
+    size are unchanged. Files that need parsing are handled inline, or in
+    parallel worker processes when there are many of them.
+
     Args:
         vault_path: Path to Obsidian vault
         key_filter: Optional canonical key to filter by
 
     Returns:
-        List of all matching fields found in vault
+        List of field rows (see extract_dataview_field_rows) found in vault.
+        Rows are shared with the cache and must not be modified.
     """
-    fields = []
     vault_dir = Path(vault_path)
 
+    per_file: Dict[str, Optional[Tuple[Dict[str, Any], ...]]] = {}
+    stale: List[Tuple[str, Tuple[int, int]]] = []
     for md_file in vault_dir.rglob("*.md"):
+        relative = md_file.relative_to(vault_dir)
         # Skip hidden files and folders
-        if any(part.startswith(".") for part in md_file.parts):
+        if any(part.startswith(".") for part in relative.parts):
             continue
+        relative_path = str(relative)
 
         try:
-            content = md_file.read_text(encoding="utf-8")
-            relative_path = str(md_file.relative_to(vault_dir))
-
-            file_fields = extract_dataview_fields(content, relative_path)
+            st = md_file.stat()
+        except OSError:
+            continue
+        stamp = (st.st_mtime_ns, st.st_size)
 
-            # Apply filter if specified
-            if key_filter:
-                file_fields = [f for f in file_fields if f.canonical_key == key_filter]
+        cached = _get_cached_rows(vault_path, relative_path, stamp)
+        per_file[relative_path] = cached
+        if cached is None:
+            stale.append((relative_path, stamp))
 
-            fields.extend(file_fields)
+    if stale:
+        parsed = _parse_field_files(vault_path, [path for path, _ in stale])
+        for (relative_path, stamp), file_rows in zip(stale, parsed):
+            per_file[relative_path] = file_rows
+            if file_rows is not None:
+                _put_cached_rows(vault_path, relative_path, stamp, file_rows)
 
-        except Exception:
-            # Skip files that can't be read
+    fields = []
+    for file_rows in per_file.values():
+        if not file_rows:
             continue
+        # Apply filter if specified
+        if key_filter:
+            fields.extend(row for row in file_rows if row["canonical_key"] == key_filter)
+        else:
+            fields.extend(file_rows)
 
     return fields
 
@@ -353,33 +629,50 @@ def add_field_to_file(
             full_path.write_text(field_line + "\n", encoding="utf-8")
             return True
 
-        content = full_path.read_text(encoding="utf-8")
-
         # Format field
         field_line = format_dataview_field(key, value, syntax_type)
 
+        if insert_at == "end":
+            # Append in place after trimming trailing whitespace, as
+            # content.rstrip() would; only the file's tail is read. ASCII
+            # whitespace bytes never occur inside a UTF-8 sequence, so a
+            # chunk may start mid-character
+            with open(full_path, "r+b") as f:
+                end = f.seek(0, os.SEEK_END)
+                while end:
+                    chunk_start = max(0, end - _APPEND_TAIL_BYTES)
+                    f.seek(chunk_start)
+                    stripped = f.read(end - chunk_start).rstrip()
+                    end = chunk_start + len(stripped)
+                    if stripped:
+                        break
+                f.seek(end)
+                f.truncate()
+                f.write(b"\n" + field_line.encode("utf-8") + b"\n")
+            return True
+
+        content = full_path.read_text(encoding="utf-8")
+
         # Determine insertion point
         if insert_at == "start":
             new_content = field_line + "\n" + content
 
-        elif insert_at == "end":
-            new_content = content.rstrip() + "\n" + field_line + "\n"
-
         elif insert_at == "after_frontmatter":
-            # Check for frontmatter
-            frontmatter_pattern = re.compile(r"^---\s*\n(.*?)\n---\s*\n", re.DOTALL)
-            match = frontmatter_pattern.match(content)
+            fm_match = FRONTMATTER_BLOCK.match(content)
+            fm_end = fm_match.end() if fm_match else None
 
-            if match:
-                # Insert after frontmatter
-                fm_end = match.end()
-                new_content = content[:fm_end] + field_line + "\n" + content[fm_end:]
-            else:
+            if fm_end is None:
                 # No frontmatter, insert at start
                 new_content = field_line + "\n" + content
+            elif fm_end == len(content) and not content.endswith("\n"):
+                # Closing delimiter is the last line, without a newline
+                new_content = content + "\n" + field_line + "\n"
+            else:
+                # Insert after frontmatter
+                new_content = content[:fm_end] + field_line + "\n" + content[fm_end:]
 
         else:
-            new_content = content + "\n" + field_line + "\n"
+            raise ValueError(f"Unknown insert_at: {insert_at}")
 
         full_path.write_text(new_content, encoding="utf-8")
         return True
@@ -409,43 +702,60 @@ def remove_field_from_file(
 
     try:
         content = full_path.read_text(encoding="utf-8")
-        fields = extract_dataview_fields(content, file_path)
+        canonical_key = _field_canonical_key(key)
+
+        # Cut matching fields out in one pass, remembering which output lines
+        # they were on so lines left blank can be dropped afterwards
+        pieces = []
+        pos = 0
+        out_line = 0
+        touched_lines = set()
+        lines = _LineCounter(content)
+
+        for line_match in DATAVIEW_FIELD_OR_FENCE.finditer(content):
+            if line_match.group("fence") is not None:
+                continue
+
+            matches = [line_match]
+            if line_match.group("fkey") is not None:
+                # Bracket/paren fields nested in a full-line value, as extracted
+                matches.extend(DATAVIEW_FIELD.finditer(
+                    content, line_match.start("fval"), line_match.end("fval")
+                ))
+
+            for match in matches:
+                # Skip fields inside a full-line field that was already cut
+                if match.start() < pos:
+                    continue
+
+                field_key = match.group("fkey") or match.group("bkey") or match.group("pkey")
+                if _field_canonical_key(field_key.strip()) != canonical_key:
+                    continue
+
+                # If line_number specified, remove only that one
+                if line_number and lines.line_of(match.start()) != line_number:
+                    continue
+
+                segment = content[pos:match.start()]
+                pieces.append(segment)
+                out_line += segment.count("\n")
+                touched_lines.add(out_line)
+                pos = match.end()
+
+        if not touched_lines:
+            return False
 
-        # Find matching fields
-        canonical_key = canonicalize_key(key)
-        matching_fields = [f for f in fields if f.canonical_key == canonical_key]
+        pieces.append(content[pos:])
+        new_lines = "".join(pieces).splitlines(keepends=True)
 
-        if not matching_fields:
-            return False
+        # Full-line fields, and inline fields that were alone on their line,
+        # leave a blank line behind
+        new_content = "".join(
+            text for idx, text in enumerate(new_lines)
+            if idx not in touched_lines or text.strip()
+        )
 
-        # If line_number specified, remove only that one
-        if line_number:
-            matching_fields = [f for f in matching_fields if f.line_number == line_number]
-            if not matching_fields:
-                return False
-
-        # Remove fields from content (work backwards to preserve line numbers)
-        lines = content.splitlines(keepends=True)
-
-        for field in sorted(matching_fields, key=lambda f: f.line_number, reverse=True):
-            if field.line_number <= len(lines):
-                line_idx = field.line_number - 1
-                line = lines[line_idx]
-
-                # For bracket/paren syntax, remove just the field (inline)
-                if field.syntax_type in ("bracket", "paren"):
-                    pattern = format_dataview_field(field.key, ".*?", field.syntax_type)
-                    pattern_regex = re.escape(pattern).replace(r"\.\*\?", ".*?")
-                    lines[line_idx] = re.sub(pattern_regex, "", line)
-
-                    # If line becomes empty, remove it
-                    if not lines[line_idx].strip():
-                        del lines[line_idx]
-                else:
-                    # For full-line syntax, remove entire line
-                    del lines[line_idx]
-
-        full_path.write_text("".join(lines), encoding="utf-8")
+        full_path.write_text(new_content, encoding="utf-8")
         return True
 
     except Exception:
@@ -469,32 +779,15 @@ async def extract_dataview_fields_fs_tool(
     Returns:
         Dictionary with fields list and count
     """
-    vault = vault_path or os.getenv("OBSIDIAN_VAULT_PATH")
-    if not vault:
-        raise ValueError("vault_path must be provided or OBSIDIAN_VAULT_PATH must be set")
+    vault = get_vault_root(vault_path)
 
-    full_path = Path(vault) / file_path
-
-    if not full_path.exists():
-        raise ValueError(f"File not found: {file_path}")
-
-    content = full_path.read_text(encoding="utf-8")
-    fields = extract_dataview_fields(content, file_path)
+    content = read_vault_text(vault, file_path)
+    rows = extract_dataview_field_rows(content, file_path)
 
     return {
         "file_path": file_path,
-        "field_count": len(fields),
-        "fields": [
-            {
-                "key": f.key,
-                "canonical_key": f.canonical_key,
-                "value": f.value,
-                "value_type": f.value_type,
-                "syntax_type": f.syntax_type,
-                "line_number": f.line_number,
-            }
-            for f in fields
-        ],
+        "field_count": len(rows),
+        "fields": [_field_row_output(row) for row in rows],
     }
 
 
@@ -515,36 +808,23 @@ async def search_by_dataview_field_fs_tool(
     Returns:
         Dictionary with matching fields grouped by file
     """
-    vault = vault_path or os.getenv("OBSIDIAN_VAULT_PATH")
-    if not vault:
-        raise ValueError("vault_path must be provided or OBSIDIAN_VAULT_PATH must be set")
+    vault = get_vault_root(vault_path)
 
     canonical_key = canonicalize_key(key)
-    all_fields = scan_vault_for_fields(vault, key_filter=canonical_key)
+    all_fields = await asyncio.to_thread(scan_vault_for_fields, vault, canonical_key)
 
     # Apply value filter if specified
     if value is not None:
-        all_fields = [f for f in all_fields if f.value == value]
+        all_fields = [f for f in all_fields if f["value"] == value]
 
     # Apply value_type filter if specified
     if value_type:
-        all_fields = [f for f in all_fields if f.value_type == value_type]
+        all_fields = [f for f in all_fields if f["value_type"] == value_type]
 
     # Group by file
     by_file = {}
     for field in all_fields:
-        if field.source_file not in by_file:
-            by_file[field.source_file] = []
-        by_file[field.source_file].append(
-            {
-                "key": field.key,
-                "canonical_key": field.canonical_key,
-                "value": field.value,
-                "value_type": field.value_type,
-                "syntax_type": field.syntax_type,
-                "line_number": field.line_number,
-            }
-        )
+        by_file.setdefault(field["source_file"], []).append(_field_row_output(field))
 
     return {
         "search_key": key,
@@ -576,9 +856,7 @@ async def add_dataview_field_fs_tool(
     Returns:
         Dictionary with success status and formatted field
     """
-    vault = vault_path or os.getenv("OBSIDIAN_VAULT_PATH")
-    if not vault:
-        raise ValueError("vault_path must be provided or OBSIDIAN_VAULT_PATH must be set")
+    vault = get_vault_root(vault_path)
 
     formatted_field = format_dataview_field(key, value, syntax_type)
 
@@ -609,9 +887,7 @@ async def remove_dataview_field_fs_tool(
     Returns:
         Dictionary with success status
     """
-    vault = vault_path or os.getenv("OBSIDIAN_VAULT_PATH")
-    if not vault:
-        raise ValueError("vault_path must be provided or OBSIDIAN_VAULT_PATH must be set")
+    vault = get_vault_root(vault_path)
 
     success = remove_field_from_file(vault, file_path, key, line_number)
 
@@ -8,21 +8,25 @@ Supports the Kanban plugin's markdown format:
 - #tags and [[wikilinks]] in cards
 """
 
-import os
-import re
 from pathlib import Path
 from datetime import date, datetime
 from typing import Dict, Any, List, Optional, Literal, Tuple
 
 from ..models.obsidian import KanbanBoard, KanbanColumn, KanbanCard
+from ..utils.file_utils import get_vault_root, read_vault_bytes, read_vault_text
 from ..utils.patterns import (
+    FRONTMATTER_BLOCK,
     KANBAN_COLUMN,
     KANBAN_CARD,
+    KANBAN_CARD_METADATA,
+    KANBAN_CARD_STATUS_BYTES,
+    KANBAN_COLUMN_BYTES,
     KANBAN_DATE,
-    TAG_PATTERN,
-    WIKILINK_PATTERN,
 )
 
+# Canonical checkbox prefixes mapped to their completed state
+_CARD_PREFIXES = {"- [ ] ": False, "- [x] ": True, "- [X] ": True}
+
 
 def parse_card_metadata(card_text: str) -> Dict[str, Any]:
     """Extract metadata from card text.
@@ -38,20 +42,22 @@ def parse_card_metadata(card_text: str) -> Dict[str, Any]:
         "tags": [],
         "wikilinks": [],
     }
-
-    # Extract due date @{YYYY-MM-DD}
-    date_match = KANBAN_DATE.search(card_text)
-    if date_match:
-        try:
-            metadata["due_date"] = datetime.strptime(date_match.group(1), "%Y-%m-%d").date()
-        except ValueError:
-            pass
-
-    # Extract tags
-    metadata["tags"] = [match.group(1) for match in TAG_PATTERN.finditer(card_text)]
-
-    # Extract wikilinks
-    metadata["wikilinks"] = [match.group(1) for match in WIKILINK_PATTERN.finditer(card_text)]
+    due_seen = False
+
+    # Due date @{YYYY-MM-DD}, #tags and [[wikilinks]] in a single pass
+    for match in KANBAN_CARD_METADATA.finditer(card_text):
+        kind = match.lastgroup
+        if kind == "tag":
+            metadata["tags"].append(match.group("tag"))
+        elif kind == "link":
+            metadata["wikilinks"].append(match.group("link"))
+        elif not due_seen:
+            # Only the first due date counts
+            due_seen = True
+            try:
+                metadata["due_date"] = date.fromisoformat(match.group("due"))
+            except ValueError:
+                pass
 
     return metadata
 
@@ -95,34 +101,60 @@ def parse_kanban_structure(content: str, file_path: str) -> KanbanBoard:
     card_stack = []  # Stack to track nested cards
 
     for line_num, line in enumerate(lines, start=1):
+        # Only headings and list items matter; prose and blank lines are
+        # skipped without running either pattern
+        if line[:1] == "#":
+            column_match = KANBAN_COLUMN.match(line)
+        elif line.lstrip()[:1] == "-":
+            column_match = None
+        else:
+            continue
+
         # Check for column heading (## Column Name)
-        column_match = KANBAN_COLUMN.match(line)
         if column_match and column_match.group(1) == "##":
+            # A blank heading names no column (KanbanColumn requires a name)
+            column_name = column_match.group(2).strip()
+            if not column_name:
+                continue
+
             # Save previous column
             if current_column:
+                current_column.card_count = len(current_column.cards)
                 columns.append(current_column)
 
-            # Start new column
-            column_name = column_match.group(2).strip()
-            current_column = KanbanColumn(
+            # Start new column (values come from our own parsing, so the
+            # model's validators are skipped; card_count is set on save)
+            current_column = KanbanColumn.model_construct(
                 name=column_name,
                 cards=[],
+                card_count=0,
+                heading_level=2,
                 line_number=line_num,
             )
             card_stack = []
             continue
 
         # Check for card (- [ ] or - [x])
-        card_match = KANBAN_CARD.match(line)
-        if card_match and current_column:
-            indent_str = card_match.group(1)
-            checkbox_status = card_match.group(2)
-            card_text = card_match.group(3).strip()
+        if current_column:
+            # The canonical "- [ ] " form is a slice and a dict lookup; looser
+            # spacing falls back to the full pattern
+            stripped = line.lstrip()
+            completed = _CARD_PREFIXES.get(stripped[:6])
+            if completed is not None and len(stripped) > 6:
+                indent_width = len(line) - len(stripped)
+                card_text = stripped[6:].strip()
+            else:
+                card_match = KANBAN_CARD.match(line)
+                if not card_match:
+                    continue
+                indent_width = len(card_match.group(1))
+                completed = card_match.group(2) != " "
+                card_text = card_match.group(3).strip()
 
             # Calculate indent level
-            indent_level = len(indent_str) // 2
+            indent_level = indent_width // 2
 
-            status = "completed" if checkbox_status.lower() == "x" else "incomplete"
+            status = "completed" if completed else "incomplete"
 
             # Parse metadata
             metadata = parse_card_metadata(card_text)
@@ -132,7 +164,15 @@ def parse_kanban_structure(content: str, file_path: str) -> KanbanBoard:
             # Remove due date
             clean_text = KANBAN_DATE.sub("", clean_text).strip()
 
-            card = KanbanCard(
+            # Cards are built without validation, so uphold the non-empty text
+            # rule here: a date-only card keeps its raw text, a blank one is
+            # not a card (count_board_cards skips it too)
+            if not clean_text:
+                if not card_text:
+                    continue
+                clean_text = card_text
+
+            card = KanbanCard.model_construct(
                 text=clean_text,
                 status=status,
                 due_date=metadata["due_date"],
@@ -165,24 +205,50 @@ def parse_kanban_structure(content: str, file_path: str) -> KanbanBoard:
 
     # Save last column
     if current_column:
+        current_column.card_count = len(current_column.cards)
         columns.append(current_column)
 
     # Parse frontmatter settings if present
     settings = {}
-    frontmatter_match = re.match(r"^---\s*\n(.*?)\n---", content, re.DOTALL)
+    frontmatter_match = FRONTMATTER_BLOCK.match(content)
     if frontmatter_match:
         # Simple YAML parsing for kanban-plugin setting
         fm_content = frontmatter_match.group(1)
         if "kanban-plugin:" in fm_content:
             settings["kanban-plugin"] = "basic"
 
-    return KanbanBoard(
+    return KanbanBoard.model_construct(
         file_path=file_path,
         columns=columns,
         settings=settings,
+        total_cards=sum(col.card_count for col in columns),
     )
 
 
+def count_board_cards(content: bytes) -> List[Tuple[str, int, int]]:
+    """Count cards per column straight from raw board bytes.
+
+    Counts every checkbox under each ## column, subtasks included, without
+    decoding the file or building the KanbanBoard model.
+
+    Args:
+        content: Raw board file content
+
+    Returns:
+        List of (column name, total cards, completed cards) in board order
+    """
+    headings = list(KANBAN_COLUMN_BYTES.finditer(content))
+    counts = []
+
+    for i, heading in enumerate(headings):
+        end = headings[i + 1].start() if i + 1 < len(headings) else len(content)
+        statuses = KANBAN_CARD_STATUS_BYTES.findall(content, heading.end(), end)
+        completed = len(statuses) - statuses.count(b" ")
+        counts.append((heading.group(1).strip().decode("utf-8"), len(statuses), completed))
+
+    return counts
+
+
 def find_card_in_board(
     board: KanbanBoard, card_text: str, column_name: Optional[str] = None
 ) -> Optional[Tuple[KanbanColumn, KanbanCard, Optional[KanbanCard]]]:
@@ -279,16 +345,9 @@ async def parse_kanban_board_fs_tool(
     Returns:
         Board structure with columns, cards, and metadata
     """
-    vault = vault_path or os.getenv("OBSIDIAN_VAULT_PATH")
-    if not vault:
-        raise ValueError("vault_path must be provided or OBSIDIAN_VAULT_PATH must be set")
+    vault = get_vault_root(vault_path)
 
-    full_path = Path(vault) / file_path
-
-    if not full_path.exists():
-        raise ValueError(f"File not found: {file_path}")
-
-    content = full_path.read_text(encoding="utf-8")
+    content = read_vault_text(vault, file_path)
     board = parse_kanban_structure(content, file_path)
 
     def card_to_dict(card: KanbanCard) -> Dict[str, Any]:
@@ -339,16 +398,9 @@ async def add_kanban_card_fs_tool(
     Returns:
         Success status and updated board info
     """
-    vault = vault_path or os.getenv("OBSIDIAN_VAULT_PATH")
-    if not vault:
-        raise ValueError("vault_path must be provided or OBSIDIAN_VAULT_PATH must be set")
-
-    full_path = Path(vault) / file_path
+    vault = get_vault_root(vault_path)
 
-    if not full_path.exists():
-        raise ValueError(f"File not found: {file_path}")
-
-    content = full_path.read_text(encoding="utf-8")
+    content = read_vault_text(vault, file_path)
     board = parse_kanban_structure(content, file_path)
 
     # Find column
@@ -377,6 +429,8 @@ async def add_kanban_card_fs_tool(
         target_column.cards.insert(0, new_card)
     else:
         target_column.cards.append(new_card)
+    target_column.card_count += 1
+    board.total_cards += 1
 
     # Write back
     success = write_kanban_board(board, vault)
@@ -410,16 +464,9 @@ async def move_kanban_card_fs_tool(
     Returns:
         Success status and move details
     """
-    vault = vault_path or os.getenv("OBSIDIAN_VAULT_PATH")
-    if not vault:
-        raise ValueError("vault_path must be provided or OBSIDIAN_VAULT_PATH must be set")
-
-    full_path = Path(vault) / file_path
+    vault = get_vault_root(vault_path)
 
-    if not full_path.exists():
-        raise ValueError(f"File not found: {file_path}")
-
-    content = full_path.read_text(encoding="utf-8")
+    content = read_vault_text(vault, file_path)
     board = parse_kanban_structure(content, file_path)
 
     # Find card
@@ -478,16 +525,9 @@ async def toggle_kanban_card_fs_tool(
     Returns:
         Success status and new status
     """
-    vault = vault_path or os.getenv("OBSIDIAN_VAULT_PATH")
-    if not vault:
-        raise ValueError("vault_path must be provided or OBSIDIAN_VAULT_PATH must be set")
-
-    full_path = Path(vault) / file_path
-
-    if not full_path.exists():
-        raise ValueError(f"File not found: {file_path}")
+    vault = get_vault_root(vault_path)
 
-    content = full_path.read_text(encoding="utf-8")
+    content = read_vault_text(vault, file_path)
     board = parse_kanban_structure(content, file_path)
 
     # Find card
@@ -524,56 +564,33 @@ async def get_kanban_statistics_fs_tool(
     Returns:
         Board statistics with card counts and completion rates
     """
-    vault = vault_path or os.getenv("OBSIDIAN_VAULT_PATH")
-    if not vault:
-        raise ValueError("vault_path must be provided or OBSIDIAN_VAULT_PATH must be set")
-
-    full_path = Path(vault) / file_path
-
-    if not full_path.exists():
-        raise ValueError(f"File not found: {file_path}")
+    vault = get_vault_root(vault_path)
 
-    content = full_path.read_text(encoding="utf-8")
-    board = parse_kanban_structure(content, file_path)
-
-    def count_cards(cards: List[KanbanCard]) -> Tuple[int, int]:
-        """Count total and completed cards recursively."""
-        total = len(cards)
-        completed = sum(1 for c in cards if c.status == "completed")
-
-        for card in cards:
-            sub_total, sub_completed = count_cards(card.subtasks)
-            total += sub_total
-            completed += sub_completed
-
-        return total, completed
-
-    # Overall stats
-    total_cards = board.total_cards
-    total_completed = sum(
-        sum(1 for c in col.cards if c.status == "completed") for col in board.columns
-    )
+    column_counts = count_board_cards(read_vault_bytes(vault, file_path))
 
     # Per-column stats
     column_stats = []
-    for col in board.columns:
-        col_total, col_completed = count_cards(col.cards)
+    for name, col_total, col_completed in column_counts:
         completion_rate = (col_completed / col_total * 100) if col_total > 0 else 0
 
         column_stats.append({
-            "column_name": col.name,
+            "column_name": name,
             "total_cards": col_total,
             "completed_cards": col_completed,
             "incomplete_cards": col_total - col_completed,
             "completion_rate": round(completion_rate, 1),
         })
 
+    # Overall stats
+    total_cards = sum(total for _, total, _ in column_counts)
+    total_completed = sum(completed for _, _, completed in column_counts)
+
     return {
         "file_path": file_path,
         "total_cards": total_cards,
         "total_completed": total_completed,
         "total_incomplete": total_cards - total_completed,
         "overall_completion_rate": round((total_completed / total_cards * 100) if total_cards > 0 else 0, 1),
-        "column_count": len(board.columns),
+        "column_count": len(column_counts),
         "columns": column_stats,
     }
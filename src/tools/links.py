@@ -11,15 +11,36 @@ All operations are filesystem-native for maximum performance and offline capabil
 """
 
 import os
-import re
-from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
-from collections import defaultdict
-
-from ..utils.patterns import (
-    WIKILINK_PATTERN,
-    MARKDOWN_LINK,
-    EMBED_PATTERN,
+import threading
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+
+from ..utils.patterns import LINK_TARGET, LINK_TARGET_BYTES
+from ..utils.vault_walk import iter_markdown_files
+
+# LRU cache of built graphs: vault root ->
+# ({relative path: (mtime_ns, size)}, (graph, broken links), name index)
+_GRAPH_CACHE: "OrderedDict[str, tuple]" = OrderedDict()
+_GRAPH_CACHE_SIZE = 8
+_GRAPH_CACHE_LOCK = threading.Lock()
+
+# LRU cache of extracted links per note: file path -> ((mtime_ns, size), links)
+_NOTE_LINKS_CACHE: "OrderedDict[str, tuple]" = OrderedDict()
+_NOTE_LINKS_CACHE_SIZE = 4096
+_NOTE_LINKS_CACHE_LOCK = threading.Lock()
+
+# Result for notes too small to contain a link ("[[x]]" is the shortest);
+# shared, so it is never mutated
+_MIN_LINK_BYTES = 5
+_NO_LINKS = {"wikilinks": (), "markdown_links": (), "embeds": (), "all_links": ()}
+
+# Worker pool for reading and parsing notes during graph builds, used once a
+# vault has enough notes for the overlap to outweigh the dispatch overhead
+_PARALLEL_EXTRACT_MIN_FILES = 64
+_LINK_IO_EXECUTOR = ThreadPoolExecutor(
+    max_workers=min(32, (os.cpu_count() or 1) * 4),
+    thread_name_prefix="link-io",
 )
 
 
@@ -37,47 +58,53 @@ def extract_all_links(content: str, source_file: str) -> Dict[str, List[str]]:
     Returns:
         Dictionary with keys: wikilinks, markdown_links, embeds, all_links
     """
-    # Extract wikilinks (including aliases)
-    wikilinks = []
-    for match in WIKILINK_PATTERN.finditer(content):
-        target = match.group(1)
-        # Strip anchor/heading references
-        if '#' in target:
-            target = target.split('#')[0]
-        if '|' in target:
-            target = target.split('|')[0]
-        target = target.strip()
-        if target:
-            wikilinks.append(target)
+    # One scan over the content; the matched group tells the link type
+    return _collect_links(
+        (match.lastgroup, match.group(match.lastgroup))
+        for match in LINK_TARGET.finditer(content)
+    )
+
+
+def extract_all_links_bytes(content: bytes, source_file: str) -> Dict[str, List[str]]:
+    """Extract all link types from raw UTF-8 note bytes.
 
-    # Extract markdown links
+    Equivalent to extract_all_links on the decoded text, but only the matched
+    link targets are decoded.
+
+    Args:
+        content: Raw file content to parse
+        source_file: Source file path for context
+
+    Returns:
+        Dictionary with keys: wikilinks, markdown_links, embeds, all_links
+    """
+    return _collect_links(
+        (match.lastgroup, match.group(match.lastgroup).decode('utf-8', 'replace'))
+        for match in LINK_TARGET_BYTES.finditer(content)
+    )
+
+
+def _collect_links(matches: Iterable[Tuple[str, str]]) -> Dict[str, List[str]]:
+    """Sort (link type, raw target) pairs into the extract_all_links result."""
+    wikilinks = []
     markdown_links = []
-    for match in MARKDOWN_LINK.finditer(content):
-        url = match.group(2)
-        # Only include relative markdown links (not http/https)
-        if not url.startswith(('http://', 'https://')):
-            # Remove .md extension if present
-            if url.endswith('.md'):
-                url = url[:-3]
-            # Strip anchor references
-            if '#' in url:
-                url = url.split('#')[0]
-            url = url.strip()
-            if url:
-                markdown_links.append(url)
-
-    # Extract embeds (![[file]])
     embeds = []
-    for match in EMBED_PATTERN.finditer(content):
-        target = match.group(1)
-        # Strip anchor references
-        if '#' in target:
-            target = target.split('#')[0]
-        if '|' in target:
-            target = target.split('|')[0]
+
+    for kind, target in matches:
         target = target.strip()
-        if target:
+        if not target:
+            continue
+
+        if kind == "wiki":
+            wikilinks.append(target)
+        elif kind == "embed":
             embeds.append(target)
+        # Only include relative markdown links (not http/https)
+        elif not target.startswith(('http://', 'https://')):
+            # Remove .md extension if present
+            if target.endswith('.md'):
+                target = target[:-3]
+            markdown_links.append(target)
 
     # Combine all (deduplicated)
     all_links = list(set(wikilinks + markdown_links + embeds))
@@ -90,6 +117,16 @@ def extract_all_links(content: str, source_file: str) -> Dict[str, List[str]]:
     }
 
 
+def _iter_notes(vault_path: str) -> Iterator[Tuple[str, str, os.stat_result]]:
+    """Yield (absolute path, vault-relative path, stat) for every .md note."""
+    # Walked paths all start with the root plus a separator, so the relative
+    # path is a slice rather than an os.path.relpath call
+    prefix_len = len(os.path.join(vault_path, ''))
+    for file_path, stat in iter_markdown_files(vault_path):
+        if file_path.endswith('.md'):
+            yield file_path, file_path[prefix_len:], stat
+
+
 def find_note_by_name(vault_path: str, note_name: str) -> Optional[str]:
     """Find a note file by name (supports both with and without .md).
 
@@ -100,29 +137,14 @@ def find_note_by_name(vault_path: str, note_name: str) -> Optional[str]:
     Returns:
         Relative path to note from vault root, or None if not found
     """
-    vault_path = Path(vault_path)
-
-    # Try exact match first
-    candidates = [
-        note_name if note_name.endswith('.md') else f"{note_name}.md",
-        note_name[:-3] if note_name.endswith('.md') else note_name,
-    ]
-
-    for md_file in vault_path.rglob('*.md'):
-        # Skip .obsidian directory
-        if '.obsidian' in md_file.parts:
-            continue
+    # Normalize the query once; notes are compared without their .md
+    name = note_name[:-3] if note_name.endswith('.md') else note_name
 
-        relative_path = str(md_file.relative_to(vault_path))
-        file_name = md_file.stem
-
-        # Check if filename matches any candidate
-        for candidate in candidates:
-            if file_name == candidate or file_name == candidate.replace('.md', ''):
-                return relative_path
-            # Also check full relative path
-            if relative_path == candidate or relative_path.replace('.md', '') == candidate.replace('.md', ''):
-                return relative_path
+    # First note in walk order whose file name or relative path matches
+    for _, relative_path, _ in _iter_notes(os.fspath(vault_path)):
+        path_name = relative_path[:-3]
+        if path_name.rpartition(os.sep)[2] == name or path_name == name:
+            return relative_path
 
     return None
 
@@ -134,64 +156,228 @@ def find_note_by_name(vault_path: str, note_name: str) -> Optional[str]:
 def build_link_graph(vault_path: str) -> Dict[str, Dict[str, any]]:
     """Build complete link graph for vault.
 
+    Graphs are cached per vault and shared between callers, so the returned
+    graph must be treated as read-only. Later edits to notes are patched into
+    a copy, leaving graphs already returned unchanged.
+
     Args:
         vault_path: Root vault directory
 
     Returns:
         Graph dict: {file_path: {outlinks: [...], inlinks: [...], link_types: {...}}}
     """
-    vault_path = Path(vault_path)
-    graph = defaultdict(lambda: {
-        "outlinks": [],
-        "inlinks": [],
-        "link_types": {"wikilinks": 0, "markdown_links": 0, "embeds": 0},
-    })
+    return _load_link_graph(vault_path)[0]
 
-    # First pass: collect all files
-    all_notes = {}
-    for md_file in vault_path.rglob('*.md'):
-        if '.obsidian' in md_file.parts:
-            continue
-        relative_path = str(md_file.relative_to(vault_path))
-        note_name = md_file.stem
-        all_notes[note_name] = relative_path
-        all_notes[relative_path] = relative_path
-
-    # Second pass: extract links
-    for md_file in vault_path.rglob('*.md'):
-        if '.obsidian' in md_file.parts:
-            continue
 
-        relative_path = str(md_file.relative_to(vault_path))
+def _load_link_graph(vault_path: str) -> Tuple[Dict[str, Dict[str, any]], List[Dict[str, str]]]:
+    """Return the (possibly cached) link graph and broken links for a vault.
 
-        try:
-            with open(md_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-        except Exception:
-            continue
+    When the vault holds the same notes as the cached graph and only some were
+    edited, a copy of the cached graph is patched for just those notes; adding,
+    removing or renaming a note can change how every link resolves, so that
+    triggers a full rebuild.
+    """
+    vault_path = os.fspath(vault_path)
+    notes = list(_iter_notes(vault_path))
+
+    # Every note's (mtime_ns, size); any edit changes its stamp
+    stamps = {rel: (stat.st_mtime_ns, stat.st_size) for _, rel, stat in notes}
+    key = os.path.abspath(vault_path)
+
+    with _GRAPH_CACHE_LOCK:
+        cached = _GRAPH_CACHE.get(key)
+        if cached is not None:
+            cached_stamps, result, index = cached
+            if cached_stamps.keys() == stamps.keys():
+                edited = [note for note in notes if cached_stamps[note[1]] != stamps[note[1]]]
+                for note in edited:
+                    result = _relink_note(result, index, note)
+                _GRAPH_CACHE[key] = (stamps, result, index)
+                _GRAPH_CACHE.move_to_end(key)
+                return result
+
+    result, index = _build_link_graph(notes)
+
+    with _GRAPH_CACHE_LOCK:
+        _GRAPH_CACHE[key] = (stamps, result, index)
+        _GRAPH_CACHE.move_to_end(key)
+        if len(_GRAPH_CACHE) > _GRAPH_CACHE_SIZE:
+            _GRAPH_CACHE.popitem(last=False)
+
+    return result
+
+
+def _extract_note_links(note: Tuple[str, str, os.stat_result]) -> Optional[Dict[str, List[str]]]:
+    """Read one note and extract its links; None if it can't be read."""
+    md_file, relative_path, stat = note
+    # Stub notes are common; nothing shorter than [[x]] can hold a link
+    if stat.st_size < _MIN_LINK_BYTES:
+        return _NO_LINKS
+
+    # Unchanged notes reuse their links from an earlier build
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    with _NOTE_LINKS_CACHE_LOCK:
+        cached = _NOTE_LINKS_CACHE.get(md_file)
+        if cached is not None and cached[0] == stamp:
+            _NOTE_LINKS_CACHE.move_to_end(md_file)
+            return cached[1]
+
+    try:
+        with open(md_file, 'rb') as f:
+            content = f.read()
+    except OSError:
+        return None
+
+    links = extract_all_links_bytes(content, relative_path)
+
+    with _NOTE_LINKS_CACHE_LOCK:
+        _NOTE_LINKS_CACHE[md_file] = (stamp, links)
+        _NOTE_LINKS_CACHE.move_to_end(md_file)
+        if len(_NOTE_LINKS_CACHE) > _NOTE_LINKS_CACHE_SIZE:
+            _NOTE_LINKS_CACHE.popitem(last=False)
+
+    return links
+
+
+def _build_note_index(notes: List[Tuple[str, str, os.stat_result]]) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """Map every name a link may use for a note to its relative path.
+
+    A note is reachable by file name, relative path, and relative path without
+    .md; on collisions the first note in walk order wins, as in
+    find_note_by_name. The second dict is keyed by lowercased names for
+    case-insensitive fallback.
+    """
+    names: Dict[str, str] = {}
+    for _, relative_path, _ in notes:
+        names.setdefault(os.path.basename(relative_path)[:-3], relative_path)
+        names.setdefault(relative_path, relative_path)
+        names.setdefault(relative_path[:-3], relative_path)
 
-        links = extract_all_links(content, relative_path)
+    lower_names: Dict[str, str] = {}
+    for name, relative_path in names.items():
+        lower_names.setdefault(name.lower(), relative_path)
 
-        # Track link types
-        graph[relative_path]["link_types"]["wikilinks"] = len(links["wikilinks"])
-        graph[relative_path]["link_types"]["markdown_links"] = len(links["markdown_links"])
-        graph[relative_path]["link_types"]["embeds"] = len(links["embeds"])
+    return names, lower_names
 
-        # Resolve links to actual files
-        for link in links["all_links"]:
-            # Try to find target file
-            target_path = all_notes.get(link) or all_notes.get(link.replace('.md', ''))
 
-            if target_path:
-                # Add outlink from source
-                if target_path not in graph[relative_path]["outlinks"]:
-                    graph[relative_path]["outlinks"].append(target_path)
+def _build_link_graph(notes: List[Tuple[str, str, os.stat_result]]) -> Tuple[tuple, tuple]:
+    """Build the link graph for the notes from _iter_notes.
 
-                # Add inlink to target
-                if relative_path not in graph[target_path]["inlinks"]:
-                    graph[target_path]["inlinks"].append(relative_path)
+    Returns:
+        ((graph, broken links), (names, lower_names) from _build_note_index)
+    """
+    # Every note gets its entry up front, so the merge below never has to
+    # create one
+    graph = {
+        relative_path: {
+            "outlinks": [],
+            "inlinks": [],
+            "link_types": {"wikilinks": 0, "markdown_links": 0, "embeds": 0},
+        }
+        for _, relative_path, _ in notes
+    }
+    broken_links = []
 
-    return dict(graph)
+    # First pass: index all files by the names links can use
+    index = _build_note_index(notes)
+
+    # Second pass: extract links. Notes are read and parsed concurrently on
+    # large vaults; merging into the graph stays on this thread
+    if len(notes) >= _PARALLEL_EXTRACT_MIN_FILES:
+        extracted = _LINK_IO_EXECUTOR.map(_extract_note_links, notes)
+    else:
+        extracted = map(_extract_note_links, notes)
+
+    for (_, relative_path, _), links in zip(notes, extracted):
+        if links is not None:
+            node = graph[relative_path]
+            _link_note(node, broken_links, index, relative_path, links)
+            for target_path in node["outlinks"]:
+                graph[target_path]["inlinks"].append(relative_path)
+
+    return (graph, broken_links), index
+
+
+def _link_note(
+    node: Dict[str, any],
+    broken_links: List[Dict[str, str]],
+    index: Tuple[Dict[str, str], Dict[str, str]],
+    relative_path: str,
+    links: Dict[str, List[str]],
+) -> None:
+    """Fill in one note's link counts, outlinks and broken links.
+
+    The matching inlinks of the targets are left to the caller.
+    """
+    names, lower_names = index
+
+    # Track link types
+    link_types = node["link_types"]
+    link_types["wikilinks"] = len(links["wikilinks"])
+    link_types["markdown_links"] = len(links["markdown_links"])
+    link_types["embeds"] = len(links["embeds"])
+
+    # Resolve links to actual files; different spellings of one link
+    # (e.g. "Note" and "note.md") add a single edge
+    outlinks = node["outlinks"]
+    linked = set()
+    for link in links["all_links"]:
+        # Try to find target file
+        target_path = names.get(link)
+        if target_path is None:
+            name = link[:-3] if link.endswith('.md') else link
+            target_path = names.get(name) or lower_names.get(name.lower())
+
+        if target_path is None:
+            broken_links.append({
+                "source_file": relative_path,
+                "target": link,
+            })
+        elif target_path not in linked:
+            linked.add(target_path)
+            outlinks.append(target_path)
+
+
+def _relink_note(
+    result: Tuple[Dict[str, Dict[str, any]], List[Dict[str, str]]],
+    index: Tuple[Dict[str, str], Dict[str, str]],
+    note: Tuple[str, str, os.stat_result],
+) -> Tuple[Dict[str, Dict[str, any]], List[Dict[str, str]]]:
+    """Return a built graph with an edited note's outgoing edges and broken links replaced.
+
+    Only the nodes the note's edges touch are copied; the graph passed in,
+    and every node and list in it, is left as it was.
+    """
+    graph, broken_links = result
+    graph = dict(graph)
+    relative_path = note[1]
+    old_outlinks = graph[relative_path]["outlinks"]
+
+    # Rebuild the note's own node without what its previous version contributed
+    node = {
+        "outlinks": [],
+        "inlinks": graph[relative_path]["inlinks"],
+        "link_types": {"wikilinks": 0, "markdown_links": 0, "embeds": 0},
+    }
+    broken_links = [b for b in broken_links if b["source_file"] != relative_path]
+
+    links = _extract_note_links(note)
+    if links is not None:
+        _link_note(node, broken_links, index, relative_path, links)
+    graph[relative_path] = node
+
+    # Move the note's inlinks from its old targets to its new ones
+    for target_path in old_outlinks:
+        target = graph[target_path]
+        graph[target_path] = {
+            **target,
+            "inlinks": [path for path in target["inlinks"] if path != relative_path],
+        }
+    for target_path in node["outlinks"]:
+        target = graph[target_path]
+        graph[target_path] = {**target, "inlinks": target["inlinks"] + [relative_path]}
+
+    return graph, broken_links
 
 
 # ============================================================================
@@ -259,8 +445,7 @@ def analyze_link_health(vault_path: str) -> Dict[str, any]:
     Returns:
         Health metrics including broken links, orphaned notes, link density
     """
-    vault_path = Path(vault_path)
-    graph = build_link_graph(vault_path)
+    graph, broken_links = _load_link_graph(vault_path)
 
     # Count notes
     total_notes = len(graph)
@@ -283,33 +468,6 @@ def analyze_link_health(vault_path: str) -> Dict[str, any]:
     avg_outlinks = total_outlinks / total_notes if total_notes > 0 else 0
     avg_inlinks = total_inlinks / total_notes if total_notes > 0 else 0
 
-    # Find broken links
-    broken_links = []
-    all_notes = set(graph.keys())
-
-    for source_path in vault_path.rglob('*.md'):
-        if '.obsidian' in source_path.parts:
-            continue
-
-        relative_source = str(source_path.relative_to(vault_path))
-
-        try:
-            with open(source_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-        except Exception:
-            continue
-
-        links = extract_all_links(content, relative_source)
-
-        for link in links["all_links"]:
-            # Check if link target exists
-            target_path = find_note_by_name(str(vault_path), link)
-            if not target_path or target_path not in all_notes:
-                broken_links.append({
-                    "source_file": relative_source,
-                    "target": link,
-                })
-
     return {
         "total_notes": total_notes,
         "total_links": total_outlinks,
@@ -351,21 +509,18 @@ def get_note_connections(vault_path: str, note_name: str, depth: int = 1) -> Dic
 
     data = graph[note_path]
 
-    # Build multi-level connections
+    # Build multi-level connections breadth-first, so every note is recorded
+    # at its shortest distance from the target note
     connections = {}
-    visited = set()
+    frontier = deque((outlink, 1) for outlink in data["outlinks"]) if depth >= 1 else deque()
+    queued = set(data["outlinks"])
 
-    def explore_connections(current_path: str, current_depth: int):
-        """Recursively explore connections."""
-        if current_depth > depth or current_path in visited:
-            return
+    while frontier:
+        current_path, current_depth = frontier.popleft()
 
-        visited.add(current_path)
-
-        if current_path not in graph:
-            return
-
-        current_data = graph[current_path]
+        current_data = graph.get(current_path)
+        if current_data is None:
+            continue
 
         connections[current_path] = {
             "depth": current_depth,
@@ -373,13 +528,11 @@ def get_note_connections(vault_path: str, note_name: str, depth: int = 1) -> Dic
             "outlinks": current_data["outlinks"],
         }
 
-        # Recurse on outlinks
-        for outlink in current_data["outlinks"]:
-            explore_connections(outlink, current_depth + 1)
-
-    # Start exploration from target note
-    for outlink in data["outlinks"]:
-        explore_connections(outlink, 1)
+        if current_depth < depth:
+            for outlink in current_data["outlinks"]:
+                if outlink not in queued:
+                    queued.add(outlink)
+                    frontier.append((outlink, current_depth + 1))
 
     return {
         "note": note_path,
@@ -7,8 +7,10 @@ constitutional principles.
 
 import os
 import re
-import frontmatter
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
+
+from ..utils.file_utils import atomic_write
+from ..utils.frontmatter_utils import read_note_frontmatter, write_note_frontmatter
 
 
 def insert_after_heading(filepath: str, heading: str, content: str) -> Dict[str, Any]:
@@ -65,9 +67,8 @@ def insert_after_heading(filepath: str, heading: str, content: str) -> Dict[str,
     # Insert the content
     lines.insert(insert_index, content)
 
-    # Write back to file
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.writelines(lines)
+    # Write back to file atomically
+    atomic_write(filepath, ''.join(lines))
 
     return {
         "success": True,
@@ -134,9 +135,8 @@ def insert_after_block(filepath: str, block_id: str, content: str) -> Dict[str,
     # Insert the content
     lines.insert(insert_index, content)
 
-    # Write back to file
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.writelines(lines)
+    # Write back to file atomically
+    atomic_write(filepath, ''.join(lines))
 
     return {
         "success": True,
@@ -171,26 +171,109 @@ def update_frontmatter_field(filepath: str, field: str, value: Any) -> Dict[str,
         >>> update_frontmatter_field("note.md", "tags", ["python", "code"])
         {"success": True, "message": "Updated frontmatter field 'tags'"}
     """
-    if not os.path.exists(filepath):
-        raise FileNotFoundError(f"File not found: {filepath}")
+    update_frontmatter_fields(filepath, updates={field: value})
 
-    # Read the file
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
+    return {
+        "success": True,
+        "message": f"Updated frontmatter field '{field}'"
+    }
+
+
+def update_frontmatter_fields(
+    filepath: str,
+    updates: Optional[Dict[str, Any]] = None,
+    tags_add: Optional[List[str]] = None,
+    tags_remove: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """
+    Apply several frontmatter mutations in a single read-parse-write cycle.
+
+    Field updates are applied first, then tag removals, then tag additions.
+    Tags already present are not added twice and tags not present are ignored
+    on removal. If the note has no frontmatter, it will be created.
+
+    Args:
+        filepath: Path to the markdown file
+        updates: Fields to update/add (field name -> value)
+        tags_add: Tags to add to the 'tags' field (without # symbol)
+        tags_remove: Tags to remove from the 'tags' field (without # symbol)
+
+    Returns:
+        Dictionary with:
+            - success: Boolean indicating if operation succeeded
+            - message: Descriptive message
+            - updated_fields: Names of fields that were set
+            - tags_added: Tags that were actually added
+            - tags_removed: Tags that were actually removed
+            - tags: Resulting 'tags' list, or None if the note has no tags field
 
-    # Parse frontmatter using python-frontmatter
-    post = frontmatter.loads(content)
+    Raises:
+        FileNotFoundError: If the file doesn't exist
 
-    # Update or add the field
-    post.metadata[field] = value
+    Examples:
+        >>> update_frontmatter_fields("note.md", {"status": "done"}, tags_add=["archived"])
+        {"success": True, "message": "Updated 1 field(s), added 1 tag(s), removed 0 tag(s)", ...}
+    """
+    if not os.path.exists(filepath):
+        raise FileNotFoundError(f"File not found: {filepath}")
 
-    # Write back to file
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(frontmatter.dumps(post))
+    # Read the file and parse only the frontmatter block
+    content, metadata, body_start = read_note_frontmatter(filepath)
+
+    # Update or add fields
+    updated_fields = list(updates or {})
+    if updates:
+        metadata.update(updates)
+
+    tags_added = []
+    tags_removed = []
+
+    if tags_add or tags_remove:
+        # Get existing tags
+        if 'tags' in metadata:
+            tags_value = metadata['tags']
+            if isinstance(tags_value, list):
+                existing_tags = tags_value
+            else:
+                existing_tags = [tags_value]
+        else:
+            existing_tags = None
+
+        if existing_tags is not None:
+            for tag in tags_remove or []:
+                if tag in existing_tags:
+                    existing_tags.remove(tag)
+                    tags_removed.append(tag)
+
+        for tag in tags_add or []:
+            if existing_tags is None:
+                existing_tags = []
+            if tag not in existing_tags:
+                existing_tags.append(tag)
+                tags_added.append(tag)
+
+        if tags_added or tags_removed:
+            # If no tags left, keep empty list
+            metadata['tags'] = existing_tags
+
+    # Splice the new frontmatter back in front of the untouched body
+    if updated_fields or tags_added or tags_removed:
+        write_note_frontmatter(filepath, content, metadata, body_start)
+
+    tags = metadata.get('tags')
+    if tags is not None and not isinstance(tags, list):
+        tags = [tags]
 
     return {
         "success": True,
-        "message": f"Updated frontmatter field '{field}'"
+        "message": (
+            f"Updated {len(updated_fields)} field(s), added {len(tags_added)} tag(s), "
+            f"removed {len(tags_removed)} tag(s)"
+        ),
+        "updated_fields": updated_fields,
+        "tags_added": tags_added,
+        "tags_removed": tags_removed,
+        "tags": tags
     }
 
 
@@ -6,11 +6,15 @@ following the Performance-First and Filesystem-Native constitutional principles.
 
 import os
 import re
+from itertools import chain
 from pathlib import Path
 from typing import Dict, Any, List
 from datetime import datetime
 import frontmatter
 
+from ..utils.vault_cache import load_cache, save_cache
+from ..utils.vault_walk import iter_markdown_files
+
 
 # Compiled regex patterns for performance
 WIKILINK_PATTERN = re.compile(r'\[\[([^\]]+)\]\]')
@@ -19,6 +23,14 @@ TAG_PATTERN = re.compile(r'(?:^|\s)#([a-zA-Z0-9_/-]+)')
 HEADING_PATTERN = re.compile(r'^(#{1,6})\s+(.+)$', re.MULTILINE)
 CODE_BLOCK_PATTERN = re.compile(r'```[\s\S]*?```', re.MULTILINE)
 INLINE_CODE_PATTERN = re.compile(r'`([^`]+)`')
+# A maximal run of word characters is always bounded by \b on both sides, so
+# this counts exactly what r'\b\w+\b' does without the boundary assertions
+WORD_PATTERN = re.compile(r'\w+')
+
+# Persistent per-note stats cache, keyed on relative path and validated
+# against (mtime_ns, size) so unchanged notes are never re-read
+STATS_CACHE_FILENAME = "stats_cache.json"
+STATS_CACHE_VERSION = 1
 
 
 def get_note_stats(filepath: str) -> Dict[str, Any]:
@@ -61,19 +73,21 @@ def get_note_stats(filepath: str) -> Dict[str, Any]:
     post = frontmatter.loads(full_content)
     content = post.content  # Content without frontmatter
 
-    # Count lines
-    line_count = len(full_content.split('\n'))
+    # Count lines (count separators instead of materializing the split list)
+    line_count = full_content.count('\n') + 1
 
     # Character counts
     character_count = len(full_content)
-    character_count_no_spaces = len(full_content.replace(' ', '').replace('\t', ''))
+    character_count_no_spaces = (
+        character_count - full_content.count(' ') - full_content.count('\t')
+    )
 
     # Remove code blocks for word counting
     content_without_code = CODE_BLOCK_PATTERN.sub('', content)
 
-    # Word count (excluding frontmatter and code blocks)
-    words = re.findall(r'\b\w+\b', content_without_code)
-    word_count = len(words)
+    # Word count (excluding frontmatter and code blocks); subn counts matches
+    # in C without building a list of word strings
+    word_count = WORD_PATTERN.subn('', content_without_code)[1]
 
     # Extract wikilinks
     wikilinks = []
@@ -117,13 +131,8 @@ def get_note_stats(filepath: str) -> Dict[str, Any]:
         tag = match.group(1)
         inline_tags.append(tag)
 
-    # Combine and deduplicate tags
-    all_tags = []
-    seen = set()
-    for tag in frontmatter_tags + inline_tags:
-        if tag not in seen:
-            seen.add(tag)
-            all_tags.append(tag)
+    # Combine and deduplicate tags (dict preserves insertion order)
+    all_tags = list(dict.fromkeys(chain(frontmatter_tags, inline_tags)))
 
     # Extract headings
     headings_by_level = {}
@@ -197,6 +206,8 @@ def get_vault_stats(vault_path: str) -> Dict[str, Any]:
 
     Walks through the vault directory, analyzes all markdown files (excluding .obsidian),
     and aggregates statistics. Uses generator-based iteration for memory efficiency.
+    Per-note results are cached in .obsidian/mcp_cache/ keyed on (path, mtime, size),
+    so only notes changed since the previous call are re-analyzed.
 
     Args:
         vault_path: Path to vault root directory
@@ -225,35 +236,58 @@ def get_vault_stats(vault_path: str) -> Dict[str, Any]:
     total_links = 0
     all_tags_set = set()
 
-    # Walk through vault directory
-    for root, dirs, files in os.walk(vault_path):
-        # Skip .obsidian directory
-        if '.obsidian' in root:
-            continue
+    cache = load_cache(vault_path, STATS_CACHE_FILENAME, STATS_CACHE_VERSION)
+    cached_files = cache["files"] if cache else {}
+    files = {}
+    changed = False
 
-        # Filter to only .md files
-        md_files = [f for f in files if f.endswith('.md')]
+    # Walked paths are always children of vault_path, so slice off the
+    # prefix instead of calling os.path.relpath per file
+    prefix_len = len(vault_path.rstrip(os.sep)) + 1
 
-        for filename in md_files:
-            filepath = os.path.join(root, filename)
+    # Walk through vault directory (scandir-based, skips .obsidian)
+    for filepath, stat in iter_markdown_files(vault_path):
+        # Stats cover .md notes only; the shared walker also yields .markdown
+        if not filepath.endswith('.md'):
+            continue
+        relative_path = filepath[prefix_len:]
+        entry = cached_files.get(relative_path)
 
+        if (entry is None
+                or entry["mtime_ns"] != stat.st_mtime_ns
+                or entry["size"] != stat.st_size):
             try:
-                # Get stats for this note
+                # Cache miss: get stats for this note
                 note_stats = get_note_stats(filepath)
-
-                # Aggregate stats
-                total_notes += 1
-                total_words += note_stats['word_count']
-                total_links += note_stats['links']['total_links']
-
-                # Collect tags
-                for tag in note_stats['tags']['unique_tags']:
-                    all_tags_set.add(tag)
-
             except Exception:
                 # Skip files that can't be processed
                 continue
 
+            entry = {
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "word_count": note_stats['word_count'],
+                "total_links": note_stats['links']['total_links'],
+                "tags": note_stats['tags']['unique_tags']
+            }
+            changed = True
+
+        files[relative_path] = entry
+
+        # Aggregate stats
+        total_notes += 1
+        total_words += entry['word_count']
+        total_links += entry['total_links']
+
+        # Collect tags
+        all_tags_set.update(entry['tags'])
+
+    if changed or len(files) != len(cached_files):
+        save_cache(vault_path, STATS_CACHE_FILENAME, {
+            "version": STATS_CACHE_VERSION,
+            "files": files
+        })
+
     # Calculate average words per note
     avg_words = total_words / total_notes if total_notes > 0 else 0.0
 
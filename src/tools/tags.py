@@ -6,20 +6,26 @@ constitutional principles.
 """
 
 import os
-import frontmatter
-from typing import List, Dict
+from itertools import chain
+from typing import List, Dict, Union
 from pathlib import Path
 
-from ..utils.patterns import TAG_PATTERN
-from ..utils.validators import is_markdown_file
+from ..utils.patterns import TAG_PATTERN, TAG_PATTERN_BYTES
+from ..utils.frontmatter_utils import parse_frontmatter, read_frontmatter_head
+from ..utils.tag_index import refresh_index
+from .smart_insert import update_frontmatter_fields
 
 
-def extract_all_tags(content: str) -> Dict[str, List[str]]:
+def extract_all_tags(content: Union[str, bytes]) -> Dict[str, List[str]]:
     """
     Extract all tags (frontmatter and inline) from markdown content.
 
+    Raw UTF-8 bytes are accepted as well: inline tags are then matched with a
+    bytes pattern and only the captured tags and the frontmatter block are
+    decoded, never the full note.
+
     Args:
-        content: Markdown content string
+        content: Markdown content string or raw UTF-8 bytes
 
     Returns:
         Dictionary with:
@@ -40,10 +46,9 @@ def extract_all_tags(content: str) -> Dict[str, List[str]]:
     frontmatter_tags = []
     inline_tags = []
 
-    # Parse frontmatter using python-frontmatter
+    # Parse only the frontmatter block
     try:
-        post = frontmatter.loads(content)
-        metadata = post.metadata
+        metadata, _ = parse_frontmatter(content)
 
         # Extract from 'tags' field (list or string)
         if 'tags' in metadata:
@@ -65,18 +70,14 @@ def extract_all_tags(content: str) -> Dict[str, List[str]]:
         # If frontmatter parsing fails, continue with empty frontmatter tags
         pass
 
-    # Extract inline tags using TAG_PATTERN
-    for match in TAG_PATTERN.finditer(content):
-        tag = match.group(1)  # Capture group without the #
-        inline_tags.append(tag)
+    # Extract inline tags (capture group without the #)
+    if isinstance(content, bytes):
+        inline_tags = [tag.decode('ascii') for tag in TAG_PATTERN_BYTES.findall(content)]
+    else:
+        inline_tags = TAG_PATTERN.findall(content)
 
     # Deduplicate all_tags while preserving order
-    seen = set()
-    all_tags = []
-    for tag in frontmatter_tags + inline_tags:
-        if tag not in seen:
-            seen.add(tag)
-            all_tags.append(tag)
+    all_tags = list(dict.fromkeys(chain(frontmatter_tags, inline_tags)))
 
     return {
         "frontmatter_tags": frontmatter_tags,
@@ -107,38 +108,27 @@ def add_tag_to_frontmatter(filepath: str, tag: str) -> Dict[str, any]:
     if not os.path.exists(filepath):
         raise FileNotFoundError(f"File not found: {filepath}")
 
-    # Read the file
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    # Parse frontmatter
-    post = frontmatter.loads(content)
+    # Probe the frontmatter block alone: the tag can only already exist if
+    # its bytes appear there, and then the block is all that needs parsing
+    head = read_frontmatter_head(filepath)
+    if head and tag.encode('utf-8') in head:
+        metadata, _ = parse_frontmatter(head)
+        tags_value = metadata.get('tags')
+        if tag in (tags_value if isinstance(tags_value, list) else [tags_value]):
+            return {
+                "success": True,
+                "message": f"Tag '{tag}' already exists in frontmatter"
+            }
 
-    # Get existing tags
-    if 'tags' in post.metadata:
-        tags_value = post.metadata['tags']
-        if isinstance(tags_value, list):
-            existing_tags = tags_value
-        else:
-            existing_tags = [tags_value]
-    else:
-        existing_tags = []
+    result = update_frontmatter_fields(filepath, tags_add=[tag])
 
-    # Check if tag already exists
-    if tag in existing_tags:
+    # Check if tag already existed
+    if not result["tags_added"]:
         return {
             "success": True,
             "message": f"Tag '{tag}' already exists in frontmatter"
         }
 
-    # Add the new tag
-    existing_tags.append(tag)
-    post.metadata['tags'] = existing_tags
-
-    # Write back to file
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(frontmatter.dumps(post))
-
     return {
         "success": True,
         "message": f"Added tag '{tag}' to frontmatter"
@@ -164,47 +154,38 @@ def remove_tag_from_frontmatter(filepath: str, tag: str) -> Dict[str, any]:
     if not os.path.exists(filepath):
         raise FileNotFoundError(f"File not found: {filepath}")
 
-    # Read the file
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
+    # Probe the frontmatter block with bytes searches first: if it has no
+    # 'tags' key or doesn't contain the tag at all, removal is a no-op and
+    # the YAML never needs to be parsed. Quoted and escaped scalars can spell
+    # a tag differently from its value, so those headers are always parsed
+    head = read_frontmatter_head(filepath)
+    if head is not None and not any(ch in head for ch in (b'"', b"'", b'\\')):
+        if b'tags' not in head:
+            return {
+                "success": True,
+                "message": "No tags found in frontmatter"
+            }
+        if tag.encode('utf-8') not in head:
+            return {
+                "success": True,
+                "message": f"Tag '{tag}' not found in frontmatter"
+            }
 
-    # Parse frontmatter
-    post = frontmatter.loads(content)
+    result = update_frontmatter_fields(filepath, tags_remove=[tag])
 
-    # Get existing tags
-    if 'tags' not in post.metadata:
+    if result["tags"] is None:
         return {
             "success": True,
             "message": f"No tags found in frontmatter"
         }
 
-    tags_value = post.metadata['tags']
-    if isinstance(tags_value, list):
-        existing_tags = tags_value
-    else:
-        existing_tags = [tags_value]
-
-    # Check if tag exists
-    if tag not in existing_tags:
+    # Check if tag existed
+    if not result["tags_removed"]:
         return {
             "success": True,
             "message": f"Tag '{tag}' not found in frontmatter"
         }
 
-    # Remove the tag
-    existing_tags.remove(tag)
-
-    # Update or remove tags field
-    if existing_tags:
-        post.metadata['tags'] = existing_tags
-    else:
-        # If no tags left, keep empty list
-        post.metadata['tags'] = []
-
-    # Write back to file
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(frontmatter.dumps(post))
-
     return {
         "success": True,
         "message": f"Removed tag '{tag}' from frontmatter"
@@ -215,6 +196,10 @@ def find_notes_by_tag(vault_path: str, tag: str) -> List[Dict[str, any]]:
     """
     Find all notes containing a specific tag (frontmatter or inline).
 
+    Lookups go through the persistent inverted tag index in
+    .obsidian/mcp_cache/, so only notes changed since the last search
+    are re-read.
+
     Args:
         vault_path: Absolute path to the vault root directory
         tag: Tag to search for (with or without # symbol)
@@ -238,44 +223,19 @@ def find_notes_by_tag(vault_path: str, tag: str) -> List[Dict[str, any]]:
     # Normalize tag (remove # if present)
     search_tag = tag.lstrip('#')
 
-    results = []
+    # Refresh the persistent tag index (re-reads only changed notes)
+    index = refresh_index(vault_path)
 
-    # Traverse vault directory
-    for root, dirs, files in os.walk(vault_path):
-        # Skip .obsidian directory
-        dirs[:] = [d for d in dirs if d != ".obsidian"]
-
-        for filename in files:
-            # Only process markdown files
-            if not is_markdown_file(filename):
-                continue
-
-            file_path = os.path.join(root, filename)
-            relative_path = os.path.relpath(file_path, vault_path)
-
-            # Read file and extract tags
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-
-                tags_info = extract_all_tags(content)
-
-                # Check if tag is present
-                found_in_frontmatter = search_tag in tags_info["frontmatter_tags"]
-                found_in_inline = search_tag in tags_info["inline_tags"]
-
-                if found_in_frontmatter or found_in_inline:
-                    results.append({
-                        "file": relative_path,
-                        "absolute_path": file_path,
-                        "tag_locations": {
-                            "frontmatter": found_in_frontmatter,
-                            "inline": found_in_inline
-                        }
-                    })
-
-            except (FileNotFoundError, PermissionError, UnicodeDecodeError):
-                # Skip files that can't be read
-                continue
+    results = []
+    for relative_path in index["tags"].get(search_tag, []):
+        entry = index["files"][relative_path]
+        results.append({
+            "file": relative_path,
+            "absolute_path": os.path.join(vault_path, relative_path),
+            "tag_locations": {
+                "frontmatter": search_tag in entry["frontmatter_tags"],
+                "inline": search_tag in entry["inline_tags"]
+            }
+        })
 
     return results
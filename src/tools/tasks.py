@@ -15,11 +15,7 @@ from pydantic import Field
 
 from ..models.obsidian import Task
 from ..utils.patterns import (
-    TASK_DUE_DATE,
-    TASK_SCHEDULED,
-    TASK_START,
-    TASK_DONE,
-    TASK_CREATED,
+    TASK_DATE_FIELD,
     TASK_PRIORITY,
     TASK_RECURRENCE,
     TASK_CHECKBOX,
@@ -37,6 +33,17 @@ PRIORITY_EMOJI_MAP = {
 
 EMOJI_PRIORITY_MAP = {v: k for k, v in PRIORITY_EMOJI_MAP.items()}
 
+# Date field emoji mapping (matched by TASK_DATE_FIELD)
+EMOJI_DATE_FIELD_MAP = {
+    "📅": "due_date",
+    "📆": "due_date",
+    "🗓": "due_date",
+    "⏳": "scheduled_date",
+    "🛫": "start_date",
+    "✅": "done_date",
+    "➕": "created_date",
+}
+
 
 def parse_task_line(line: str, line_number: int, source_file: str) -> Optional[Task]:
     """Parse a task line into a Task object.
@@ -64,38 +71,39 @@ def parse_task_line(line: str, line_number: int, source_file: str) -> Optional[T
     remaining_text = task_content.strip()
     metadata = {}
 
-    # Extract dates
-    for pattern_name, pattern in [
-        ("done_date", TASK_DONE),
-        ("due_date", TASK_DUE_DATE),
-        ("scheduled_date", TASK_SCHEDULED),
-        ("start_date", TASK_START),
-        ("created_date", TASK_CREATED),
-    ]:
-        match = pattern.search(remaining_text)
+    # Peel metadata fields off the end of the line in whatever order they
+    # appear; each field is taken at most once
+    while True:
+        # Extract dates (one combined scan covers every date field)
+        match = TASK_DATE_FIELD.search(remaining_text)
         if match:
+            field = EMOJI_DATE_FIELD_MAP[match.group(1)]
+            if field in metadata:
+                break
             try:
-                metadata[pattern_name] = datetime.strptime(match.group(1), "%Y-%m-%d").date()
-                # Remove match from content
-                remaining_text = remaining_text[: match.start()].rstrip()
+                metadata[field] = datetime.strptime(match.group(2), "%Y-%m-%d").date()
             except ValueError:
-                # Invalid date format, ignore
-                pass
-
-    # Extract priority
-    priority_match = TASK_PRIORITY.search(remaining_text)
-    if priority_match:
-        emoji = priority_match.group(1)
-        metadata["priority"] = EMOJI_PRIORITY_MAP.get(emoji, "normal")
-        remaining_text = remaining_text[: priority_match.start()].rstrip()
-    else:
-        metadata["priority"] = "normal"
-
-    # Extract recurrence
-    recurrence_match = TASK_RECURRENCE.search(remaining_text)
-    if recurrence_match:
-        metadata["recurrence"] = recurrence_match.group(1).strip()
-        remaining_text = remaining_text[: recurrence_match.start()].rstrip()
+                # Invalid date format, leave it in the content
+                break
+            # Remove match from content
+            remaining_text = remaining_text[: match.start()].rstrip()
+            continue
+
+        # Extract priority
+        match = TASK_PRIORITY.search(remaining_text)
+        if match and "priority" not in metadata:
+            metadata["priority"] = EMOJI_PRIORITY_MAP.get(match.group(1), "normal")
+            remaining_text = remaining_text[: match.start()].rstrip()
+            continue
+
+        # Extract recurrence
+        match = TASK_RECURRENCE.search(remaining_text)
+        if match and "recurrence" not in metadata:
+            metadata["recurrence"] = match.group(1).strip()
+            remaining_text = remaining_text[: match.start()].rstrip()
+            continue
+
+        break
 
     # Extract tags
     tags = [match.group(1) for match in TAG_PATTERN.finditer(remaining_text)]
@@ -13,11 +13,51 @@ Template Syntax:
 All operations are filesystem-native for maximum performance and offline capability.
 """
 
+import asyncio
 import os
 import re
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Optional, Any
+from typing import Dict, List, Optional, Tuple, Any
+
+from ..utils.file_utils import atomic_create
+from ..utils.vault_walk import iter_markdown_files
+
+
+# Template placeholder: {{name}} or {{ name }}
+# Captures: variable name without surrounding whitespace
+_TEMPLATE_VAR_RE = re.compile(r'\{\{\s*([^}\s][^}]*?)\s*\}\}')
+
+# Same placeholder, also capturing the whole token, for re.split
+# Split output: [text, token, name, text, token, name, ..., text]
+_TEMPLATE_SPLIT_RE = re.compile(r'(\{\{\s*([^}\s][^}]*?)\s*\}\})')
+
+# Built-in date/time variables -> strftime format
+_BUILTIN_DATE_FORMATS = {
+    "date": "%Y-%m-%d",
+    "time": "%H:%M:%S",
+    "datetime": "%Y-%m-%d %H:%M:%S",
+    "year": "%Y",
+    "month": "%m",
+    "day": "%d",
+}
+
+# Maximum distinct placeholders substituted via str.replace instead of re.sub
+_FAST_PATH_MAX_TOKENS = 8
+
+# LRU cache of template contents: path -> ((mtime_ns, size), content)
+_TEMPLATE_CACHE: "OrderedDict[str, tuple]" = OrderedDict()
+_TEMPLATE_CACHE_SIZE = 128
+
+# Worker pool for template metadata reads, so concurrent reads overlap
+# instead of blocking the event loop one file at a time
+_TEMPLATE_IO_EXECUTOR = ThreadPoolExecutor(
+    max_workers=min(32, (os.cpu_count() or 1) * 4),
+    thread_name_prefix="template-io",
+)
 
 
 # ============================================================================
@@ -43,40 +83,78 @@ def expand_template_variables(
         >>> expand_template_variables("Hello {{name}}!", {"name": "World"})
         'Hello World!'
     """
-    variables = variables or {}
-
-    # Add built-in variables
-    now = datetime.now()
-    built_in = {
-        "date": now.strftime("%Y-%m-%d"),
-        "time": now.strftime("%H:%M:%S"),
-        "datetime": now.strftime("%Y-%m-%d %H:%M:%S"),
-        "year": now.strftime("%Y"),
-        "month": now.strftime("%m"),
-        "day": now.strftime("%d"),
-    }
-
-    # Add title from filename if provided
-    if filename:
-        title = Path(filename).stem
-        built_in["title"] = title
-
-    # Merge variables (user variables override built-ins)
-    all_variables = {**built_in, **variables}
+    # Nothing to expand (e.g. static boilerplate, with or without variables):
+    # a single substring check skips the scan, the clock and all lookups
+    if '{{' not in template_content:
+        return template_content
 
-    # Replace all {{variable}} patterns
-    def replace_var(match):
-        var_name = match.group(1).strip()
-        return all_variables.get(var_name, match.group(0))
-
-    content = re.sub(r'\{\{([^}]+)\}\}', replace_var, template_content)
+    variables = variables or {}
 
-    return content
+    # Built-in variables are resolved lazily, only when a placeholder actually
+    # references them, against a single timestamp for the whole expansion
+    # (the clock itself is only read once a date variable is needed)
+    built_in = {}
+    now = []
+
+    def resolve(var_name):
+        # Lookup chain instead of a merged dict: user variables override
+        # built-ins, and neither mapping is copied
+        value = variables.get(var_name)
+        if value is not None:
+            return value
+        if var_name not in built_in:
+            if var_name in _BUILTIN_DATE_FORMATS:
+                if not now:
+                    now.append(datetime.now())
+                built_in[var_name] = now[0].strftime(_BUILTIN_DATE_FORMATS[var_name])
+            elif var_name == "title" and filename:
+                # Add title from filename if provided
+                built_in[var_name] = Path(filename).stem
+            else:
+                built_in[var_name] = None
+        return built_in[var_name]
+
+    # Fast path: a handful of distinct placeholders that all resolve are
+    # substituted with str.replace, avoiding a Python callback per match
+    tokens = {m.group(0): m.group(1) for m in _TEMPLATE_VAR_RE.finditer(template_content)}
+    if len(tokens) <= _FAST_PATH_MAX_TOKENS:
+        resolved = {}
+        for token, var_name in tokens.items():
+            value = resolve(var_name)
+            # Values containing braces could form new placeholders mid-replace
+            if value is None or '{' in var_name or '{' in value:
+                break
+            resolved[token] = value
+        else:
+            for token, value in resolved.items():
+                template_content = template_content.replace(token, value)
+            return template_content
+
+    # General path: split once in C, resolve each distinct name once, then
+    # rejoin, so there is no Python callback per placeholder. Unknown
+    # placeholders are kept as-is.
+    parts = _TEMPLATE_SPLIT_RE.split(template_content)
+    tokens = parts[1::3]
+    names = parts[2::3]
+
+    resolved = {}
+    for var_name in set(names):
+        value = resolve(var_name)
+        if value is not None:
+            resolved[var_name] = value
+
+    pieces = [None] * (2 * len(tokens) + 1)
+    pieces[0::2] = parts[0::3]
+    pieces[1::2] = [resolved.get(name, token) for token, name in zip(tokens, names)]
+    return ''.join(pieces)
 
 
 def read_template(template_path: str) -> str:
     """Read template file content.
 
+    Contents are cached (LRU, keyed on path and validated against the file's
+    mtime and size), so repeatedly used templates are only read once.
+
     Args:
         template_path: Absolute path to template file
 
@@ -86,18 +164,38 @@ def read_template(template_path: str) -> str:
     Raises:
         FileNotFoundError: If template doesn't exist
     """
-    if not os.path.exists(template_path):
+    try:
+        stats = os.stat(template_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Template not found: {template_path}")
+
+    # Serve from cache while the file is unchanged on disk
+    key = (stats.st_mtime_ns, stats.st_size)
+    cached = _TEMPLATE_CACHE.get(template_path)
+    if cached is not None and cached[0] == key:
+        _TEMPLATE_CACHE.move_to_end(template_path)
+        return cached[1]
+
+    # The stat above doubles as the existence check; a template removed since
+    # then surfaces through open's own FileNotFoundError
+    try:
+        content = Path(template_path).read_text(encoding='utf-8')
+    except FileNotFoundError:
         raise FileNotFoundError(f"Template not found: {template_path}")
 
-    with open(template_path, 'r', encoding='utf-8') as f:
-        return f.read()
+    _TEMPLATE_CACHE[template_path] = (key, content)
+    _TEMPLATE_CACHE.move_to_end(template_path)
+    if len(_TEMPLATE_CACHE) > _TEMPLATE_CACHE_SIZE:
+        _TEMPLATE_CACHE.popitem(last=False)
+
+    return content
 
 
 def write_from_template(
     template_path: str,
     target_path: str,
     variables: Optional[Dict[str, str]] = None,
-) -> None:
+) -> str:
     """Create a file from a template.
 
     Args:
@@ -105,25 +203,54 @@ def write_from_template(
         target_path: Path for new file
         variables: Variables to expand
 
+    Returns:
+        The expanded content written to the new file
+
     Raises:
         FileNotFoundError: If template doesn't exist
         FileExistsError: If target already exists
     """
-    if os.path.exists(target_path):
-        raise FileExistsError(f"Target file already exists: {target_path}")
-
     template_content = read_template(template_path)
 
     # Expand variables
     filename = os.path.basename(target_path)
     expanded = expand_template_variables(template_content, variables, filename)
 
-    # Create parent directories if needed
-    os.makedirs(os.path.dirname(target_path), exist_ok=True)
+    # Create the target atomically; parent directories are created on demand
+    try:
+        atomic_create(target_path, expanded)
+    except FileExistsError:
+        raise FileExistsError(f"Target file already exists: {target_path}")
+
+    return expanded
+
+
+def _list_template_files(template_folder: str) -> List[Tuple[str, os.stat_result]]:
+    """List (path, stat) for every .md template under template_folder."""
+    return [
+        (full_path, stats)
+        for full_path, stats in iter_markdown_files(template_folder)
+        if full_path.endswith('.md')
+    ]
+
 
-    # Write to target
-    with open(target_path, 'w', encoding='utf-8') as f:
-        f.write(expanded)
+def _scan_template(full_path: str, stats: os.stat_result, relative_path: str) -> Dict[str, Any]:
+    """Build the listing entry for a single template file."""
+    # Read first line for description (bounded raw read, no text wrapper)
+    try:
+        with open(full_path, 'rb') as f:
+            raw = f.read(512)
+        first_line = raw.split(b'\n', 1)[0].decode('utf-8', errors='replace').strip()
+    except Exception:
+        first_line = ""
+
+    return {
+        "name": os.path.basename(full_path),
+        "path": relative_path,
+        "size_bytes": stats.st_size,
+        "modified": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(stats.st_mtime)),
+        "first_line": first_line,
+    }
 
 
 # ============================================================================
@@ -203,11 +330,7 @@ async def create_note_from_template_fs_tool(
         target_path = os.path.join(vault, target_path)
 
     try:
-        write_from_template(template_path, target_path, variables)
-
-        # Read back the created file
-        with open(target_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = write_from_template(template_path, target_path, variables)
 
         return {
             "success": True,
@@ -247,33 +370,30 @@ async def list_templates_fs_tool(
     if not os.path.exists(template_folder):
         raise ValueError(f"Template folder not found: {template_folder}")
 
-    templates = []
-    for root, dirs, files in os.walk(template_folder):
-        for filename in files:
-            if filename.endswith('.md'):
-                full_path = os.path.join(root, filename)
-                relative_path = os.path.relpath(full_path, vault)
-
-                # Get file stats
-                stats = os.stat(full_path)
-
-                # Read first line for description
-                try:
-                    with open(full_path, 'r', encoding='utf-8') as f:
-                        first_line = f.readline().strip()
-                except Exception:
-                    first_line = ""
-
-                templates.append({
-                    "name": filename,
-                    "path": relative_path,
-                    "size_bytes": stats.st_size,
-                    "modified": datetime.fromtimestamp(stats.st_mtime).isoformat(),
-                    "first_line": first_line,
-                })
+    # Paths are reported relative to the vault: compute the folder's relative
+    # prefix once and slice each walked path instead of relpath per file
+    folder_prefix_len = len(template_folder.rstrip(os.sep)) + 1
+    relative_folder = os.path.relpath(template_folder, vault)
+    relative_prefix = "" if relative_folder == "." else relative_folder + os.sep
+
+    # Walk and read off the event loop; per-file reads run concurrently
+    loop = asyncio.get_running_loop()
+    entries = await loop.run_in_executor(
+        _TEMPLATE_IO_EXECUTOR, _list_template_files, template_folder
+    )
+    templates = await asyncio.gather(*[
+        loop.run_in_executor(
+            _TEMPLATE_IO_EXECUTOR,
+            _scan_template,
+            full_path,
+            stats,
+            relative_prefix + full_path[folder_prefix_len:],
+        )
+        for full_path, stats in entries
+    ])
 
     return {
         "template_folder": template_folder,
         "template_count": len(templates),
-        "templates": templates,
+        "templates": list(templates),
     }
@@ -1,24 +1,33 @@
-"""Utility modules for Obsidian MCP server."""
+"""Utility modules for Obsidian MCP server.
 
-from .obsidian_api import ObsidianAPI
-from .validators import validate_note_path, sanitize_path, is_markdown_file, resolve_vault_path
-from .patterns import (
-    WIKILINK_PATTERN,
-    TAG_PATTERN,
-    HEADING_PATTERN,
-    BLOCK_PATTERN,
-    FRONTMATTER_PATTERN,
-)
+Re-exports are imported on first access, so importing a single utility
+module (e.g. src.utils.patterns) doesn't load the HTTP client and models.
+"""
 
-__all__ = [
-    "ObsidianAPI",
-    "validate_note_path",
-    "sanitize_path",
-    "is_markdown_file",
-    "resolve_vault_path",
-    "WIKILINK_PATTERN",
-    "TAG_PATTERN",
-    "HEADING_PATTERN",
-    "BLOCK_PATTERN",
-    "FRONTMATTER_PATTERN",
-]
\ No newline at end of file
+import importlib
+
+# Re-exported name -> defining submodule
+_EXPORTS = {
+    "ObsidianAPI": "obsidian_api",
+    "validate_note_path": "validators",
+    "sanitize_path": "validators",
+    "is_markdown_file": "validators",
+    "resolve_vault_path": "validators",
+    "WIKILINK_PATTERN": "patterns",
+    "TAG_PATTERN": "patterns",
+    "HEADING_PATTERN": "patterns",
+    "BLOCK_PATTERN": "patterns",
+    "FRONTMATTER_PATTERN": "patterns",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    """Import a re-exported utility from its submodule on first access."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
@@ -5,15 +5,22 @@ is available and raising helpful error messages when API-based tools are
 called without the API running.
 """
 
+import time
+from functools import lru_cache
+
 from fastmcp.exceptions import McpError
 from .obsidian_api_client import ObsidianAPIClient
 from .error_utils import create_error
 
 
-# Singleton API client instance
-_api_client: ObsidianAPIClient = None
+# How long a successful availability probe is trusted (seconds)
+AVAILABILITY_TTL = 2.0
+
+# (monotonic time, result) of the last availability probe
+_last_check: tuple[float, bool] = (0.0, False)
 
 
+@lru_cache(maxsize=1)
 def get_api_client() -> ObsidianAPIClient:
     """Get or create singleton API client instance.
 
@@ -22,12 +29,20 @@ def get_api_client() -> ObsidianAPIClient:
 
     Note:
         Uses singleton pattern to reuse HTTP client configuration
-        across multiple tool calls in the same session.
+        across multiple tool calls in the same session. The instance is
+        held by lru_cache; call get_api_client.cache_clear() to reset it.
     """
-    global _api_client
-    if _api_client is None:
-        _api_client = ObsidianAPIClient()
-    return _api_client
+    return ObsidianAPIClient()
+
+
+def invalidate_api_availability() -> None:
+    """Forget the cached availability result so the next check probes again.
+
+    Called when an API request fails with a connection error, so a stopped
+    Obsidian instance is noticed immediately instead of after the TTL.
+    """
+    global _last_check
+    _last_check = (0.0, False)
 
 
 async def require_api_available():
@@ -39,10 +54,19 @@ async def require_api_available():
     Note:
         This is the standard pre-check for all API-based tools (_api_tool suffix).
         It provides clear, actionable error messages to help users understand
-        why the tool failed and how to fix it.
+        why the tool failed and how to fix it. A successful probe is reused
+        for AVAILABILITY_TTL seconds so rapid tool sequences don't hit the
+        network on every call; failures are never cached.
     """
+    global _last_check
+    checked_at, available = _last_check
+    if available and time.monotonic() - checked_at < AVAILABILITY_TTL:
+        return
+
     client = get_api_client()
-    if not await client.is_available():
+    available = await client.is_available()
+    _last_check = (time.monotonic(), available)
+    if not available:
         raise create_error(
             "This tool requires Obsidian to be running with the Local REST API plugin enabled.\n\n"
             "To use this feature:\n"
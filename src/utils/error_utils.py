@@ -57,6 +57,9 @@ def handle_api_error(e: Exception) -> McpError:
         )
 
     if isinstance(e, (httpx.ConnectError, httpx.TimeoutException, ConnectionError)):
+        # Imported here: api_availability depends on this module
+        from .api_availability import invalidate_api_availability
+        invalidate_api_availability()
         return create_error(
             "Cannot connect to Obsidian Local REST API.\n\n"
             "Please ensure:\n"
@@ -0,0 +1,177 @@
+"""File reading and writing utilities for filesystem-native tools."""
+
+import os
+import secrets
+import stat
+import tempfile
+from typing import Optional, Tuple, Union
+
+
+def _create_staging_file(directory: str) -> Tuple[int, str]:
+    """
+    Create a uniquely named hidden temporary file in directory.
+
+    Unlike mkstemp, which creates files 0600, the file is opened with mode
+    0666 so the kernel applies the process umask, giving it the permissions
+    a plain open() would have.
+
+    Args:
+        directory: Directory to create the file in
+
+    Returns:
+        Tuple of (open file descriptor, file path)
+    """
+    flags = os.O_CREAT | os.O_EXCL | os.O_WRONLY | getattr(os, 'O_BINARY', 0)
+    for _ in range(tempfile.TMP_MAX):
+        path = os.path.join(directory, f'.{secrets.token_hex(8)}.tmp')
+        try:
+            return os.open(path, flags, 0o666), path
+        except FileExistsError:
+            continue
+    raise FileExistsError(f"No usable temporary file name found in {directory}")
+
+
+def atomic_write(filepath: str, content: Union[str, bytes]) -> None:
+    """
+    Replace a file's content atomically.
+
+    The content is written to a temporary file in the same directory and
+    moved over the target with os.replace, so readers (and a crash mid-write)
+    only ever see the old or the new content, never a truncated file. The
+    target's permission bits are preserved, and a symlinked path is written
+    through to the file it points at rather than replaced.
+
+    Args:
+        filepath: Path of the file to write
+        content: New content; str is encoded as UTF-8
+    """
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+
+    # Replace the link's target, not the link itself
+    filepath = os.path.realpath(filepath)
+    directory = os.path.dirname(filepath)
+
+    try:
+        mode = stat.S_IMODE(os.stat(filepath).st_mode)
+    except FileNotFoundError:
+        mode = None
+
+    fd, tmp_path = _create_staging_file(directory)
+    try:
+        with os.fdopen(fd, 'wb') as tmp:
+            tmp.write(content)
+        if mode is not None:
+            os.chmod(tmp_path, mode)
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def atomic_create(filepath: str, content: Union[str, bytes]) -> None:
+    """
+    Create a new file atomically, refusing to overwrite an existing one.
+
+    The content is staged in a temporary file in the target directory and
+    published with os.link, which fails if the target exists, so the file
+    appears complete or not at all. Missing parent directories are created
+    only when staging fails because of them.
+
+    Args:
+        filepath: Path of the file to create
+        content: File content; str is encoded as UTF-8
+
+    Raises:
+        FileExistsError: If filepath already exists
+    """
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+
+    directory = os.path.dirname(os.path.abspath(filepath))
+
+    try:
+        fd, tmp_path = _create_staging_file(directory)
+    except FileNotFoundError:
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = _create_staging_file(directory)
+
+    try:
+        with os.fdopen(fd, 'wb') as tmp:
+            tmp.write(content)
+        try:
+            os.link(tmp_path, filepath)
+        except FileExistsError:
+            raise
+        except OSError:
+            # Filesystem without hard links: fall back to a checked rename
+            if os.path.lexists(filepath):
+                raise FileExistsError(filepath)
+            os.replace(tmp_path, filepath)
+    finally:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+
+def get_vault_root(vault_path: Optional[str] = None) -> str:
+    """
+    Return the vault root from the argument or OBSIDIAN_VAULT_PATH.
+
+    Args:
+        vault_path: Explicit vault path, if the caller has one
+
+    Returns:
+        Vault root path
+
+    Raises:
+        ValueError: If neither the argument nor the environment variable is set
+    """
+    vault = vault_path or os.getenv("OBSIDIAN_VAULT_PATH")
+    if not vault:
+        raise ValueError("vault_path must be provided or OBSIDIAN_VAULT_PATH must be set")
+    return vault
+
+
+def read_vault_bytes(vault: str, file_path: str) -> bytes:
+    """
+    Read a vault file's raw content.
+
+    The open doubles as the existence check, so no separate stat is made.
+
+    Args:
+        vault: Vault root path
+        file_path: Path relative to the vault root
+
+    Returns:
+        File content
+
+    Raises:
+        ValueError: If the file does not exist
+    """
+    try:
+        with open(os.path.join(vault, file_path), "rb") as f:
+            return f.read()
+    except FileNotFoundError:
+        raise ValueError(f"File not found: {file_path}")
+
+
+def read_vault_text(vault: str, file_path: str) -> str:
+    """
+    Read a vault file as UTF-8 text.
+
+    Args:
+        vault: Vault root path
+        file_path: Path relative to the vault root
+
+    Returns:
+        Decoded file content
+
+    Raises:
+        ValueError: If the file does not exist
+    """
+    return read_vault_bytes(vault, file_path).decode("utf-8")
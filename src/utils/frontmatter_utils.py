@@ -0,0 +1,169 @@
+"""Frontmatter splicing utilities.
+
+Frontmatter edits only touch the YAML block at the top of a note, so these
+helpers parse and re-serialize that block alone and splice it back in front
+of the untouched body instead of round-tripping the whole note through
+``frontmatter.loads`` / ``frontmatter.dumps``.
+"""
+
+from typing import Any, Dict, Optional, Tuple, Union
+
+from frontmatter.default_handlers import YAMLHandler
+
+from .file_utils import atomic_write
+from .patterns import FRONTMATTER_BLOCK, FRONTMATTER_BLOCK_BYTES
+
+_YAML = YAMLHandler()
+
+# Bytes read from the start of a note when probing its frontmatter
+FRONTMATTER_PROBE_SIZE = 4096
+
+
+def parse_frontmatter(content: Union[str, bytes]) -> Tuple[Dict[str, Any], int]:
+    """
+    Parse only the frontmatter block of a note.
+
+    Args:
+        content: Full note content, either decoded or raw UTF-8 bytes (only
+            the frontmatter block is decoded)
+
+    Returns:
+        Tuple of (metadata, body_start) where body_start is the offset of the
+        first character (or byte) after the closing delimiter, or 0 if the
+        note has no frontmatter block.
+
+    Raises:
+        yaml.YAMLError: If the frontmatter block is not valid YAML
+        UnicodeDecodeError: If a bytes frontmatter block is not valid UTF-8
+    """
+    if isinstance(content, bytes):
+        match = FRONTMATTER_BLOCK_BYTES.match(content)
+    else:
+        match = FRONTMATTER_BLOCK.match(content)
+    if match is None:
+        return {}, 0
+
+    block = match.group(1)
+    if isinstance(block, bytes):
+        block = block.decode('utf-8')
+
+    metadata = _YAML.load(block)
+    if not isinstance(metadata, dict):
+        metadata = {}
+
+    return metadata, match.end()
+
+
+def read_frontmatter_head(filepath: str, size: int = FRONTMATTER_PROBE_SIZE) -> Optional[bytes]:
+    """
+    Read just the frontmatter block of a note, delimiters included.
+
+    Only the first `size` bytes are read, which is enough for the frontmatter
+    of almost every note. The result can be probed with cheap bytes searches
+    or passed to parse_frontmatter().
+
+    Args:
+        filepath: Path to the markdown file
+        size: Number of bytes to read from the start of the file
+
+    Returns:
+        The raw frontmatter block, b'' if the note has no frontmatter, or
+        None if the block does not end within the first `size` bytes.
+    """
+    with open(filepath, 'rb') as f:
+        head = f.read(size)
+
+    match = FRONTMATTER_BLOCK_BYTES.match(head)
+    if match is not None:
+        return head[:match.end()]
+
+    if not head.startswith(b'-') or len(head) < size:
+        return b''
+
+    return None
+
+
+def _newline_of(content: str) -> str:
+    """Return the note's newline style, taken from its first line break."""
+    first = content.find('\n')
+    return '\r\n' if first > 0 and content[first - 1] == '\r' else '\n'
+
+
+def _render_header(metadata: Dict[str, Any], newline: str = '\n') -> str:
+    """Serialize metadata into a delimited frontmatter block."""
+    header = f"---\n{_YAML.export(metadata)}\n---\n"
+    return header.replace('\n', newline) if newline != '\n' else header
+
+
+def splice_frontmatter(content: str, metadata: Dict[str, Any], body_start: int) -> str:
+    """
+    Rebuild a note with new frontmatter in front of its original body.
+
+    The new block uses the same line endings as the original note, so a CRLF
+    note stays CRLF throughout.
+
+    Args:
+        content: Full original note content
+        metadata: Metadata to serialize into the frontmatter block
+        body_start: Offset returned by parse_frontmatter()
+
+    Returns:
+        Note content with the frontmatter block replaced (or created)
+    """
+    newline = _newline_of(content)
+    header = _render_header(metadata, newline)
+
+    if body_start == 0:
+        # No existing block: separate the new frontmatter from the content
+        return f"{header}{newline}{content}" if content else header
+
+    return header + content[body_start:]
+
+
+def read_note_frontmatter(filepath: str) -> Tuple[str, Dict[str, Any], int]:
+    """
+    Read a note and parse its frontmatter block.
+
+    Args:
+        filepath: Path to the markdown file
+
+    Returns:
+        Tuple of (content, metadata, body_start)
+    """
+    with open(filepath, 'rb') as f:
+        content = f.read().decode('utf-8')
+
+    metadata, body_start = parse_frontmatter(content)
+    return content, metadata, body_start
+
+
+def write_note_frontmatter(
+    filepath: str,
+    content: str,
+    metadata: Dict[str, Any],
+    body_start: int
+) -> None:
+    """
+    Write new frontmatter for a note previously read with read_note_frontmatter().
+
+    When the re-serialized block has exactly the same byte length as the old
+    one, only the header region is overwritten in place (a single write that
+    never truncates the file) and the body is never rewritten. Otherwise the
+    spliced note is written to a temp file and atomically moved into place.
+
+    Args:
+        filepath: Path to the markdown file
+        content: Content returned by read_note_frontmatter()
+        metadata: Updated metadata
+        body_start: Offset returned by read_note_frontmatter()
+    """
+    if body_start:
+        old_header = content[:body_start].encode('utf-8')
+        new_header = _render_header(metadata, _newline_of(content)).encode('utf-8')
+        if len(new_header) == len(old_header):
+            if new_header != old_header:
+                with open(filepath, 'r+b') as f:
+                    f.write(new_header)
+            return
+
+    atomic_write(filepath, splice_frontmatter(content, metadata, body_start))
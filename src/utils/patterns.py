@@ -50,6 +50,12 @@ TAG_PATTERN = re.compile(
     r'#([a-zA-Z0-9_/-]+)'
 )
 
+# Bytes variant of TAG_PATTERN for scanning undecoded file content
+# The pattern is ASCII-only, so captured tags decode trivially
+TAG_PATTERN_BYTES = re.compile(
+    rb'#([a-zA-Z0-9_/-]+)'
+)
+
 # Heading pattern: # Heading or ## Heading or ### Heading (up to ######)
 # Captures: heading level markers, heading text
 # Multiline mode to match ^ at start of lines
@@ -83,6 +89,20 @@ FRONTMATTER_PATTERN = re.compile(
     re.DOTALL | re.MULTILINE
 )
 
+# Anchored frontmatter block: only matches at the very start of the file
+# Captures: raw YAML text between the delimiters
+# Used to splice rewritten YAML back in without touching the note body
+FRONTMATTER_BLOCK = re.compile(
+    r'\A-{3,}[ \t]*\r?\n(.*?)^-{3,}[ \t]*(?:\r?\n|\Z)',
+    re.DOTALL | re.MULTILINE
+)
+
+# Bytes variant of FRONTMATTER_BLOCK for undecoded file content
+FRONTMATTER_BLOCK_BYTES = re.compile(
+    rb'\A-{3,}[ \t]*\r?\n(.*?)^-{3,}[ \t]*(?:\r?\n|\Z)',
+    re.DOTALL | re.MULTILINE
+)
+
 # ============================================================================
 # TASKS PLUGIN PATTERNS (Tasks plugin emoji metadata)
 # ============================================================================
@@ -123,6 +143,15 @@ TASK_CREATED = re.compile(
     re.UNICODE
 )
 
+# Any task date field in one scan: 📅/📆/🗓 due, ⏳ scheduled, 🛫 start,
+# ✅ done, ➕ created
+# Captures: (field emoji, YYYY-MM-DD date)
+# The emoji identifies which field matched, so one pattern replaces five scans
+TASK_DATE_FIELD = re.compile(
+    r'([📅📆🗓⏳🛫✅➕])\s*(\d{4}-\d{2}-\d{2})\s*$',
+    re.UNICODE
+)
+
 # Task priority: ⏫ (highest), 🔼 (high), 🔽 (low), ⏬ (lowest)
 # Captures: The emoji itself
 # Note: No emoji = normal priority
@@ -172,12 +201,45 @@ DATAVIEW_PAREN = re.compile(
     r'\(([^[\]()]+?)\s*::\s*([^\)]+)\)'
 )
 
+# All three syntaxes in one scan, dispatched on the named group that matched
+# Groups: fkey/fval (full-line), bkey/bval (bracket), pkey/pval (paren)
+# Every field is confined to a single line: a blank line above a full-line
+# field is never swallowed into its key, and an unclosed bracket or paren
+# can't pair with one lines later, which keeps windowed scans of large notes
+# matching the same text as a whole-file scan
+DATAVIEW_FIELD = re.compile(
+    r'^[_*~]*(?P<fkey>[-\w \t]+?)[_*~]*[ \t]*::[ \t]*(?P<fval>.+)$'
+    r'|\[(?P<bkey>[^[\]()\n]+?)[ \t]*::[ \t]*(?P<bval>[^\]\n]+)\]'
+    r'|\((?P<pkey>[^[\]()\n]+?)[ \t]*::[ \t]*(?P<pval>[^\)\n]+)\)',
+    re.MULTILINE
+)
+
+# DATAVIEW_FIELD with fenced code blocks as a leading alternative, so a single
+# scan can step over code while editing fields in place
+# Group: fence (whole code block) in addition to the DATAVIEW_FIELD groups
+DATAVIEW_FIELD_OR_FENCE = re.compile(
+    r'(?P<fence>```(?s:.*?)```)|' + DATAVIEW_FIELD.pattern,
+    re.MULTILINE
+)
+
 # ISO8601 date pattern for Dataview field value parsing
 # Matches: YYYY-MM-DD or YYYY-MM-DDTHH:MM:SS
 DATE_ISO8601 = re.compile(
     r'^\d{4}-\d{2}-\d{2}(?:T\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+-]\d{2}:\d{2})?)?$'
 )
 
+# Numeric Dataview value: the decimal forms float() accepts, minus nan/inf
+# Examples: 42, -100, +5, 3.14, .5, 5., 1e3
+NUMBER_PATTERN = re.compile(
+    r'[-+]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?$'
+)
+
+# Canonical key filter: anything that may not appear in a canonical field key
+# Applied after lowercasing and space→hyphen conversion
+DATAVIEW_KEY_INVALID = re.compile(
+    r'[^a-z0-9-]'
+)
+
 # Quoted list pattern: ["item1", "item2", "item3"]
 # Used for parsing Dataview list values
 LIST_QUOTED = re.compile(
@@ -202,12 +264,34 @@ KANBAN_CARD = re.compile(
     re.MULTILINE
 )
 
+# Bytes variants for counting cards without decoding or building the board
+# Column heading: exactly two hashes, captures the column name
+KANBAN_COLUMN_BYTES = re.compile(
+    rb'^##[ \t]+(.+)$',
+    re.MULTILINE
+)
+
+# Card checkbox: captures the status byte (space or x/X)
+KANBAN_CARD_STATUS_BYTES = re.compile(
+    rb'^[ \t]*-[ \t]*\[([ xX])\][ \t]+\S',
+    re.MULTILINE
+)
+
 # Kanban card due date: @{2025-10-30}
 # Captures: YYYY-MM-DD date
 KANBAN_DATE = re.compile(
     r'@\{(\d{4}-\d{2}-\d{2})\}'
 )
 
+# All card metadata in one scan, dispatched on Match.lastgroup
+# Groups: due (YYYY-MM-DD from @{...}), link (wikilink target), tag (without #)
+# Wikilinks are consumed whole, so a [[Note#heading]] target is not also a tag
+KANBAN_CARD_METADATA = re.compile(
+    r'@\{(?P<due>\d{4}-\d{2}-\d{2})\}'
+    r'|\[\[(?P<link>[^\]|]+)(?:\|[^\]]+)?\]\]'
+    r'|#(?P<tag>[a-zA-Z0-9_/-]+)'
+)
+
 # ============================================================================
 # ENHANCED LINK TRACKING PATTERNS
 # ============================================================================
@@ -232,6 +316,27 @@ LINK_BLOCK = re.compile(
     r'\[\[([^\^]+)\^([^\]|]+)(?:\|[^\]]+)?\]\]'
 )
 
+# Any link for the link graph, in one pass: the group that matched names
+# the link type, and #heading / |alias / #anchor suffixes are matched
+# outside it so extracted targets need no further splitting
+# Groups: embed, wiki, md (exactly one participates per match)
+# Examples:
+#   ![[image.png|100]] -> embed='image.png'
+#   [[note#heading|Alias]] -> wiki='note'
+#   [text](note.md#section) -> md='note.md'
+# No two adjacent repeats can match the same character, and no repeat
+# crosses a '[' (or a newline, inside a URL), so unbalanced brackets in a
+# note cannot trigger catastrophic backtracking
+LINK_TARGET = re.compile(
+    r'!\[\[(?P<embed>[^\[\]|#]*)(?:[|#][^\[\]]*)?\]\]'
+    r'|\[\[(?P<wiki>[^\[\]|#]*)(?:[|#][^\[\]]*)?\]\]'
+    r'|\[[^\[\]]+\]\((?P<md>[^)\[#\n]*)(?:#[^)\[\n]*)?\)'
+)
+
+# Bytes variant for scanning raw note bytes; link syntax is pure ASCII, so
+# only the matched targets need decoding
+LINK_TARGET_BYTES = re.compile(LINK_TARGET.pattern.encode())
+
 # ============================================================================
 # TAG PATTERN (enhanced version already exists, keeping original)
 # ============================================================================
@@ -241,6 +346,13 @@ LINK_BLOCK = re.compile(
 # HELPER PATTERNS FOR VALIDATION
 # ============================================================================
 
+# Fenced code block: ```lang ... ```
+# Non-greedy so consecutive blocks are matched separately
+CODE_FENCE_BLOCK = re.compile(
+    r'```.*?```',
+    re.DOTALL
+)
+
 # Valid Obsidian filename characters
 # Used for validation before file operations
 VALID_FILENAME = re.compile(
@@ -0,0 +1,144 @@
+"""Persistent inverted tag index for filesystem-native tag search.
+
+The index maps every tag to the notes that contain it so that tag lookups
+don't have to re-read and re-parse every note in the vault. It is persisted
+as JSON under ``.obsidian/mcp_cache/tags_index.json`` and refreshed
+incrementally: only notes whose (mtime, size) changed since the last refresh
+are re-read.
+
+Index layout:
+    {
+        "version": 1,
+        "files": {
+            "notes/active.md": {
+                "mtime_ns": 1729000000000000000,
+                "size": 512,
+                "frontmatter_tags": ["project"],
+                "inline_tags": ["meeting"]
+            }
+        },
+        "tags": {"project": ["notes/active.md"], "meeting": ["notes/active.md"]}
+    }
+"""
+
+import os
+from itertools import chain
+from typing import Any, Dict, List, Optional
+
+from .vault_walk import iter_markdown_files
+from .vault_cache import get_cache_path, load_cache, save_cache
+
+INDEX_VERSION = 1
+INDEX_FILENAME = "tags_index.json"
+
+
+def get_index_path(vault_path: str) -> str:
+    """Return the absolute path of the tag index file for a vault."""
+    return get_cache_path(vault_path, INDEX_FILENAME)
+
+
+def _empty_index() -> Dict[str, Any]:
+    return {"version": INDEX_VERSION, "files": {}, "tags": {}}
+
+
+def load_index(vault_path: str) -> Dict[str, Any]:
+    """
+    Load the persisted tag index for a vault.
+
+    Returns an empty index if none exists or the stored one is unreadable
+    or from an incompatible version.
+    """
+    return load_cache(vault_path, INDEX_FILENAME, INDEX_VERSION) or _empty_index()
+
+
+def _index_file(file_path: str, stat: os.stat_result) -> Optional[Dict[str, Any]]:
+    """Extract the tags of a single note into an index entry."""
+    from ..tools.tags import extract_all_tags
+
+    try:
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+    except (FileNotFoundError, PermissionError):
+        # Skip files that can't be read
+        return None
+
+    # Cheap bytes-level prefilter: a note without any '#' and without a
+    # 'tag'/'tags' frontmatter key cannot have tags, so skip the YAML parse
+    # and tag regex for it entirely
+    if b'#' not in raw and b'tag' not in raw:
+        tags_info = {"frontmatter_tags": [], "inline_tags": []}
+    else:
+        # extract_all_tags works on the raw bytes without decoding the note
+        tags_info = extract_all_tags(raw)
+
+    return {
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "frontmatter_tags": tags_info["frontmatter_tags"],
+        "inline_tags": tags_info["inline_tags"],
+    }
+
+
+def refresh_index(vault_path: str, index: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Bring a tag index up to date with the vault on disk.
+
+    Walks the vault, re-reads only notes whose mtime or size changed, drops
+    deleted notes and rebuilds the inverted tag map. The index is persisted
+    only if anything changed.
+
+    Args:
+        vault_path: Absolute path to the vault root directory
+        index: Previously loaded index (loaded from disk if not provided)
+
+    Returns:
+        The refreshed index
+    """
+    if index is None:
+        index = load_index(vault_path)
+
+    old_files = index["files"]
+    files = {}
+    changed = False
+
+    # Walked paths all start with the root plus a separator, so slice off the
+    # prefix instead of calling os.path.relpath per file
+    prefix_len = len(os.path.join(vault_path, ''))
+
+    for file_path, stat in iter_markdown_files(vault_path):
+        relative_path = file_path[prefix_len:]
+
+        entry = old_files.get(relative_path)
+        if (entry is None
+                or entry["mtime_ns"] != stat.st_mtime_ns
+                or entry["size"] != stat.st_size):
+            entry = _index_file(file_path, stat)
+            changed = True
+            if entry is None:
+                continue
+
+        files[relative_path] = entry
+
+    if changed or len(files) != len(old_files):
+        tags: Dict[str, List[str]] = {}
+        for relative_path, entry in files.items():
+            for tag in dict.fromkeys(chain(entry["frontmatter_tags"], entry["inline_tags"])):
+                tags.setdefault(tag, []).append(relative_path)
+
+        index = {"version": INDEX_VERSION, "files": files, "tags": tags}
+        save_cache(vault_path, INDEX_FILENAME, index)
+
+    return index
+
+
+def build_index(vault_path: str) -> Dict[str, Any]:
+    """
+    Build the tag index for a vault from scratch and persist it.
+
+    Args:
+        vault_path: Absolute path to the vault root directory
+
+    Returns:
+        The freshly built index
+    """
+    return refresh_index(vault_path, _empty_index())
@@ -1,9 +1,18 @@
 """Validation utilities for Obsidian MCP server."""
 
 import os
+import re
+from functools import lru_cache
 from typing import Optional
 from ..constants import MARKDOWN_EXTENSIONS, ERROR_MESSAGES
 
+# str.endswith accepts a tuple, checking every extension in a single C call
+MARKDOWN_SUFFIXES = tuple(MARKDOWN_EXTENSIONS)
+
+# Any path violation in one scan: invalid or control characters, a '..'
+# traversal sequence, or a leading '/'
+_INVALID_PATH_RE = re.compile(r'[<>:"|?*\x00-\x1f]|\.\.|^/')
+
 
 def validate_note_path(path: str) -> tuple[bool, Optional[str]]:
     """
@@ -22,19 +31,13 @@ def validate_note_path(path: str) -> tuple[bool, Optional[str]]:
     if len(path) > 255:
         return False, ERROR_MESSAGES["path_too_long"].format(length=len(path))
     
-    # Check for path traversal attempts
-    if ".." in path or path.startswith("/"):
-        return False, ERROR_MESSAGES["invalid_path"].format(path=path)
-    
     # Check extension
-    if not any(path.endswith(ext) for ext in MARKDOWN_EXTENSIONS):
+    if not path.endswith(MARKDOWN_SUFFIXES):
         return False, ERROR_MESSAGES["invalid_path"].format(path=path)
     
-    # Check for invalid characters
-    invalid_chars = ["<", ">", ":", '"', "|", "?", "*"]
-    for char in invalid_chars:
-        if char in path:
-            return False, ERROR_MESSAGES["invalid_path"].format(path=path)
+    # Check for path traversal attempts and invalid characters
+    if _INVALID_PATH_RE.search(path):
+        return False, ERROR_MESSAGES["invalid_path"].format(path=path)
     
     return True, None
 
@@ -53,7 +56,7 @@ def sanitize_path(path: str) -> str:
     path = path.strip().strip("/")
     
     # Ensure .md extension
-    if not any(path.endswith(ext) for ext in MARKDOWN_EXTENSIONS):
+    if not path.endswith(MARKDOWN_SUFFIXES):
         path += ".md"
     
     return path
@@ -61,7 +64,21 @@ def sanitize_path(path: str) -> str:
 
 def is_markdown_file(path: str) -> bool:
     """Check if a path points to a markdown file."""
-    return any(path.lower().endswith(ext) for ext in MARKDOWN_EXTENSIONS)
+    return path.lower().endswith(MARKDOWN_SUFFIXES)
+
+
+@lru_cache(maxsize=16)
+def _normalized_vault_root(vault_root: str) -> str:
+    """Normalized form of an absolute vault root, cached since it is resolved per note."""
+    return os.path.normpath(vault_root)
+
+
+def _abs_vault_root(vault_root: str) -> str:
+    """Absolute form of a vault root."""
+    if os.path.isabs(vault_root):
+        return _normalized_vault_root(vault_root)
+    # Relative roots depend on the working directory, so they are never cached
+    return os.path.abspath(vault_root)
 
 
 def resolve_vault_path(vault_root: str, note_path: str) -> str:
@@ -89,16 +106,19 @@ def resolve_vault_path(vault_root: str, note_path: str) -> str:
         >>> resolve_vault_path("/home/user/vault", "../etc/passwd")  # Raises ValueError
     """
     # Ensure vault_root is absolute
-    vault_root = os.path.abspath(vault_root)
+    vault_root = _abs_vault_root(vault_root)
 
     # Sanitize the note path
     note_path = sanitize_path(note_path)
 
-    # Join paths and resolve to absolute path
-    full_path = os.path.abspath(os.path.join(vault_root, note_path))
+    # Join paths and normalize (vault_root is already absolute, so no getcwd)
+    full_path = os.path.normpath(os.path.join(vault_root, note_path))
 
-    # Security: Ensure the resolved path is within the vault root
-    if not full_path.startswith(vault_root):
+    # Security: Ensure the resolved path is within the vault root, comparing
+    # against the root plus a separator so sibling folders like /vault_evil
+    # are not mistaken for children of /vault
+    root_prefix = vault_root if vault_root.endswith(os.sep) else vault_root + os.sep
+    if not full_path.startswith(root_prefix):
         raise ValueError(f"Path traversal detected: {note_path} resolves outside vault root")
 
     return full_path
\ No newline at end of file
@@ -0,0 +1,53 @@
+"""Persistent per-vault JSON caches.
+
+Filesystem-native tools that derive data from every note in the vault
+(tag index, note statistics) persist their results under
+``.obsidian/mcp_cache/`` so repeated calls, even across server restarts,
+only have to re-read notes that changed.
+"""
+
+import json
+import os
+from typing import Any, Dict, Optional
+
+from .file_utils import atomic_write
+
+CACHE_DIR = os.path.join(".obsidian", "mcp_cache")
+
+
+def get_cache_path(vault_path: str, filename: str) -> str:
+    """Return the absolute path of a cache file for a vault."""
+    return os.path.join(vault_path, CACHE_DIR, filename)
+
+
+def load_cache(vault_path: str, filename: str, version: int) -> Optional[Dict[str, Any]]:
+    """
+    Load a persisted cache.
+
+    Returns None if the cache doesn't exist, is unreadable, or was written
+    with a different version.
+    """
+    try:
+        with open(get_cache_path(vault_path, filename), 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(data, dict) or data.get("version") != version:
+        return None
+
+    return data
+
+
+def save_cache(vault_path: str, filename: str, data: Dict[str, Any]) -> None:
+    """
+    Persist a cache atomically.
+
+    Failures (e.g. read-only vault) are ignored; caches are an optimization only.
+    """
+    cache_path = get_cache_path(vault_path, filename)
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        atomic_write(cache_path, json.dumps(data))
+    except OSError:
+        pass
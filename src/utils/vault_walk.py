@@ -0,0 +1,43 @@
+"""Vault traversal helpers.
+
+``os.walk`` classifies every entry with an extra ``stat`` call. Walking with
+``os.scandir`` instead reuses the file type returned by ``readdir`` and the
+``stat`` result cached on each ``DirEntry``, so a full vault walk that also
+needs mtime/size costs a single ``stat`` per note.
+"""
+
+import os
+from typing import Iterator, Tuple
+
+from .validators import MARKDOWN_SUFFIXES
+
+
+def iter_markdown_files(root: str) -> Iterator[Tuple[str, os.stat_result]]:
+    """
+    Recursively yield every markdown file under root, skipping .obsidian.
+
+    Symlinked directories are not followed (matching os.walk defaults) and
+    unreadable directories or dangling entries are skipped silently.
+
+    Args:
+        root: Directory to walk (typically the vault root)
+
+    Yields:
+        Tuples of (absolute file path, stat result)
+    """
+    try:
+        it = os.scandir(root)
+    except OSError:
+        return
+
+    with it:
+        for entry in it:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name == ".obsidian":
+                        continue
+                    yield from iter_markdown_files(entry.path)
+                elif entry.name.lower().endswith(MARKDOWN_SUFFIXES):
+                    yield entry.path, entry.stat()
+            except OSError:
+                continue
@@ -2,26 +2,19 @@
 
 import pytest
 import asyncio
-import sys
-import tempfile
+import hashlib
+import json
+import os
 import shutil
+import tempfile
 from pathlib import Path
 from datetime import date
-from unittest.mock import AsyncMock, MagicMock
 
-# Add parent directory to path so we can import src modules
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Project modules are imported inside the fixtures that need them, keeping
+# conftest import (and so collection and xdist worker startup) cheap
 
-from src.utils.api_availability import get_api_client
-from src.models.obsidian import Task, DataviewField, KanbanBoard, KanbanColumn, KanbanCard
-
-
-@pytest.fixture(scope="session")
-def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+# Set SKIP_INTEGRATION=1 to leave the integration tests out of collection
+collect_ignore_glob = ["integration/*"] if os.getenv("SKIP_INTEGRATION") else []
 
 
 @pytest.fixture
@@ -50,20 +43,206 @@ def temp_vault(tmp_path):
         encoding="utf-8"
     )
 
-    yield vault_path
-
     # Cleanup is automatic with tmp_path
-    shutil.rmtree(vault_path, ignore_errors=True)
+    return vault_path
 
 
-@pytest.fixture
+# Backlinks vault: note1 is linked from note2, note3 and subfolder/nested;
+# the .obsidian copy must be ignored and isolated has no links at all
+_BACKLINKS_VAULT_FILES = {
+    "note1.md": (
+        "This links to [[note2]] and [[note3|Note Three]].\n"
+        "Also links to [[note2#section]]."
+    ),
+    "note2.md": (
+        "# Note 2\n\n"
+        "This references [[note1]].\n"
+        "## Section\n"
+        "Some content."
+    ),
+    "note3.md": "Links back to [[note1]].",
+    "isolated.md": "This note has no wikilinks.",
+    "subfolder/nested.md": "From nested folder, linking to [[note1]].",
+    ".obsidian/config.md": "Config linking to [[note1]] - should be IGNORED.",
+}
+
+# Broken links vault: nonexistent1/2 and missing1/2 are broken targets
+_BROKEN_LINKS_VAULT_FILES = {
+    "valid_note.md": "# Valid Note\n\nContent here.",
+    "has_broken_links.md": (
+        "Links to [[valid_note]] (good).\n"
+        "Links to [[nonexistent1]] (broken).\n"
+        "Links to [[nonexistent2|Broken Alias]] (broken).\n"
+        "Links to [[valid_note#section]] (good - section links ok if note exists)."
+    ),
+    "all_broken.md": "[[missing1]] and [[missing2]].",
+    "no_links.md": "No wikilinks here.",
+}
+
+# Integration vault: main is linked from three notes, broken_links has two
+# broken targets
+_INTEGRATION_VAULT_FILES = {
+    "main.md": "# Main Note\n\nContent here.",
+    "references_main.md": (
+        "This note links to [[main]].\n"
+        "Multiple times: [[main|Main Note]]."
+    ),
+    "also_references.md": "Another backlink to [[main]].",
+    "broken_links.md": "Links to [[nonexistent]] and [[also-missing]].",
+    "folder/nested.md": "From subfolder: [[main]].",
+}
+
+# Link graph vault: A -> B -> C, hub links to A-E, orphan has no links
+_LINK_GRAPH_VAULT_FILES = {
+    "A.md": "[[B]]",
+    "B.md": "[[C]]",
+    "C.md": "",
+    "D.md": "",
+    "E.md": "",
+    "hub.md": "[[A]] [[B]] [[C]] [[D]] [[E]]",
+    "orphan.md": "No links",
+}
+
+
+def _write_vault(vault_path: Path, files: dict) -> str:
+    """Write a {relative path: content} mapping into a vault directory.
+
+    Each subdirectory is created once, and only for nested paths; files go
+    straight to disk with no archive step in between.
+    """
+    created = {vault_path}
+    for rel, content in files.items():
+        path = vault_path / rel
+        if path.parent not in created:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            created.add(path.parent)
+        path.write_text(content, encoding="utf-8")
+    return str(vault_path)
+
+
+def _cached_vault(request, tmp_path_factory, name: str, files: dict) -> str:
+    """Return a read-only vault built from files, reused across pytest runs.
+
+    The vault lives in pytest's cache directory, in a subdirectory named by
+    the content hash of files, so a change to files builds a new vault. Each
+    build goes into a temporary directory unique to the process and is
+    renamed into place, so xdist workers never see or delete a vault another
+    worker is using; the first rename wins and the others discard theirs.
+    Without the cache plugin (-p no:cacheprovider) it is built in a
+    temporary directory instead.
+    """
+    cache = getattr(request.config, "cache", None)
+    if cache is None:
+        return _write_vault(tmp_path_factory.mktemp(name), files)
+
+    digest = hashlib.sha256(json.dumps(files, sort_keys=True).encode("utf-8")).hexdigest()
+    root = Path(cache.makedir(name))
+    vault_path = root / digest
+    if vault_path.is_dir():
+        return str(vault_path)
+
+    build_path = Path(tempfile.mkdtemp(prefix=".build-", dir=root))
+    _write_vault(build_path, files)
+    try:
+        os.replace(build_path, vault_path)
+    except OSError:
+        shutil.rmtree(build_path, ignore_errors=True)
+        if not vault_path.is_dir():
+            raise
+        # Another worker finished the same vault first
+        return str(vault_path)
+
+    # Drop vaults built from older contents of files; builds in progress
+    # elsewhere are left alone
+    for entry in root.iterdir():
+        if entry.name == digest or entry.name.startswith(".build-"):
+            continue
+        if entry.is_dir() and not entry.is_symlink():
+            shutil.rmtree(entry, ignore_errors=True)
+        else:
+            entry.unlink(missing_ok=True)
+    return str(vault_path)
+
+
+@pytest.fixture(scope="session")
+def backlinks_vault(request, tmp_path_factory):
+    """Create a vault with interlinked notes for backlinks testing.
+
+    Built once and reused across runs; tests must treat it as read-only
+    (copy it to tmp_path before adding files).
+
+    Returns:
+        str: Path to vault directory
+    """
+    return _cached_vault(request, tmp_path_factory, "backlinks_vault", _BACKLINKS_VAULT_FILES)
+
+
+@pytest.fixture(scope="session")
+def vault_with_broken_links(request, tmp_path_factory):
+    """Create a vault with intentionally broken wikilinks (read-only, reused across runs).
+
+    Returns:
+        str: Path to vault directory
+    """
+    return _cached_vault(request, tmp_path_factory, "broken_links_vault", _BROKEN_LINKS_VAULT_FILES)
+
+
+@pytest.fixture(scope="session")
+def integration_vault(request, tmp_path_factory):
+    """Create a vault for backlinks integration testing (read-only, reused across runs).
+
+    Returns:
+        str: Path to vault directory
+    """
+    return _cached_vault(request, tmp_path_factory, "integration_vault", _INTEGRATION_VAULT_FILES)
+
+
+@pytest.fixture(scope="session")
+def link_graph_vault(request, tmp_path_factory):
+    """Create a vault for link graph tool testing (read-only, reused across runs).
+
+    Returns:
+        str: Path to vault directory
+    """
+    return _cached_vault(request, tmp_path_factory, "link_graph_vault", _LINK_GRAPH_VAULT_FILES)
+
+
+@pytest.fixture(scope="session")
+def empty_vault(tmp_path_factory):
+    """Provide an empty vault directory (read-only, session-wide).
+
+    Returns:
+        str: Path to vault directory
+    """
+    return str(tmp_path_factory.mktemp("empty_vault"))
+
+
+@pytest.fixture(scope="session")
+def two_note_cycle_vault(tmp_path_factory):
+    """Provide a vault of two notes linking to each other (no broken links).
+
+    Returns:
+        str: Path to vault directory
+    """
+    return _write_vault(tmp_path_factory.mktemp("cycle_vault"), {
+        "a.md": "Links to [[b]].",
+        "b.md": "Links to [[a]].",
+    })
+
+
+@pytest.fixture(scope="session")
 def sample_tasks():
     """Provide sample Task objects for testing.
 
+    Shared across the session; the tuple makes accidental mutation fail
+    loudly. Use list(sample_tasks) for a mutable copy.
+
     Returns:
-        List[Task]: List of sample tasks with various metadata
+        Tuple[Task, ...]: Sample tasks with various metadata
     """
-    return [
+    from src.models.obsidian import Task
+
+    return (
         Task(
             content="Review PR #123",
             status="incomplete",
@@ -100,18 +279,23 @@ def sample_tasks():
             line_number=4,
             source_file="personal/recurring.md",
             tags=["personal"]
-        )
-    ]
+        ),
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_dataview_fields():
     """Provide sample DataviewField objects for testing.
 
+    Shared across the session; the tuple makes accidental mutation fail
+    loudly. Use list(sample_dataview_fields) for a mutable copy.
+
     Returns:
-        List[DataviewField]: List of sample Dataview fields
+        Tuple[DataviewField, ...]: Sample Dataview fields
     """
-    return [
+    from src.models.obsidian import DataviewField
+
+    return (
         DataviewField(
             key="status",
             value="active",
@@ -138,17 +322,22 @@ def sample_dataview_fields():
             syntax_type="paren",
             source_file="project.md",
             value_type="number"
-        )
-    ]
+        ),
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_kanban_board():
     """Provide a sample KanbanBoard for testing.
 
+    Shared across the session; tests that modify the board should work on
+    sample_kanban_board.model_copy(deep=True).
+
     Returns:
         KanbanBoard: Sample Kanban board with columns and cards
     """
+    from src.models.obsidian import KanbanBoard, KanbanColumn, KanbanCard
+
     return KanbanBoard(
         file_path="board.md",
         columns=[
@@ -197,40 +386,116 @@ def sample_kanban_board():
     )
 
 
-@pytest.fixture
-async def api_available():
+# Result of the single per-session API probe
+_API_AVAILABLE_KEY = pytest.StashKey[bool]()
+
+
+def _probe_api(config) -> bool:
+    """Probe the Obsidian Local REST API once per session."""
+    from src.utils.api_availability import get_api_client
+
+    if _API_AVAILABLE_KEY not in config.stash:
+        config.stash[_API_AVAILABLE_KEY] = asyncio.run(get_api_client().is_available())
+    return config.stash[_API_AVAILABLE_KEY]
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip tests that need the Obsidian API when it isn't reachable.
+
+    The API is probed only if a collected test requests api_available.
+    """
+    needs_api = [item for item in items if "api_available" in getattr(item, "fixturenames", ())]
+    if not needs_api or _probe_api(config):
+        return
+
+    skip = pytest.mark.skip(reason="Obsidian API unavailable")
+    for item in needs_api:
+        item.add_marker(skip)
+
+
+@pytest.fixture(scope="session")
+def api_available(pytestconfig):
     """Check if Obsidian Local REST API is available.
 
     Returns:
         bool: True if API is reachable, False otherwise
 
     Note:
-        Use this to conditionally skip tests that require the API.
+        Tests requesting this fixture are skipped at collection time when
+        the API is unreachable; the probe runs once per session.
     """
-    client = get_api_client()
-    return await client.is_available()
+    return _probe_api(pytestconfig)
 
 
-@pytest.fixture
-def mock_api_client():
-    """Create a mock ObsidianAPIClient for testing without Obsidian.
+@pytest.fixture(scope="session")
+async def mcp_tool_names():
+    """Names of all tools registered with the MCP server, resolved once.
 
     Returns:
-        AsyncMock: Mock API client with common methods
+        KeysView[str]: Registered tool names (O(1) membership, no copy)
     """
-    mock_client = AsyncMock()
+    # Skip (rather than error) where the MCP runtime isn't installed
+    mcp = pytest.importorskip("src.server", reason="MCP server not available").mcp
+    return (await mcp.get_tools()).keys()
+
 
-    # Configure common method return values
-    mock_client.is_available.return_value = True
-    mock_client.execute_command.return_value = {"success": True}
-    mock_client.search_simple.return_value = []
-    mock_client.execute_dataview_query.return_value = {"values": []}
-    mock_client.list_commands.return_value = [
+# Default return values of the mocked ObsidianAPIClient methods
+_DEFAULT_MOCK_RETURNS = {
+    "is_available": True,
+    "execute_command": {"success": True},
+    "search_simple": [],
+    "execute_dataview_query": {"values": []},
+    "list_commands": [
         {"id": "editor:toggle-bold", "name": "Toggle bold"},
         {"id": "editor:toggle-italic", "name": "Toggle italic"}
-    ]
-    mock_client.get_active_file.return_value = {"path": "test.md"}
-    mock_client.get_file.return_value = {"content": "# Test\n\nContent"}
-    mock_client.put_file.return_value = {"success": True}
+    ],
+    "get_active_file": {"path": "test.md"},
+    "get_file": {"content": "# Test\n\nContent"},
+    "put_file": {"success": True},
+}
+
+
+class _FakeClient:
+    """Lightweight async stand-in for ObsidianAPIClient.
+
+    Returns the _DEFAULT_MOCK_RETURNS values without mock bookkeeping; it
+    records no calls.
+    """
+
+    async def is_available(self):
+        return _DEFAULT_MOCK_RETURNS["is_available"]
+
+    async def execute_command(self, *args, **kwargs):
+        return _DEFAULT_MOCK_RETURNS["execute_command"]
+
+    async def search_simple(self, *args, **kwargs):
+        return _DEFAULT_MOCK_RETURNS["search_simple"]
+
+    async def execute_dataview_query(self, *args, **kwargs):
+        return _DEFAULT_MOCK_RETURNS["execute_dataview_query"]
+
+    async def list_commands(self, *args, **kwargs):
+        return _DEFAULT_MOCK_RETURNS["list_commands"]
+
+    async def get_active_file(self, *args, **kwargs):
+        return _DEFAULT_MOCK_RETURNS["get_active_file"]
+
+    async def get_file(self, *args, **kwargs):
+        return _DEFAULT_MOCK_RETURNS["get_file"]
+
+    async def put_file(self, *args, **kwargs):
+        return _DEFAULT_MOCK_RETURNS["put_file"]
+
+
+@pytest.fixture(scope="session")
+def mock_api_client():
+    """Create a fake ObsidianAPIClient for testing without Obsidian.
+
+    Shared across the session: use it read-only. Tests that change return
+    values or assert on calls should build their own AsyncMock.
+
+    Returns:
+        _FakeClient: Fake API client with common methods
+    """
+    return _FakeClient()
 
-    return mock_client
\ No newline at end of file
@@ -0,0 +1,59 @@
+"""Unit tests for API availability checking."""
+
+import pytest
+from unittest.mock import AsyncMock
+
+import httpx
+
+from src.utils import api_availability, error_utils
+from src.utils.api_availability import invalidate_api_availability, require_api_available
+from src.utils.error_utils import handle_api_error
+
+
+class ApiError(Exception):
+    """Stand-in for the McpError built by create_error."""
+
+
+@pytest.fixture
+def mock_client(monkeypatch):
+    """Patch the API client singleton with a mock and reset the cached check."""
+    client = AsyncMock()
+    client.is_available.return_value = True
+    monkeypatch.setattr(api_availability, "get_api_client", lambda: client)
+    for module in (api_availability, error_utils):
+        monkeypatch.setattr(module, "create_error", lambda message, code=-1: ApiError(message))
+    invalidate_api_availability()
+    yield client
+    invalidate_api_availability()
+
+
+class TestRequireApiAvailable:
+    """Tests for require_api_available caching."""
+
+    @pytest.mark.asyncio
+    async def test_success_is_cached(self, mock_client):
+        """Test that a successful probe is reused within the TTL."""
+        await require_api_available()
+        await require_api_available()
+
+        assert mock_client.is_available.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_failure_is_not_cached(self, mock_client):
+        """Test that an unavailable API is probed again on the next call."""
+        mock_client.is_available.return_value = False
+
+        for _ in range(2):
+            with pytest.raises(ApiError):
+                await require_api_available()
+
+        assert mock_client.is_available.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_connection_error_invalidates_cache(self, mock_client):
+        """Test that a connection error forces a fresh probe."""
+        await require_api_available()
+        handle_api_error(httpx.ConnectError("refused"))
+        await require_api_available()
+
+        assert mock_client.is_available.await_count == 2
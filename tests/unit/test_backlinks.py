@@ -5,66 +5,34 @@ Tests cover: simple wikilinks, aliased wikilinks, section links, broken links, e
 """
 
 import pytest
-from pathlib import Path
-import tempfile
+import shutil
 import os
 
 # Import the functions we'll implement
 from src.tools.backlinks import find_backlinks, find_broken_links
 
+# Run on a single xdist worker so the session vault fixtures are built once
+pytestmark = pytest.mark.xdist_group(name="backlinks")
+
+
+@pytest.fixture(scope="module")
+def note1_backlinks(backlinks_vault):
+    """Backlinks to note1 in the read-only backlinks vault, computed once."""
+    return find_backlinks(backlinks_vault, "note1")
+
+
+@pytest.fixture(scope="module")
+def broken_links_result(vault_with_broken_links):
+    """Broken links in the read-only broken-links vault, computed once."""
+    return find_broken_links(vault_with_broken_links)
+
 
 class TestFindBacklinks:
     """Test suite for find_backlinks() function."""
 
-    @pytest.fixture
-    def sample_vault(self):
-        """Create a temporary vault with test notes for backlinks testing."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            vault_path = Path(tmpdir)
-
-            # Create note1.md - has links TO note2 and note3
-            (vault_path / "note1.md").write_text(
-                "This links to [[note2]] and [[note3|Note Three]].\n"
-                "Also links to [[note2#section]]."
-            )
-
-            # Create note2.md - has link TO note1 (creates bidirectional link)
-            (vault_path / "note2.md").write_text(
-                "# Note 2\n\n"
-                "This references [[note1]].\n"
-                "## Section\n"
-                "Some content."
-            )
-
-            # Create note3.md - has link TO note1
-            (vault_path / "note3.md").write_text(
-                "Links back to [[note1]]."
-            )
-
-            # Create isolated.md - no links to/from other notes
-            (vault_path / "isolated.md").write_text(
-                "This note has no wikilinks."
-            )
-
-            # Create subfolder with nested note
-            subfolder = vault_path / "subfolder"
-            subfolder.mkdir()
-            (subfolder / "nested.md").write_text(
-                "From nested folder, linking to [[note1]]."
-            )
-
-            # Create .obsidian folder (should be ignored)
-            obsidian_dir = vault_path / ".obsidian"
-            obsidian_dir.mkdir()
-            (obsidian_dir / "config.md").write_text(
-                "Config linking to [[note1]] - should be IGNORED."
-            )
-
-            yield str(vault_path)
-
-    def test_find_simple_backlinks(self, sample_vault):
+    def test_find_simple_backlinks(self, note1_backlinks):
         """Test finding simple wikilinks [[note]] format."""
-        result = find_backlinks(sample_vault, "note1")
+        result = note1_backlinks
 
         # note2.md and note3.md link to note1, plus subfolder/nested.md
         # .obsidian/config.md should be IGNORED
@@ -76,9 +44,9 @@ class TestFindBacklinks:
         assert "subfolder/nested.md" in note_paths
         assert ".obsidian/config.md" not in note_paths
 
-    def test_find_backlinks_with_alias(self, sample_vault):
+    def test_find_backlinks_with_alias(self, backlinks_vault):
         """Test finding aliased wikilinks [[note|alias]] format."""
-        result = find_backlinks(sample_vault, "note3")
+        result = find_backlinks(backlinks_vault, "note3")
 
         # note1.md links to note3 using alias [[note3|Note Three]]
         assert len(result) == 1
@@ -87,45 +55,48 @@ class TestFindBacklinks:
         # Verify the link text is captured
         assert "note3" in result[0]["link_target"]
 
-    def test_find_backlinks_with_section_reference(self, sample_vault):
+    def test_find_backlinks_with_section_reference(self, backlinks_vault):
         """Test that section links [[note#section]] are found."""
-        result = find_backlinks(sample_vault, "note2")
+        result = find_backlinks(backlinks_vault, "note2")
 
         # note1.md has both [[note2]] and [[note2#section]]
         # Should find note1 as a backlink (may find multiple matches in same file)
         assert len(result) >= 1
         assert result[0]["source_path"] == "note1.md"
 
-    def test_no_backlinks(self, sample_vault):
+    def test_no_backlinks(self, backlinks_vault):
         """Test note with no backlinks returns empty list."""
-        result = find_backlinks(sample_vault, "isolated")
+        result = find_backlinks(backlinks_vault, "isolated")
 
         assert result == []
         assert isinstance(result, list)
 
-    def test_nonexistent_note(self, sample_vault):
+    def test_nonexistent_note(self, backlinks_vault):
         """Test querying backlinks for a note that doesn't exist."""
-        result = find_backlinks(sample_vault, "nonexistent-note")
+        result = find_backlinks(backlinks_vault, "nonexistent-note")
 
         # Should return empty list, not error
         assert result == []
 
-    def test_obsidian_directory_ignored(self, sample_vault):
+    def test_obsidian_directory_ignored(self, note1_backlinks):
         """Test that .obsidian directory is completely ignored."""
-        result = find_backlinks(sample_vault, "note1")
+        result = note1_backlinks
 
         # Verify no results come from .obsidian directory
         for backlink in result:
             assert not backlink["source_path"].startswith(".obsidian")
 
-    def test_case_sensitivity(self, sample_vault):
+    def test_case_sensitivity(self, backlinks_vault, tmp_path):
         """Test that note names are case-sensitive (Obsidian default)."""
+        # Work on a copy so the session-wide vault stays unchanged
+        vault_path = tmp_path / "vault"
+        shutil.copytree(backlinks_vault, vault_path)
+
         # Create note with different casing
-        vault_path = Path(sample_vault)
         (vault_path / "CamelCase.md").write_text("Links to [[note1]].")
 
-        result_lower = find_backlinks(sample_vault, "note1")
-        result_camel = find_backlinks(sample_vault, "Note1")  # Different case
+        result_lower = find_backlinks(str(vault_path), "note1")
+        result_camel = find_backlinks(str(vault_path), "Note1")  # Different case
 
         # note1 (lowercase) should have backlinks
         assert len(result_lower) > 0
@@ -133,9 +104,9 @@ class TestFindBacklinks:
         # Note1 (capitalized) should have no backlinks
         assert len(result_camel) == 0
 
-    def test_backlinks_contain_required_fields(self, sample_vault):
+    def test_backlinks_contain_required_fields(self, note1_backlinks):
         """Test that backlink results contain all required fields."""
-        result = find_backlinks(sample_vault, "note1")
+        result = note1_backlinks
 
         assert len(result) > 0
 
@@ -153,38 +124,9 @@ class TestFindBacklinks:
 class TestFindBrokenLinks:
     """Test suite for find_broken_links() function."""
 
-    @pytest.fixture
-    def vault_with_broken_links(self):
-        """Create a vault with intentionally broken wikilinks."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            vault_path = Path(tmpdir)
-
-            # Create valid_note.md
-            (vault_path / "valid_note.md").write_text("# Valid Note\n\nContent here.")
-
-            # Create note with broken links
-            (vault_path / "has_broken_links.md").write_text(
-                "Links to [[valid_note]] (good).\n"
-                "Links to [[nonexistent1]] (broken).\n"
-                "Links to [[nonexistent2|Broken Alias]] (broken).\n"
-                "Links to [[valid_note#section]] (good - section links ok if note exists)."
-            )
-
-            # Create note with only broken links
-            (vault_path / "all_broken.md").write_text(
-                "[[missing1]] and [[missing2]]."
-            )
-
-            # Create note with no links
-            (vault_path / "no_links.md").write_text(
-                "No wikilinks here."
-            )
-
-            yield str(vault_path)
-
-    def test_find_broken_links(self, vault_with_broken_links):
+    def test_find_broken_links(self, broken_links_result):
         """Test detection of broken wikilinks."""
-        result = find_broken_links(vault_with_broken_links)
+        result = broken_links_result
 
         # Should find broken links: nonexistent1, nonexistent2, missing1, missing2
         assert len(result) >= 4
@@ -200,30 +142,24 @@ class TestFindBrokenLinks:
         # Valid links should NOT appear
         assert "valid_note" not in broken_targets
 
-    def test_no_broken_links(self, sample_vault):
+    def test_no_broken_links(self, two_note_cycle_vault):
         """Test vault with all valid links returns empty list."""
-        # Create a clean vault with only valid links
-        with tempfile.TemporaryDirectory() as tmpdir:
-            vault_path = Path(tmpdir)
+        # A clean vault with only valid links
+        result = find_broken_links(two_note_cycle_vault)
 
-            (vault_path / "a.md").write_text("Links to [[b]].")
-            (vault_path / "b.md").write_text("Links to [[a]].")
-
-            result = find_broken_links(str(vault_path))
-
-            assert result == []
+        assert result == []
 
-    def test_broken_links_with_aliases(self, vault_with_broken_links):
+    def test_broken_links_with_aliases(self, broken_links_result):
         """Test that broken links with aliases are detected."""
-        result = find_broken_links(vault_with_broken_links)
+        result = broken_links_result
 
         # nonexistent2 is linked as [[nonexistent2|Broken Alias]]
         broken_targets = [r["link_target"] for r in result]
         assert "nonexistent2" in broken_targets
 
-    def test_section_links_not_broken_if_note_exists(self, vault_with_broken_links):
+    def test_section_links_not_broken_if_note_exists(self, broken_links_result):
         """Test that [[note#section]] is valid if note exists (even if section doesn't)."""
-        result = find_broken_links(vault_with_broken_links)
+        result = broken_links_result
 
         # [[valid_note#section]] should NOT be broken (note exists)
         broken_targets = [r["link_target"] for r in result]
@@ -233,9 +169,9 @@ class TestFindBrokenLinks:
             base_note = target.split("#")[0]
             assert base_note != "valid_note"
 
-    def test_broken_links_contain_required_fields(self, vault_with_broken_links):
+    def test_broken_links_contain_required_fields(self, broken_links_result):
         """Test that broken link results contain all required fields."""
-        result = find_broken_links(vault_with_broken_links)
+        result = broken_links_result
 
         assert len(result) > 0
 
@@ -245,16 +181,7 @@ class TestFindBrokenLinks:
             assert "link_target" in broken_link
             assert "line_number" in broken_link or "context" in broken_link
 
-    def test_empty_vault(self):
+    def test_empty_vault(self, empty_vault):
         """Test broken links detection on empty vault."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            result = find_broken_links(tmpdir)
-            assert result == []
-
-    @pytest.fixture
-    def sample_vault(self):
-        """Reuse sample vault fixture for cross-test compatibility."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            vault_path = Path(tmpdir)
-            (vault_path / "test.md").write_text("Test content")
-            yield str(vault_path)
+        result = find_broken_links(empty_vault)
+        assert result == []
@@ -9,6 +9,7 @@ from src.tools.dataview_fs import (
     detect_value_type,
     parse_value,
     extract_dataview_fields,
+    extract_dataview_field_rows,
     format_dataview_field,
     scan_vault_for_fields,
     add_field_to_file,
@@ -96,6 +97,22 @@ class TestDetectValueType:
         assert detect_value_type("Not a number") == "string"
         assert detect_value_type("2025-13-45") == "string"  # Invalid date
 
+    def test_detect_signed_and_dotted_numbers(self):
+        """Test that a leading plus sign or bare decimal point still reads as a number."""
+        assert detect_value_type("+5") == "number"
+        assert detect_value_type(".5") == "number"
+        assert detect_value_type("1e3") == "number"
+        assert detect_value_type("+") == "string"
+        assert detect_value_type(".") == "string"
+        assert parse_value("+5", "number") == 5
+        assert parse_value(".5", "number") == 0.5
+
+    def test_detect_non_numeric_float_literals(self):
+        """Test that strings float() would accept are not treated as numbers."""
+        assert detect_value_type("nan") == "string"
+        assert detect_value_type("Infinity") == "string"
+        assert detect_value_type("2025-02-30") == "string"
+
 
 class TestParseValue:
     """Tests for parse_value function."""
@@ -192,6 +209,47 @@ due:: 2025-10-30
         syntax_types = {f.syntax_type for f in fields}
         assert syntax_types == {"full-line", "bracket", "paren"}
 
+    def test_fields_in_document_order(self):
+        """Test that mixed syntaxes are returned in document order with line numbers."""
+        content = "[first:: 1]\n\nsecond:: 2\nText (third:: 3) and [fourth:: 4]\n"
+        fields = extract_dataview_fields(content, "test.md")
+
+        assert [(f.key, f.syntax_type, f.line_number) for f in fields] == [
+            ("first", "bracket", 1),
+            ("second", "full-line", 3),
+            ("third", "paren", 4),
+            ("fourth", "bracket", 4),
+        ]
+
+    def test_non_ascii_key_keeps_a_canonical_key(self):
+        """Test that a key with no ASCII word characters falls back like the model validator."""
+        content = "ÄÖ:: value\n"
+
+        rows = extract_dataview_field_rows(content, "test.md")
+
+        assert rows[0]["canonical_key"] == "äö"
+        assert rows == [DataviewField(**row).model_dump() for row in rows]
+
+    def test_inline_fields_within_full_line_value(self):
+        """Test that bracket and paren fields on a full-line field's line are still extracted."""
+        content = "status:: active [priority:: high] (owner:: sam)\n"
+        fields = extract_dataview_fields(content, "test.md")
+
+        assert [(f.key, f.value, f.syntax_type) for f in fields] == [
+            ("status", "active [priority:: high] (owner:: sam)", "full-line"),
+            ("priority", "high", "bracket"),
+            ("owner", "sam", "paren"),
+        ]
+
+    def test_rows_match_models(self):
+        """Test that plain rows carry the same data as DataviewField models."""
+        content = "status:: active\nThis is [progress:: 50].\n"
+
+        rows = extract_dataview_field_rows(content, "test.md")
+        models = extract_dataview_fields(content, "test.md")
+
+        assert rows == [m.model_dump() for m in models]
+
     def test_skip_code_blocks(self):
         """Test that code blocks are skipped."""
         content = """# Test
@@ -213,6 +271,13 @@ actual:: value
         assert "status" in keys
         assert "actual" in keys
 
+    def test_line_numbers_after_code_block(self):
+        """Test that masking code blocks keeps later line numbers intact."""
+        content = "```\nhidden:: 1\n```\n```\nalso:: 2\n```\nvisible:: 3\n"
+        fields = extract_dataview_fields(content, "test.md")
+
+        assert [(f.key, f.line_number) for f in fields] == [("visible", 7)]
+
     def test_value_type_detection(self):
         """Test automatic value type detection."""
         content = """
@@ -334,6 +399,82 @@ priority:: high
         assert result_filtered["total_matches"] == 2
         assert result_filtered["files_with_matches"] == 2
 
+    def test_scan_cache_invalidated_on_change(self, temp_vault):
+        """Test that cached scan results are refreshed when a note changes."""
+        note = temp_vault / "cached.md"
+        note.write_text("status:: draft\n", encoding="utf-8")
+        first = scan_vault_for_fields(str(temp_vault), key_filter="status")
+        assert [r["value"] for r in first if r["source_file"] == "cached.md"] == ["draft"]
+
+        note.write_text("status:: published\n", encoding="utf-8")
+        second = scan_vault_for_fields(str(temp_vault), key_filter="status")
+        assert [r["value"] for r in second if r["source_file"] == "cached.md"] == ["published"]
+
+    def test_scan_large_note_matches_whole_file_parse(self, temp_vault):
+        """Test that windowed parsing of a large note matches a whole-file parse."""
+        parts = []
+        for i in range(4000):
+            parts.append(f"status:: s{i}\nFiller text with [status:: b{i}] inside.\n")
+            if i % 700 == 0:
+                # Long code blocks that straddle parsing windows
+                parts.append("```\n" + "status:: hidden\n" * 2000 + "```\n")
+        content = "".join(parts)
+        (temp_vault / "big.md").write_text(content, encoding="utf-8")
+
+        rows = scan_vault_for_fields(str(temp_vault), key_filter="status")
+        big_rows = [r for r in rows if r["source_file"] == "big.md"]
+
+        assert len(content) > 128 * 1024
+        assert big_rows == [
+            r for r in extract_dataview_field_rows(content, "big.md")
+            if r["canonical_key"] == "status"
+        ]
+        assert "hidden" not in {r["value"] for r in big_rows}
+
+    def test_scan_large_note_with_unclosed_fence(self, temp_vault):
+        """Test that an unclosed fence in a large note masks nothing, as in a whole-file parse."""
+        pad = "Filler line without fields.\n" * 5000
+        content = "```\nclosed:: hidden\n```\n" + pad + "```\nunclosed:: value\n" + pad + "after:: value\n"
+        (temp_vault / "big.md").write_text(content, encoding="utf-8")
+
+        rows = scan_vault_for_fields(str(temp_vault))
+        big_rows = [r for r in rows if r["source_file"] == "big.md"]
+
+        assert len(content) > 128 * 1024
+        assert big_rows == extract_dataview_field_rows(content, "big.md")
+        assert [r["canonical_key"] for r in big_rows] == ["unclosed", "after"]
+
+    def test_scan_large_note_with_multiline_inline_value_at_window_edge(self, temp_vault):
+        """Test that inline values spanning a window edge parse as in a whole-file parse."""
+        line = "Filler line without fields.\n"
+        # The first window ends after the line holding "[span:: first"
+        pad = line * ((64 * 1024 - 1) // len(line))
+        content = (
+            pad + "Text [span:: first\nsecond] (open:: value\n"
+            + line * 3000 + "close)\nafter:: value\n"
+        )
+        (temp_vault / "big.md").write_text(content, encoding="utf-8")
+
+        rows = scan_vault_for_fields(str(temp_vault))
+        big_rows = [r for r in rows if r["source_file"] == "big.md"]
+
+        assert len(content) > 128 * 1024
+        assert big_rows == extract_dataview_field_rows(content, "big.md")
+        assert [r["canonical_key"] for r in big_rows] == ["after"]
+
+    def test_scan_large_vault_in_parallel(self, temp_vault):
+        """Test that vaults above the parallel threshold return every field."""
+        batch = temp_vault / "batch"
+        batch.mkdir()
+        for i in range(70):
+            (batch / f"n{i}.md").write_text(f"status:: s{i}\nother:: x\n", encoding="utf-8")
+
+        rows = scan_vault_for_fields(str(temp_vault), key_filter="status")
+        batch_rows = [r for r in rows if r["source_file"].startswith("batch")]
+
+        assert len(batch_rows) == 70
+        assert {r["value"] for r in batch_rows} == {f"s{i}" for i in range(70)}
+
     @pytest.mark.asyncio
     async def test_add_dataview_field_fs_tool(self, temp_vault):
         """Test add_dataview_field_fs_tool."""
@@ -388,6 +529,25 @@ title: Test
         # Should be after frontmatter (line 3, after ---)
         assert status_line_idx == 3
 
+    @pytest.mark.asyncio
+    async def test_add_field_after_frontmatter_needs_whole_delimiter_line(self, temp_vault):
+        """Test that a line merely starting with --- does not close the frontmatter."""
+        file_path = "dashes.md"
+        (temp_vault / file_path).write_text(
+            "---\ntitle: Test\n---x: 1\n---\n# Content\n", encoding="utf-8"
+        )
+
+        await add_dataview_field_fs_tool(
+            file_path=file_path,
+            key="status",
+            value="active",
+            insert_at="after_frontmatter",
+            vault_path=str(temp_vault),
+        )
+
+        content = (temp_vault / file_path).read_text(encoding="utf-8")
+        assert content == "---\ntitle: Test\n---x: 1\n---\nstatus:: active\n# Content\n"
+
     @pytest.mark.asyncio
     async def test_remove_dataview_field_fs_tool(self, temp_vault):
         """Test remove_dataview_field_fs_tool."""
@@ -432,6 +592,67 @@ completion:: 75
         assert "status" not in content
         assert "This is text with  inline field" in content
 
+    def test_remove_field_by_line_skips_code_blocks(self, temp_vault):
+        """Test targeted removal leaves other occurrences and code blocks alone."""
+        note = temp_vault / "remove.md"
+        note.write_text(
+            "**Status**:: a\n```\nstatus:: code\n```\nKeep [status:: b] (status:: c)\n",
+            encoding="utf-8",
+        )
+
+        assert remove_field_from_file(str(temp_vault), "remove.md", "status", line_number=5)
+        assert note.read_text(encoding="utf-8") == (
+            "**Status**:: a\n```\nstatus:: code\n```\nKeep  \n"
+        )
+
+        assert remove_field_from_file(str(temp_vault), "remove.md", "Status")
+        assert note.read_text(encoding="utf-8") == "```\nstatus:: code\n```\nKeep  \n"
+        assert not remove_field_from_file(str(temp_vault), "remove.md", "status")
+
+    def test_remove_non_ascii_key_leaves_other_non_ascii_keys(self, temp_vault):
+        """Test keys without ASCII characters only match themselves."""
+        note = temp_vault / "unicode.md"
+        note.write_text("日本:: a\nщ:: b\nkeep:: c\n", encoding="utf-8")
+
+        assert remove_field_from_file(str(temp_vault), "unicode.md", "日本")
+        assert note.read_text(encoding="utf-8") == "щ:: b\nkeep:: c\n"
+        assert not remove_field_from_file(str(temp_vault), "unicode.md", "日本")
+
+    def test_remove_field_nested_in_full_line_value(self, temp_vault):
+        """Test inline fields inside a full-line value can be removed."""
+        note = temp_vault / "nested.md"
+        note.write_text("status:: foo [x:: 1]\nother:: (x:: 2)\n", encoding="utf-8")
+
+        assert remove_field_from_file(str(temp_vault), "nested.md", "x", line_number=1)
+        assert note.read_text(encoding="utf-8") == "status:: foo \nother:: (x:: 2)\n"
+
+        assert remove_field_from_file(str(temp_vault), "nested.md", "x")
+        assert note.read_text(encoding="utf-8") == "status:: foo \nother:: \n"
+
+    def test_add_field_at_end_without_trailing_newline(self, temp_vault):
+        """Test appending to a note whose last line has no newline."""
+        note = temp_vault / "append.md"
+        note.write_text("# Title", encoding="utf-8")
+
+        assert add_field_to_file(str(temp_vault), "append.md", "status", "done", insert_at="end")
+        assert note.read_text(encoding="utf-8") == "# Title\nstatus:: done\n"
+
+    def test_add_field_at_end_trims_trailing_whitespace(self, temp_vault):
+        """Test appending drops trailing blank lines and spaces, even past one tail chunk."""
+        note = temp_vault / "trailing.md"
+        for content in ("Hello\n\n\n", "Hello   ", "Hello" + " \n" * 5000):
+            note.write_text(content, encoding="utf-8")
+            assert add_field_to_file(str(temp_vault), "trailing.md", "k", "v", insert_at="end")
+            assert note.read_text(encoding="utf-8") == "Hello\nk:: v\n"
+
+    def test_add_field_unknown_insert_at_fails(self, temp_vault):
+        """Test an unknown insertion point leaves the note unchanged."""
+        note = temp_vault / "unknown.md"
+        note.write_text("Hello\n", encoding="utf-8")
+
+        assert not add_field_to_file(str(temp_vault), "unknown.md", "k", "v", insert_at="middle")
+        assert note.read_text(encoding="utf-8") == "Hello\n"
+
     @pytest.mark.asyncio
     async def test_add_multiple_syntax_types(self, temp_vault):
         """Test adding fields with different syntax types."""
@@ -510,6 +731,19 @@ class TestEdgeCases:
         assert result["total_matches"] == 0
         assert result["files_with_matches"] == 0
 
+    def test_scan_skips_empty_and_undecodable_files(self, temp_vault):
+        """Test that empty and non-UTF-8 notes are skipped without aborting the scan."""
+        (temp_vault / "empty.md").write_bytes(b"")
+        (temp_vault / "binary.md").write_bytes(b"status:: \xff\xfe\n")
+        (temp_vault / "good.md").write_text("status:: ok\n", encoding="utf-8")
+
+        rows = scan_vault_for_fields(str(temp_vault), key_filter="status")
+        sources = {r["source_file"] for r in rows}
+
+        assert "good.md" in sources
+        assert "binary.md" not in sources
+        assert "empty.md" not in sources
+
     def test_format_with_special_characters(self):
         """Test formatting values with special characters."""
         result = format_dataview_field("key", "value: with: colons", "full-line")
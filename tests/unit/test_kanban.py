@@ -8,6 +8,7 @@ from src.tools.kanban import (
     parse_card_metadata,
     format_kanban_card,
     parse_kanban_structure,
+    count_board_cards,
     parse_kanban_board_fs_tool,
     add_kanban_card_fs_tool,
     move_kanban_card_fs_tool,
@@ -44,6 +45,34 @@ class TestParseCardMetadata:
         assert "urgent" in metadata["tags"]
         assert "Project" in metadata["wikilinks"]
 
+    def test_wikilink_heading_is_not_a_tag(self):
+        """Test that a #heading inside a wikilink is not reported as a tag."""
+        metadata = parse_card_metadata("See [[Spec#Scope|scope]] #review @{2025-02-30}")
+        assert metadata["wikilinks"] == ["Spec#Scope"]
+        assert metadata["tags"] == ["review"]
+        assert metadata["due_date"] is None
+
+
+class TestCountBoardCards:
+    """Tests for count_board_cards function."""
+
+    def test_counts_per_column_with_subtasks(self):
+        """Test byte-level counts include subtasks and ignore stray cards."""
+        content = b"""- [ ] Before any column
+
+## To Do
+
+- [ ] Main task
+  - [x] Subtask
+### Not a column
+- [X] Still in To Do
+
+## Done
+- [x] Finished
+- [ ]
+"""
+        assert count_board_cards(content) == [("To Do", 3, 2), ("Done", 1, 1)]
+
 
 class TestKanbanParsing:
     """Tests for Kanban board parsing."""
@@ -81,6 +110,26 @@ class TestKanbanParsing:
         assert len(board.columns[0].cards) == 1
         assert len(board.columns[0].cards[0].subtasks) == 2
 
+    def test_parse_loosely_spaced_checkboxes(self):
+        """Test that non-canonical checkbox spacing is still parsed as cards."""
+        content = "## Todo\n\n-[x] Tight\n-  [ ]   Wide\n- [X] Upper\n- [ ]\n"
+        board = parse_kanban_structure(content, "board.md")
+
+        cards = board.columns[0].cards
+        assert [c.text for c in cards] == ["Tight", "Wide", "Upper"]
+        assert [c.status for c in cards] == ["completed", "incomplete", "completed"]
+
+    def test_parse_cards_without_plain_text(self):
+        """Test that date-only cards keep their text and blank cards and headings are skipped."""
+        content = "## Todo\n\n- [ ] @{2024-01-05}\n- [ ]  \n##  \n- [x] Done\n"
+        board = parse_kanban_structure(content, "board.md")
+
+        assert [c.name for c in board.columns] == ["Todo"]
+        cards = board.columns[0].cards
+        assert [c.text for c in cards] == ["@{2024-01-05}", "Done"]
+        assert cards[0].due_date == date(2024, 1, 5)
+        assert [KanbanCard(**c.model_dump()).text for c in cards] == ["@{2024-01-05}", "Done"]
+
     def test_parse_card_with_metadata(self):
         """Test parsing card with due date and tags."""
         content = """## To Do
@@ -239,3 +288,15 @@ class TestToolFunctions:
         assert result["total_incomplete"] == 2
         assert result["column_count"] == 2
         assert result["overall_completion_rate"] == 60.0
+
+    @pytest.mark.asyncio
+    async def test_tools_use_env_vault_and_report_missing_file(self, temp_vault, monkeypatch):
+        """Test the OBSIDIAN_VAULT_PATH fallback and the missing-file error."""
+        monkeypatch.setenv("OBSIDIAN_VAULT_PATH", str(temp_vault))
+
+        with pytest.raises(ValueError, match="File not found: missing.md"):
+            await get_kanban_statistics_fs_tool(file_path="missing.md")
+
+        monkeypatch.delenv("OBSIDIAN_VAULT_PATH")
+        with pytest.raises(ValueError, match="OBSIDIAN_VAULT_PATH"):
+            await parse_kanban_board_fs_tool(file_path="missing.md")
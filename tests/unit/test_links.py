@@ -1,10 +1,13 @@
 """Unit tests for enhanced link tracking tools."""
 
+import copy
+
 import pytest
 from pathlib import Path
 
 from src.tools.links import (
     extract_all_links,
+    extract_all_links_bytes,
     find_note_by_name,
     build_link_graph,
     find_orphaned_notes,
@@ -66,6 +69,32 @@ class TestExtractAllLinks:
         assert "https://example.com" not in links["all_links"]
         assert "internal" in links["all_links"]
 
+    def test_strip_anchors_and_aliases(self):
+        """Test that headings, aliases and anchors are stripped and embeds aren't wikilinks."""
+        content = "[[A#Heading|Alias]] ![[B#section]] [c](C.md#part)"
+        links = extract_all_links(content, "test.md")
+
+        assert links["wikilinks"] == ["A"]
+        assert links["embeds"] == ["B"]
+        assert links["markdown_links"] == ["C"]
+
+    def test_unbalanced_brackets_do_not_backtrack(self):
+        """Test that long runs of unclosed link syntax are scanned quickly."""
+        content = "[a](" * 5000 + "[[" * 5000 + "![[" * 5000 + "[[x|" * 5000 + " [[Real]]"
+        links = extract_all_links(content, "test.md")
+
+        assert links["all_links"] == ["Real"]
+
+    def test_bytes_extraction_matches_text(self):
+        """Test that extracting from raw bytes matches extracting from decoded text."""
+        content = "[[Café|Alias]] ![[Ünïcode.png]] [x](naïve.md#a) [y](https://e.com) [[ ]]"
+        links = extract_all_links_bytes(content.encode("utf-8"), "test.md")
+
+        expected = extract_all_links(content, "test.md")
+        for key in ("wikilinks", "markdown_links", "embeds"):
+            assert links[key] == expected[key]
+        assert sorted(links["all_links"]) == sorted(expected["all_links"])
+
 
 class TestFindNoteByName:
     """Tests for find_note_by_name function."""
@@ -93,6 +122,15 @@ class TestFindNoteByName:
         result = find_note_by_name(str(temp_vault), "Note")
         assert result == str(Path("folder") / "Note.md")
 
+    def test_find_note_by_relative_path(self, temp_vault):
+        """Test finding a note by its vault-relative path, with or without .md."""
+        (temp_vault / "folder").mkdir()
+        (temp_vault / "folder" / "Note.md").write_text("content", encoding="utf-8")
+        expected = str(Path("folder") / "Note.md")
+
+        assert find_note_by_name(str(temp_vault), str(Path("folder") / "Note")) == expected
+        assert find_note_by_name(str(temp_vault), expected) == expected
+
     def test_note_not_found(self, temp_vault):
         """Test when note doesn't exist."""
         result = find_note_by_name(str(temp_vault), "NonExistent")
@@ -140,6 +178,80 @@ class TestBuildLinkGraph:
         assert "A.md" in graph["B.md"]["outlinks"]
         assert "B.md" in graph["B.md"]["inlinks"]
 
+    def test_graph_cache_invalidated_on_change(self, temp_vault):
+        """Test that a cached graph is reused until a note changes."""
+        (temp_vault / "A.md").write_text("[[B]]", encoding="utf-8")
+        (temp_vault / "B.md").write_text("", encoding="utf-8")
+
+        graph = build_link_graph(str(temp_vault))
+        assert build_link_graph(str(temp_vault)) is graph
+
+        (temp_vault / "A.md").write_text("[[B]] [[C]]", encoding="utf-8")
+        (temp_vault / "C.md").write_text("", encoding="utf-8")
+        graph = build_link_graph(str(temp_vault))
+
+        assert set(graph["A.md"]["outlinks"]) == {"B.md", "C.md"}
+        assert graph["C.md"]["inlinks"] == ["A.md"]
+
+    def test_unchanged_notes_reuse_extracted_links(self, temp_vault, monkeypatch):
+        """Test that only changed notes are re-read when the graph is rebuilt."""
+        import src.tools.links as links_module
+
+        (temp_vault / "A.md").write_text("[[B]]", encoding="utf-8")
+        (temp_vault / "B.md").write_text("[[A]]", encoding="utf-8")
+        build_link_graph(str(temp_vault))
+
+        parsed = []
+        original = links_module.extract_all_links_bytes
+        monkeypatch.setattr(
+            links_module,
+            "extract_all_links_bytes",
+            lambda content, source: parsed.append(source) or original(content, source),
+        )
+        (temp_vault / "B.md").write_text("[[A]] [[C]]", encoding="utf-8")
+        (temp_vault / "C.md").write_text("", encoding="utf-8")
+        graph = build_link_graph(str(temp_vault))
+
+        assert parsed == ["B.md"]
+        assert graph["A.md"]["outlinks"] == ["B.md"]
+        assert set(graph["B.md"]["outlinks"]) == {"A.md", "C.md"}
+
+    def test_edited_notes_patch_cached_graph(self, temp_vault):
+        """Test that editing notes updates the cached graph to match a full rebuild."""
+        import src.tools.links as links_module
+
+        (temp_vault / "A.md").write_text("[[B]] [[Missing]]", encoding="utf-8")
+        (temp_vault / "B.md").write_text("[[A]]", encoding="utf-8")
+        (temp_vault / "C.md").write_text("", encoding="utf-8")
+        graph = build_link_graph(str(temp_vault))
+        before = copy.deepcopy(graph)
+
+        (temp_vault / "A.md").write_text("[[C]] ![[C]] [[Gone]] [[Lost]]", encoding="utf-8")
+        (temp_vault / "B.md").write_text("No links any more", encoding="utf-8")
+        patched = build_link_graph(str(temp_vault))
+        patched_health = analyze_link_health(str(temp_vault))
+
+        links_module._GRAPH_CACHE.clear()
+        rebuilt = build_link_graph(str(temp_vault))
+
+        assert graph == before
+        assert patched == rebuilt
+        assert patched["A.md"]["outlinks"] == ["C.md"]
+        assert patched["A.md"]["inlinks"] == []
+        assert patched_health == analyze_link_health(str(temp_vault))
+        assert patched_health["broken_links_count"] == 2
+
+    def test_build_large_graph_in_parallel(self, temp_vault):
+        """Test that a vault above the parallel threshold builds the same chain graph."""
+        for i in range(100):
+            (temp_vault / f"n{i}.md").write_text(f"[[n{(i + 1) % 100}]]", encoding="utf-8")
+
+        graph = build_link_graph(str(temp_vault))
+
+        for i in range(100):
+            assert graph[f"n{i}.md"]["outlinks"] == [f"n{(i + 1) % 100}.md"]
+            assert graph[f"n{i}.md"]["inlinks"] == [f"n{(i - 1) % 100}.md"]
+
 
 class TestFindOrphanedNotes:
     """Tests for find_orphaned_notes function."""
@@ -229,6 +341,19 @@ class TestAnalyzeLinkHealth:
 
         assert health["broken_links_count"] >= 1
 
+    def test_resolve_paths_and_case_insensitive_names(self, temp_vault):
+        """Test that folder paths and differently cased names are not broken links."""
+        (temp_vault / "folder").mkdir()
+        (temp_vault / "folder" / "Deep.md").write_text("", encoding="utf-8")
+        (temp_vault / "A.md").write_text("[[folder/Deep]] [[b]] [[Missing]]", encoding="utf-8")
+        (temp_vault / "B.md").write_text("", encoding="utf-8")
+
+        health = analyze_link_health(str(temp_vault))
+        graph = build_link_graph(str(temp_vault))
+
+        assert health["broken_links_count"] == 1
+        assert set(graph["A.md"]["outlinks"]) == {str(Path("folder") / "Deep.md"), "B.md"}
+
 
 class TestGetNoteConnections:
     """Tests for get_note_connections function."""
@@ -247,6 +372,24 @@ class TestGetNoteConnections:
         assert "B.md" in connections["direct_outlinks"]
         assert "C.md" in connections["direct_outlinks"]
 
+    def test_earlier_results_unchanged_by_edits(self, temp_vault):
+        """Test that editing a note doesn't change results already returned."""
+        (temp_vault / "A.md").write_text("[[B]]", encoding="utf-8")
+        (temp_vault / "B.md").write_text("[[A]] [[C]] [[D]] [[E]] [[F]]", encoding="utf-8")
+        for name in "CDEF":
+            (temp_vault / f"{name}.md").write_text("", encoding="utf-8")
+
+        connections = get_note_connections(str(temp_vault), "A", depth=2)
+        hubs = find_hub_notes(str(temp_vault))
+        before = copy.deepcopy((connections, hubs))
+
+        (temp_vault / "B.md").write_text("[[C]] [[D]] [[E]] [[F]] [[G]]", encoding="utf-8")
+        (temp_vault / "A.md").write_text("[[C]] [[B]]", encoding="utf-8")
+        get_note_connections(str(temp_vault), "A", depth=2)
+        find_hub_notes(str(temp_vault))
+
+        assert (connections, hubs) == before
+
     def test_get_second_degree_connections(self, temp_vault):
         """Test getting second-degree (depth=2) connections."""
         (temp_vault / "A.md").write_text("[[B]]", encoding="utf-8")
@@ -262,74 +405,73 @@ class TestGetNoteConnections:
         assert connections["connections"]["B.md"]["depth"] == 1
         assert connections["connections"]["C.md"]["depth"] == 2
 
+    def test_connections_use_shortest_depth(self, temp_vault):
+        """Test that a note reachable at several depths is reported at the shortest."""
+        (temp_vault / "A.md").write_text("[[B]] [[C]]", encoding="utf-8")
+        (temp_vault / "B.md").write_text("[[C]]", encoding="utf-8")
+        (temp_vault / "C.md").write_text("[[D]]", encoding="utf-8")
+        (temp_vault / "D.md").write_text("", encoding="utf-8")
+
+        connections = get_note_connections(str(temp_vault), "A", depth=2)["connections"]
+
+        assert connections["C.md"]["depth"] == 1
+        assert connections["D.md"]["depth"] == 2
+
     def test_note_not_found_raises_error(self, temp_vault):
         """Test that missing note raises error."""
         with pytest.raises(ValueError, match="Note not found"):
             get_note_connections(str(temp_vault), "NonExistent", depth=1)
 
 
+@pytest.mark.xdist_group(name="links")
 class TestToolFunctions:
-    """Integration tests for MCP tool functions."""
+    """Integration tests for MCP tool functions.
+
+    All tools are read-only, so they share the session-scoped link_graph_vault.
+    """
 
     @pytest.mark.asyncio
-    async def test_get_link_graph_fs_tool(self, temp_vault):
+    async def test_get_link_graph_fs_tool(self, link_graph_vault):
         """Test get_link_graph_fs_tool."""
-        (temp_vault / "A.md").write_text("[[B]]", encoding="utf-8")
-        (temp_vault / "B.md").write_text("", encoding="utf-8")
-
-        result = await get_link_graph_fs_tool(vault_path=str(temp_vault))
+        result = await get_link_graph_fs_tool(vault_path=link_graph_vault)
 
-        assert result["total_notes"] == 2
+        assert result["total_notes"] == 7
         assert "A.md" in result["graph"]
         assert "B.md" in result["graph"]["A.md"]["outlinks"]
 
     @pytest.mark.asyncio
-    async def test_find_orphaned_notes_fs_tool(self, temp_vault):
+    async def test_find_orphaned_notes_fs_tool(self, link_graph_vault):
         """Test find_orphaned_notes_fs_tool."""
-        (temp_vault / "A.md").write_text("[[B]]", encoding="utf-8")
-        (temp_vault / "B.md").write_text("", encoding="utf-8")
-        (temp_vault / "orphan.md").write_text("No links", encoding="utf-8")
-
-        result = await find_orphaned_notes_fs_tool(vault_path=str(temp_vault))
+        result = await find_orphaned_notes_fs_tool(vault_path=link_graph_vault)
 
         assert result["orphaned_count"] == 1
         assert any(o["file_path"] == "orphan.md" for o in result["orphaned_notes"])
 
     @pytest.mark.asyncio
-    async def test_find_hub_notes_fs_tool(self, temp_vault):
+    async def test_find_hub_notes_fs_tool(self, link_graph_vault):
         """Test find_hub_notes_fs_tool."""
-        (temp_vault / "hub.md").write_text("[[A]] [[B]] [[C]] [[D]] [[E]]", encoding="utf-8")
-        for name in ["A", "B", "C", "D", "E"]:
-            (temp_vault / f"{name}.md").write_text("", encoding="utf-8")
-
-        result = await find_hub_notes_fs_tool(min_outlinks=5, vault_path=str(temp_vault))
+        result = await find_hub_notes_fs_tool(min_outlinks=5, vault_path=link_graph_vault)
 
         assert result["hub_count"] == 1
         assert result["hubs"][0]["file_path"] == "hub.md"
 
     @pytest.mark.asyncio
-    async def test_analyze_link_health_fs_tool(self, temp_vault):
+    async def test_analyze_link_health_fs_tool(self, link_graph_vault):
         """Test analyze_link_health_fs_tool."""
-        (temp_vault / "A.md").write_text("[[B]]", encoding="utf-8")
-        (temp_vault / "B.md").write_text("", encoding="utf-8")
+        result = await analyze_link_health_fs_tool(vault_path=link_graph_vault)
 
-        result = await analyze_link_health_fs_tool(vault_path=str(temp_vault))
-
-        assert result["total_notes"] == 2
-        assert result["total_links"] == 1
+        assert result["total_notes"] == 7
+        assert result["total_links"] == 7
+        assert result["broken_links_count"] == 0
         assert "link_density_score" in result
 
     @pytest.mark.asyncio
-    async def test_get_note_connections_fs_tool(self, temp_vault):
+    async def test_get_note_connections_fs_tool(self, link_graph_vault):
         """Test get_note_connections_fs_tool."""
-        (temp_vault / "A.md").write_text("[[B]]", encoding="utf-8")
-        (temp_vault / "B.md").write_text("[[C]]", encoding="utf-8")
-        (temp_vault / "C.md").write_text("", encoding="utf-8")
-
         result = await get_note_connections_fs_tool(
             note_name="A",
             depth=2,
-            vault_path=str(temp_vault)
+            vault_path=link_graph_vault
         )
 
         assert result["note"] == "A.md"
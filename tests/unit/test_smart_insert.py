@@ -14,6 +14,7 @@ from src.tools.smart_insert import (
     insert_after_heading,
     insert_after_block,
     update_frontmatter_field,
+    update_frontmatter_fields,
     append_to_note
 )
 
@@ -526,6 +527,120 @@ Note content here.
         assert "# Content" in content
         assert "Note content here." in content
 
+    def test_body_preserved_byte_for_byte(self, temp_note_with_frontmatter):
+        """Test that only the frontmatter block is rewritten."""
+        with open(temp_note_with_frontmatter, 'r', encoding='utf-8') as f:
+            original_body = f.read().split("---\n", 2)[2]
+
+        # Same-length value (in-place header rewrite) then a longer one (full rewrite)
+        update_frontmatter_field(temp_note_with_frontmatter, "status", "final")
+        update_frontmatter_field(temp_note_with_frontmatter, "status", "published")
+
+        with open(temp_note_with_frontmatter, 'r', encoding='utf-8') as f:
+            content = f.read()
+
+        assert "status: published" in content
+        assert content.split("---\n", 2)[2] == original_body
+
+    def test_crlf_note_keeps_crlf_line_endings(self):
+        """Test that rewritten frontmatter matches a CRLF note's line endings."""
+        body = "\r\n# Content\r\n\r\nNote content here.\r\n"
+        with tempfile.NamedTemporaryFile(mode='wb', suffix='.md', delete=False) as f:
+            f.write(b"---\r\nstatus: draft\r\n---\r\n" + body.encode('utf-8'))
+            temp_path = f.name
+
+        try:
+            # Same-length value (in-place header rewrite) then a longer one (full rewrite)
+            update_frontmatter_field(temp_path, "status", "final")
+            update_frontmatter_field(temp_path, "status", "published")
+
+            with open(temp_path, 'rb') as f:
+                content = f.read().decode('utf-8')
+
+            assert content == "---\r\nstatus: published\r\n---\r\n" + body
+        finally:
+            os.unlink(temp_path)
+
+
+
+class TestUpdateFrontmatterFields:
+    """Test suite for update_frontmatter_fields() function."""
+
+    @pytest.fixture
+    def temp_note(self):
+        """Create note with fields and tags in frontmatter."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.md', delete=False, encoding='utf-8') as f:
+            f.write("""---
+status: draft
+tags: [project, draft]
+---
+
+# Content
+""")
+            temp_path = f.name
+
+        yield temp_path
+
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+
+    def test_fields_and_tags_in_one_call(self, temp_note):
+        """Test combining a field update with tag add/remove."""
+        result = update_frontmatter_fields(
+            temp_note,
+            updates={"status": "done", "priority": 2},
+            tags_add=["archived", "project"],
+            tags_remove=["draft", "missing"]
+        )
+
+        assert result["success"] is True
+        assert result["updated_fields"] == ["status", "priority"]
+        assert result["tags_added"] == ["archived"]
+        assert result["tags_removed"] == ["draft"]
+        assert result["tags"] == ["project", "archived"]
+
+        with open(temp_note, 'r', encoding='utf-8') as f:
+            content = f.read()
+
+        assert "status: done" in content
+        assert "priority: 2" in content
+        assert "draft" not in content
+        assert content.endswith("# Content\n")
+
+    def test_no_changes_leaves_file_untouched(self, temp_note):
+        """Test that a no-op batch does not rewrite the file."""
+        mtime = os.stat(temp_note).st_mtime_ns
+
+        result = update_frontmatter_fields(temp_note, tags_add=["project"], tags_remove=["missing"])
+
+        assert result["tags_added"] == []
+        assert result["tags_removed"] == []
+        assert os.stat(temp_note).st_mtime_ns == mtime
+
+    def test_rewrite_preserves_permissions(self, temp_note):
+        """Test that the atomic rewrite keeps the note's permission bits."""
+        os.chmod(temp_note, 0o640)
+
+        update_frontmatter_fields(temp_note, updates={"summary": "a much longer value than before"})
+
+        assert os.stat(temp_note).st_mode & 0o777 == 0o640
+        assert [f for f in os.listdir(os.path.dirname(temp_note)) if f.endswith('.tmp')] == []
+
+    def test_rewrite_writes_through_symlink(self, temp_note, tmp_path):
+        """Test that rewriting a symlinked note updates its target and keeps the link."""
+        link = tmp_path / "link.md"
+        link.symlink_to(temp_note)
+
+        update_frontmatter_fields(str(link), updates={"status": "done"})
+
+        assert link.is_symlink()
+        with open(temp_note, 'r', encoding='utf-8') as f:
+            assert "status: done" in f.read()
+
+    def test_file_not_found(self):
+        """Test batch update on non-existent file."""
+        with pytest.raises(FileNotFoundError):
+            update_frontmatter_fields("/nonexistent/path.md", updates={"a": 1})
 
 class TestAppendToNote:
     """Test suite for append_to_note() function."""
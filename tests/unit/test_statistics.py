@@ -494,6 +494,23 @@ Six words in this nested note.
         expected_avg = stats["total_words"] / stats["total_notes"]
         assert abs(stats["avg_words_per_note"] - expected_avg) < 0.01
 
+    def test_stats_cache_invalidated_on_change(self, temp_vault):
+        """Test that cached per-note stats are refreshed when a note changes."""
+        first = get_vault_stats(temp_vault)
+        assert os.path.exists(os.path.join(temp_vault, ".obsidian", "mcp_cache", "stats_cache.json"))
+
+        # Cached run returns identical results
+        assert get_vault_stats(temp_vault) == first
+
+        with open(os.path.join(temp_vault, "note3.md"), 'a', encoding='utf-8') as f:
+            f.write("\nNow with #tag6 and [[link4]].\n")
+        os.remove(os.path.join(temp_vault, "subfolder", "note4.md"))
+
+        stats = get_vault_stats(temp_vault)
+        assert stats["total_notes"] == 3
+        assert "tag6" in stats["all_tags"]
+        assert "tag5" not in stats["all_tags"]
+
     def test_empty_vault(self, temp_vault_empty):
         """Test statistics on empty vault."""
         stats = get_vault_stats(temp_vault_empty)
@@ -506,7 +523,7 @@ Six words in this nested note.
         assert stats["avg_words_per_note"] == 0.0
 
     def test_obsidian_directory_ignored(self):
-        """Test that .obsidian directory is excluded from stats."""
+        """Test that .obsidian and non-.md files are excluded from stats."""
         vault_dir = tempfile.mkdtemp()
 
         try:
@@ -520,6 +537,10 @@ Six words in this nested note.
             with open(os.path.join(obsidian_dir, "config.md"), 'w', encoding='utf-8') as f:
                 f.write("# Config\n\nThis should not be counted.")
 
+            # Only .md files are notes
+            with open(os.path.join(vault_dir, "readme.markdown"), 'w', encoding='utf-8') as f:
+                f.write("# Readme\n\nNot a note either.")
+
             stats = get_vault_stats(vault_dir)
 
             # Should only count the regular note
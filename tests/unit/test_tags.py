@@ -142,6 +142,18 @@ Tags: #project/active #project/planning/meeting #status/in-progress"""
         assert "project/planning/meeting" in result["inline_tags"]
         assert "status/in-progress" in result["inline_tags"]
 
+    def test_extract_from_bytes(self):
+        """Test that raw UTF-8 bytes give the same result as decoded text."""
+        content = """---
+tags: [projekt, café]
+---
+
+# Überblick
+
+Notes with #inline and #nested/tag."""
+
+        assert extract_all_tags(content.encode('utf-8')) == extract_all_tags(content)
+
     def test_tags_in_code_blocks_ignored(self):
         """Test that tags inside code blocks are NOT extracted."""
         content = """# Note
@@ -289,6 +301,37 @@ tags: [project, active, planning, test]
         assert result["success"] is True or result["success"] is False
         assert "not found" in result["message"].lower() or "removed" in result["message"].lower()
 
+    def test_noop_calls_do_not_rewrite_file(self, temp_note_with_tags):
+        """Test that removing an absent tag or re-adding a present one is a no-op."""
+        mtime = os.stat(temp_note_with_tags).st_mtime_ns
+
+        removed = remove_tag_from_frontmatter(temp_note_with_tags, "nonexistent")
+        added = add_tag_to_frontmatter(temp_note_with_tags, "planning")
+
+        assert "not found" in removed["message"].lower()
+        assert "already" in added["message"].lower()
+        assert os.stat(temp_note_with_tags).st_mtime_ns == mtime
+
+    def test_remove_escaped_and_quoted_tags(self):
+        """Test removing tags that YAML spells with escapes or quote doubling."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.md', delete=False, encoding='utf-8') as f:
+            f.write('---\ntags: ["caf\\u00e9", \'it\'\'s\', keep]\n---\n\n# Note')
+            temp_path = f.name
+
+        try:
+            first = remove_tag_from_frontmatter(temp_path, "café")
+            second = remove_tag_from_frontmatter(temp_path, "it's")
+
+            assert "removed" in first["message"].lower()
+            assert "removed" in second["message"].lower()
+
+            with open(temp_path, 'r', encoding='utf-8') as f:
+                tags = extract_all_tags(f.read())
+            assert tags["frontmatter_tags"] == ["keep"]
+
+        finally:
+            os.unlink(temp_path)
+
     def test_remove_last_tag(self):
         """Test removing the only tag in frontmatter."""
         with tempfile.NamedTemporaryFile(mode='w', suffix='.md', delete=False) as f:
@@ -447,3 +490,26 @@ Has #project tag.""")
         # Should not include .obsidian files
         for note in result:
             assert ".obsidian" not in note["file"]
+
+    def test_index_picks_up_changes(self, sample_vault):
+        """Test that the persisted tag index is refreshed on file changes."""
+        vault_path = Path(sample_vault)
+        assert find_notes_by_tag(sample_vault, "fresh") == []
+        assert (vault_path / ".obsidian" / "mcp_cache" / "tags_index.json").exists()
+
+        # New note, modified note and deleted note
+        (vault_path / "new.md").write_text("# New\n\n#fresh")
+        (vault_path / "note4.md").write_text("# Note 4\n\nNow #fresh, longer content.")
+        (vault_path / "note1.md").unlink()
+
+        files = {n["file"] for n in find_notes_by_tag(sample_vault, "fresh")}
+        assert files == {"new.md", "note4.md"}
+        assert not any(n["file"] == "note1.md" for n in find_notes_by_tag(sample_vault, "active"))
+
+    def test_vault_root_with_trailing_separators(self, sample_vault):
+        """Test that relative paths don't depend on how the vault root is written."""
+        expected = {n["file"] for n in find_notes_by_tag(sample_vault, "project")}
+        doubled = sample_vault.rstrip(os.sep) + os.sep + os.sep
+
+        assert expected
+        assert {n["file"] for n in find_notes_by_tag(doubled, "project")} == expected
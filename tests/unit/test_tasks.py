@@ -79,6 +79,17 @@ class TestParseTaskLine:
         assert task.priority == "highest"
         assert task.recurrence == "every week"
 
+    def test_parse_task_dates_in_any_order(self):
+        """Test that date fields are extracted regardless of their order."""
+        line = "- [x] Shipped ✅ 2025-10-31 ➕ 2025-10-01 📅 2025-10-30"
+        task = parse_task_line(line, 1, "test.md")
+
+        assert task is not None
+        assert task.content == "Shipped"
+        assert task.done_date == date(2025, 10, 31)
+        assert task.created_date == date(2025, 10, 1)
+        assert task.due_date == date(2025, 10, 30)
+
     def test_parse_task_with_tags(self):
         """Test parsing task with tags."""
         line = "- [ ] Task with #project #urgent tags 📅 2025-10-30"
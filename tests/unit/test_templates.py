@@ -0,0 +1,180 @@
+"""Unit tests for filesystem-native template tools."""
+
+import os
+import pytest
+from datetime import datetime
+
+from src.tools.templates import (
+    expand_template_variables,
+    read_template,
+    write_from_template,
+    expand_template_fs_tool,
+    create_note_from_template_fs_tool,
+    list_templates_fs_tool,
+)
+
+
+class TestExpandTemplateVariables:
+    """Tests for expand_template_variables function."""
+
+    def test_expand_user_variable(self):
+        """Test simple variable substitution."""
+        assert expand_template_variables("Hello {{name}}!", {"name": "World"}) == "Hello World!"
+
+    def test_whitespace_inside_braces(self):
+        """Test that whitespace around the variable name is ignored."""
+        assert expand_template_variables("Hello {{ name }}!", {"name": "World"}) == "Hello World!"
+
+    def test_unknown_variable_preserved(self):
+        """Test that unknown placeholders are left untouched."""
+        content = "Keep {{unknown}} and {{ }} as-is"
+        assert expand_template_variables(content, {"name": "World"}) == content
+
+    def test_builtin_date_variables(self):
+        """Test built-in date variables."""
+        today = datetime.now().strftime("%Y-%m-%d")
+        result = expand_template_variables("{{date}} {{year}}")
+        assert result.startswith(today)
+        assert result.endswith(today[:4])
+
+    def test_title_from_filename(self):
+        """Test {{title}} is derived from filename."""
+        assert expand_template_variables("# {{title}}", filename="Daily/My Note.md") == "# My Note"
+
+    def test_user_variables_override_builtins(self):
+        """Test user variables take precedence over built-ins."""
+        assert expand_template_variables("{{date}}", {"date": "custom"}) == "custom"
+
+    def test_values_are_not_re_expanded(self):
+        """Test that placeholders inside substituted values are kept literally."""
+        result = expand_template_variables(
+            "{{a}} {{ b }} {{a}}", {"a": "{{b}}", "b": "B"}
+        )
+        assert result == "{{b}} B {{b}}"
+
+    def test_many_placeholders(self):
+        """Test expansion with more distinct placeholders than the fast path handles."""
+        variables = {f"v{i}": str(i) for i in range(12)}
+        content = " ".join(f"{{{{ v{i} }}}}" for i in range(12)) + " {{missing}}"
+        expected = " ".join(str(i) for i in range(12)) + " {{missing}}"
+        assert expand_template_variables(content, variables) == expected
+
+    def test_no_placeholders(self):
+        """Test content without placeholders is returned unchanged."""
+        assert expand_template_variables("Static boilerplate") == "Static boilerplate"
+
+
+class TestTemplateFiles:
+    """Tests for reading and writing templates."""
+
+    def test_read_template_not_found(self, temp_vault):
+        """Test reading a missing template raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            read_template(str(temp_vault / "templates" / "missing.md"))
+
+    def test_read_template_cache_invalidated_on_change(self, temp_vault):
+        """Test that cached template content is refreshed when the file changes."""
+        template = temp_vault / "templates" / "cached.md"
+        template.write_text("v1", encoding="utf-8")
+        assert read_template(str(template)) == "v1"
+
+        template.write_text("version 2", encoding="utf-8")
+        assert read_template(str(template)) == "version 2"
+
+    def test_write_from_template(self, temp_vault):
+        """Test creating a file from a template."""
+        template = temp_vault / "templates" / "meeting.md"
+        template.write_text("# {{title}}\n\nAttendees: {{who}}\n", encoding="utf-8")
+        target = temp_vault / "meetings" / "Standup.md"
+
+        write_from_template(str(template), str(target), {"who": "Team"})
+
+        assert target.read_text(encoding="utf-8") == "# Standup\n\nAttendees: Team\n"
+
+    def test_write_from_template_target_exists(self, temp_vault):
+        """Test that existing targets are never overwritten."""
+        template = temp_vault / "templates" / "meeting.md"
+        template.write_text("# {{title}}", encoding="utf-8")
+
+        with pytest.raises(FileExistsError):
+            write_from_template(str(template), str(temp_vault / "notes" / "test-note.md"))
+
+    def test_write_from_template_leaves_no_temp_files(self, temp_vault):
+        """Test that atomic creation cleans up its staging file."""
+        template = temp_vault / "templates" / "meeting.md"
+        template.write_text("# {{title}}", encoding="utf-8")
+        existing = temp_vault / "notes" / "test-note.md"
+        original = existing.read_text(encoding="utf-8")
+
+        write_from_template(str(template), str(temp_vault / "notes" / "fresh.md"))
+        with pytest.raises(FileExistsError):
+            write_from_template(str(template), str(existing))
+
+        assert existing.read_text(encoding="utf-8") == original
+        assert not [p.name for p in (temp_vault / "notes").iterdir() if p.name.endswith(".tmp")]
+
+    def test_write_from_template_honours_umask(self, temp_vault):
+        """Test that created notes get the permissions the process umask allows."""
+        template = temp_vault / "templates" / "meeting.md"
+        template.write_text("# {{title}}", encoding="utf-8")
+        target = temp_vault / "notes" / "private.md"
+
+        previous = os.umask(0o027)
+        try:
+            write_from_template(str(template), str(target))
+        finally:
+            os.umask(previous)
+
+        assert os.stat(target).st_mode & 0o777 == 0o640
+
+
+class TestToolFunctions:
+    """Tests for template MCP tool functions."""
+
+    @pytest.mark.asyncio
+    async def test_expand_template_fs_tool(self, temp_vault):
+        """Test expanding a template from the vault."""
+        (temp_vault / "templates" / "greet.md").write_text("Hi {{name}}", encoding="utf-8")
+
+        result = await expand_template_fs_tool(
+            "templates/greet.md", {"name": "Ada"}, vault_path=str(temp_vault)
+        )
+
+        assert result["expanded_content"] == "Hi Ada"
+        assert result["variables_used"] == ["name"]
+
+    @pytest.mark.asyncio
+    async def test_create_note_from_template_fs_tool(self, temp_vault):
+        """Test creating a note from a template returns its content."""
+        (temp_vault / "templates" / "greet.md").write_text("Hi {{name}}", encoding="utf-8")
+
+        result = await create_note_from_template_fs_tool(
+            "templates/greet.md", "notes/new.md", {"name": "Ada"}, vault_path=str(temp_vault)
+        )
+
+        assert result["success"] is True
+        assert result["created_content"] == "Hi Ada"
+        assert (temp_vault / "notes" / "new.md").read_text(encoding="utf-8") == "Hi Ada"
+
+    @pytest.mark.asyncio
+    async def test_list_templates_fs_tool(self, temp_vault):
+        """Test listing templates with metadata."""
+        (temp_vault / "templates" / "a.md").write_text("# Template A\nBody", encoding="utf-8")
+        (temp_vault / "templates" / "sub").mkdir()
+        (temp_vault / "templates" / "sub" / "b.md").write_text("# Template B", encoding="utf-8")
+        (temp_vault / "templates" / "notes.txt").write_text("ignored", encoding="utf-8")
+        (temp_vault / "templates" / "c.markdown").write_text("ignored", encoding="utf-8")
+
+        result = await list_templates_fs_tool("templates", vault_path=str(temp_vault))
+
+        assert result["template_count"] == 2
+        by_name = {t["name"]: t for t in result["templates"]}
+        assert by_name["a.md"]["first_line"] == "# Template A"
+        assert by_name["b.md"]["path"] == "templates/sub/b.md"
+        assert "T" in by_name["a.md"]["modified"]
+
+    @pytest.mark.asyncio
+    async def test_list_templates_missing_folder(self, temp_vault):
+        """Test listing from a missing folder raises ValueError."""
+        with pytest.raises(ValueError):
+            await list_templates_fs_tool("nope", vault_path=str(temp_vault))
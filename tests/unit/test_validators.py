@@ -0,0 +1,65 @@
+"""Unit tests for path validation utilities."""
+
+import os
+
+import pytest
+
+from src.utils.validators import validate_note_path, resolve_vault_path
+
+
+class TestValidateNotePath:
+    """Tests for validate_note_path function."""
+
+    def test_valid_paths(self):
+        """Test that ordinary note paths are accepted."""
+        assert validate_note_path("Daily/2024-01-15.md") == (True, None)
+        assert validate_note_path("Projects/My Project.markdown") == (True, None)
+
+    @pytest.mark.parametrize("path", [
+        "",
+        "note.txt",
+        "/absolute.md",
+        "../escape.md",
+        "folder/../note.md",
+        "what?.md",
+        'quote".md',
+        "tab\there.md",
+    ])
+    def test_invalid_paths(self, path):
+        """Test that traversal, bad extensions and invalid characters are rejected."""
+        is_valid, error = validate_note_path(path)
+        assert is_valid is False
+        assert error
+
+
+class TestResolveVaultPath:
+    """Tests for resolve_vault_path function."""
+
+    def test_resolves_inside_vault(self, temp_vault):
+        """Test that relative note paths resolve under the vault root."""
+        result = resolve_vault_path(str(temp_vault), "notes/daily")
+        assert result == os.path.join(str(temp_vault), "notes", "daily.md")
+
+    def test_rejects_traversal(self, temp_vault):
+        """Test that paths escaping the vault raise ValueError."""
+        with pytest.raises(ValueError):
+            resolve_vault_path(str(temp_vault), "../outside.md")
+
+    def test_rejects_sibling_with_shared_prefix(self, temp_vault):
+        """Test that a sibling folder sharing the vault's name prefix is rejected."""
+        vault_name = os.path.basename(str(temp_vault))
+        with pytest.raises(ValueError):
+            resolve_vault_path(str(temp_vault), f"../{vault_name}_evil/note.md")
+
+    def test_relative_root_follows_working_directory(self, tmp_path, monkeypatch):
+        """Test that a relative vault root is resolved against the current directory each time."""
+        (tmp_path / "a" / "vault").mkdir(parents=True)
+        (tmp_path / "b" / "vault").mkdir(parents=True)
+
+        monkeypatch.chdir(tmp_path / "a")
+        first = resolve_vault_path("vault", "note.md")
+        monkeypatch.chdir(tmp_path / "b")
+        second = resolve_vault_path("vault", "note.md")
+
+        assert first == os.path.join(str(tmp_path), "a", "vault", "note.md")
+        assert second == os.path.join(str(tmp_path), "b", "vault", "note.md")